@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -10,6 +11,10 @@ from infrastructure.db import Base
 
 from infrastructure.orm.user_orm_model import Base
 from infrastructure.orm.comment_orm_model import Base
+from infrastructure.orm.role_orm_model import Base
+from infrastructure.orm.archive_orm_model import Base
+from infrastructure.orm.comment_stats_orm_model import Base
+from infrastructure.orm.write_version_orm_model import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -26,6 +31,17 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Partitions of comments are created by ensure_comment_partitions() at run
+# time, not by migrations, and are not mapped.
+COMMENT_PARTITION = re.compile(r"^comments_(legacy|default|p\d{4}_\d{2})$")
+
+
+def include_name(name, type_, parent_names):
+    if type_ == "table":
+        return COMMENT_PARTITION.match(name) is None
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -50,6 +66,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -69,11 +86,14 @@ def run_migrations_online() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Same session time zone as the application, see infrastructure.db.session
+        connect_args={"options": "-c timezone=UTC"},
     )
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_name=include_name
         )
 
         with context.begin_transaction():
@@ -0,0 +1,44 @@
+"""add_soft_delete_partial_indexes
+
+Revision ID: 20261017091500
+Revises: 20261017090000
+Create Date: 2026-10-17 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017091500'
+down_revision: Union[str, None] = '20261017090000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and does not
+    # block writes to the comments table while the index is built
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_live_created_at_id', 'comments', ['created_at', 'id'], unique=False,
+            postgresql_where=sa.text('is_deleted = false'), postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_comments_live_user_id_created_at_id', 'comments', ['user_id', 'created_at', 'id'], unique=False,
+            postgresql_where=sa.text('is_deleted = false'), postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_live_user_id_created_at_id', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_comments_live_created_at_id', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
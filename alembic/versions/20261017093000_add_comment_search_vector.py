@@ -0,0 +1,47 @@
+"""add_comment_search_vector
+
+Revision ID: 20261017093000
+Revises: 20261017091500
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017093000'
+down_revision: Union[str, None] = '20261017091500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A stored generated column rewrites the table once under an exclusive
+    # lock; after that Postgres keeps it in step with name and description
+    op.add_column('comments', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_live_search_vector', 'comments', ['search_vector'], unique=False,
+            postgresql_using='gin', postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_live_search_vector', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column('comments', 'search_vector')
@@ -0,0 +1,43 @@
+"""add_comment_updated_at_indexes
+
+Revision ID: 20261017094500
+Revises: 20261017093000
+Create Date: 2026-10-17 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017094500'
+down_revision: Union[str, None] = '20261017093000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serve max(updated_at) for the comment list ETags from the end of an index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_updated_at_id', 'comments', ['updated_at', 'id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_comments_user_id_updated_at', 'comments', ['user_id', 'updated_at'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_user_id_updated_at', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_comments_updated_at_id', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,62 @@
+"""add_comment_change_notify_trigger
+
+Revision ID: 20261017100000
+Revises: 20261017094500
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017100000'
+down_revision: Union[str, None] = '20261017094500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Publish a compact event for every comment change. NOTIFY is delivered on
+    # commit only, and a soft delete is reported as a delete.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_comment_change() RETURNS trigger AS $$
+        DECLARE
+            changed comments%ROWTYPE;
+            change_op text;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+                change_op := 'delete';
+            ELSE
+                changed := NEW;
+                IF TG_OP = 'INSERT' THEN
+                    change_op := 'insert';
+                ELSIF NEW.is_deleted AND NOT coalesce(OLD.is_deleted, false) THEN
+                    change_op := 'delete';
+                ELSE
+                    change_op := 'update';
+                END IF;
+            END IF;
+            PERFORM pg_notify('comment_changes', json_build_object(
+                'op', change_op,
+                'id', changed.id,
+                'user_id', changed.user_id,
+                'updated_at', changed.updated_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON comments
+        FOR EACH ROW EXECUTE FUNCTION notify_comment_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS comments_notify_change ON comments")
+    op.execute("DROP FUNCTION IF EXISTS notify_comment_change()")
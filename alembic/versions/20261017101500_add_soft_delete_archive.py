@@ -0,0 +1,117 @@
+"""add_soft_delete_archive
+
+Revision ID: 20261017101500
+Revises: 20261017100000
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017101500'
+down_revision: Union[str, None] = '20261017100000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFY_COMMENT_CHANGE = """
+    CREATE OR REPLACE FUNCTION notify_comment_change() RETURNS trigger AS $$
+    DECLARE
+        changed comments%ROWTYPE;
+        change_op text;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            {purge_check}
+            changed := OLD;
+            change_op := 'delete';
+        ELSE
+            changed := NEW;
+            IF TG_OP = 'INSERT' THEN
+                change_op := 'insert';
+            ELSIF NEW.is_deleted AND NOT coalesce(OLD.is_deleted, false) THEN
+                change_op := 'delete';
+            ELSE
+                change_op := 'update';
+            END IF;
+        END IF;
+        PERFORM pg_notify('comment_changes', json_build_object(
+            'op', change_op,
+            'id', changed.id,
+            'user_id', changed.user_id,
+            'updated_at', changed.updated_at
+        )::text);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+# Purging a soft-deleted comment is not a change anyone can see; it was
+# announced as a delete when it was soft deleted
+PURGE_CHECK = """IF OLD.is_deleted THEN
+                RETURN NULL;
+            END IF;"""
+
+
+def upgrade() -> None:
+    op.create_table('comments_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_by', sa.Integer(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.Column('deleted_by', sa.Integer(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('roles_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('permissions', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('updated_by', sa.UUID(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.Column('deleted_by', sa.UUID(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(NOTIFY_COMMENT_CHANGE.format(purge_check=PURGE_CHECK))
+
+    # Lets each purge batch read just the next expired rows, without walking
+    # the live rows or the index entries of rows already purged
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comments_deleted_deleted_at_id', 'comments', ['deleted_at', 'id'], unique=False,
+            postgresql_where=sa.text('is_deleted = true'), postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_roles_deleted_deleted_at_id', 'roles', ['deleted_at', 'id'], unique=False,
+            postgresql_where=sa.text('is_deleted = true'), postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_roles_deleted_deleted_at_id', table_name='roles',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_comments_deleted_deleted_at_id', table_name='comments',
+            postgresql_concurrently=True, if_exists=True
+        )
+    op.execute(NOTIFY_COMMENT_CHANGE.format(purge_check=""))
+    op.drop_table('roles_archive')
+    op.drop_table('comments_archive')
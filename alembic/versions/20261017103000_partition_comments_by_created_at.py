@@ -0,0 +1,186 @@
+"""partition_comments_by_created_at
+
+Revision ID: 20261017103000
+Revises: 20261017101500
+Create Date: 2026-10-17 10:30:00.000000
+
+Turns comments into a table range-partitioned by month on created_at without
+copying rows: the existing table is renamed to comments_legacy and attached as
+the partition holding everything before a cutover at a month boundary. Monthly
+partitions from the cutover on are created by ensure_comment_partitions(),
+which the API also calls on startup and once a day.
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017103000'
+down_revision: Union[str, None] = '20261017101500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LEGACY_CHECK = 'comments_legacy_created_at_check'
+LEGACY_KEY = 'comments_legacy_id_created_at_key'
+
+# Secondary indexes, created on the partitioned parent under the same names the
+# plain table used. The legacy table keeps its copies, renamed, and they are
+# attached to these instead of being rebuilt.
+INDEXES = [
+    ('ix_comments_name', 'btree (name)', None),
+    ('ix_comments_live_created_at_id', 'btree (created_at, id)', 'is_deleted = false'),
+    ('ix_comments_live_user_id_created_at_id', 'btree (user_id, created_at, id)', 'is_deleted = false'),
+    ('ix_comments_live_search_vector', 'gin (search_vector)', 'is_deleted = false'),
+    ('ix_comments_updated_at_id', 'btree (updated_at, id)', None),
+    ('ix_comments_user_id_updated_at', 'btree (user_id, updated_at)', None),
+    ('ix_comments_deleted_deleted_at_id', 'btree (deleted_at, id)', 'is_deleted = true'),
+]
+
+ENSURE_COMMENT_PARTITIONS = """
+    CREATE OR REPLACE FUNCTION ensure_comment_partitions(months_ahead integer DEFAULT 3) RETURNS integer AS $$
+    DECLARE
+        month_start timestamp;
+        partition_name text;
+        created integer := 0;
+    BEGIN
+        -- Every API worker calls this on startup; let one of them do the work
+        PERFORM pg_advisory_xact_lock(hashtext('ensure_comment_partitions'));
+        FOR i IN 0..months_ahead LOOP
+            month_start := date_trunc('month', localtimestamp) + make_interval(months => i);
+            partition_name := 'comments_p' || to_char(month_start, 'YYYY_MM');
+            CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF comments FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_start + interval '1 month'
+                );
+                created := created + 1;
+            EXCEPTION WHEN invalid_object_definition THEN
+                -- The month is still covered by comments_legacy
+                NULL;
+            END;
+        END LOOP;
+        RETURN created;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+NOTIFY_TRIGGER = """
+    CREATE TRIGGER comments_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION notify_comment_change()
+"""
+
+
+def legacy_name(index: str) -> str:
+    return index.replace('ix_comments_', 'ix_comments_legacy_', 1)
+
+
+def upgrade() -> None:
+    # Rows created before the cutover stay where they are. Leave at least a
+    # day before it, so the CHECK below cannot start rejecting new rows while
+    # the migration is still running.
+    now = op.get_bind().execute(sa.text('SELECT localtimestamp')).scalar()
+    cutover = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=32)).replace(day=1)
+    if cutover - now < timedelta(days=1):
+        cutover = (cutover + timedelta(days=32)).replace(day=1)
+    cutover_literal = cutover.strftime('%Y-%m-%d %H:%M:%S')
+
+    # Attaching a partition needs a unique index covering the partition key and
+    # proof that every row fits the range; build both up front without
+    # blocking writes, so the attach itself neither builds nor scans anything
+    with op.get_context().autocommit_block():
+        op.execute(f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {LEGACY_KEY} ON comments (id, created_at)')
+        op.execute(f'ALTER TABLE comments DROP CONSTRAINT IF EXISTS {LEGACY_CHECK}')
+        op.execute(
+            f"ALTER TABLE comments ADD CONSTRAINT {LEGACY_CHECK} "
+            f"CHECK (created_at < '{cutover_literal}') NOT VALID"
+        )
+        op.execute(f'ALTER TABLE comments VALIDATE CONSTRAINT {LEGACY_CHECK}')
+
+    # The trigger is recreated on the parent, which clones it to every partition
+    op.execute('DROP TRIGGER comments_notify_change ON comments')
+    op.execute('ALTER TABLE comments RENAME TO comments_legacy')
+    # A partition's primary key has to include the partition key. Promoting
+    # the prebuilt (id, created_at) index only checks NOT NULL, which holds.
+    op.execute(
+        'ALTER TABLE comments_legacy DROP CONSTRAINT comments_pkey, '
+        f'ADD CONSTRAINT comments_legacy_pkey PRIMARY KEY USING INDEX {LEGACY_KEY}'
+    )
+    op.execute('ALTER TABLE comments_legacy RENAME CONSTRAINT comments_user_id_fkey TO comments_legacy_user_id_fkey')
+    # Covered by the leading column of the new primary key
+    op.execute('DROP INDEX ix_comments_id')
+    for name, _, _ in INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {legacy_name(name)}')
+
+    op.execute("""
+        CREATE TABLE comments (
+            id integer NOT NULL DEFAULT nextval('comments_id_seq'::regclass),
+            name character varying,
+            description text,
+            user_id integer,
+            created_at timestamp without time zone NOT NULL,
+            created_by integer,
+            updated_at timestamp without time zone NOT NULL,
+            updated_by integer,
+            is_deleted boolean,
+            deleted_at timestamp without time zone,
+            deleted_by integer,
+            search_vector tsvector GENERATED ALWAYS AS (
+                to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))
+            ) STORED,
+            CONSTRAINT comments_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT comments_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    # Keep the id sequence alive when comments_legacy is eventually dropped
+    op.execute('ALTER SEQUENCE comments_id_seq OWNED BY comments.id')
+    for name, definition, where in INDEXES:
+        method, columns = definition.split(' ', 1)
+        predicate = f' WHERE {where}' if where else ''
+        op.execute(f'CREATE INDEX {name} ON comments USING {method} {columns}{predicate}')
+
+    op.execute(f"ALTER TABLE comments ATTACH PARTITION comments_legacy FOR VALUES FROM (MINVALUE) TO ('{cutover_literal}')")
+    op.execute(f'ALTER TABLE comments_legacy DROP CONSTRAINT {LEGACY_CHECK}')
+    # Catches rows for months ensure_comment_partitions has not created yet
+    op.execute('CREATE TABLE comments_default PARTITION OF comments DEFAULT')
+
+    op.execute(NOTIFY_TRIGGER.format(table='comments'))
+    op.execute(ENSURE_COMMENT_PARTITIONS)
+    op.execute('SELECT ensure_comment_partitions(3)')
+
+
+def downgrade() -> None:
+    # Fold every other partition back into comments_legacy and make it the
+    # plain comments table again
+    op.execute('DROP FUNCTION IF EXISTS ensure_comment_partitions(integer)')
+    op.execute('ALTER TABLE comments DETACH PARTITION comments_legacy')
+    op.execute('DROP TRIGGER IF EXISTS comments_notify_change ON comments_legacy')
+    op.execute("""
+        INSERT INTO comments_legacy (
+            id, name, description, user_id, created_at, created_by, updated_at, updated_by,
+            is_deleted, deleted_at, deleted_by
+        )
+        SELECT
+            id, name, description, user_id, created_at, created_by, updated_at, updated_by,
+            is_deleted, deleted_at, deleted_by
+        FROM comments
+    """)
+    op.execute('ALTER SEQUENCE comments_id_seq OWNED BY comments_legacy.id')
+    op.execute('DROP TABLE comments')
+
+    op.execute('ALTER TABLE comments_legacy RENAME TO comments')
+    op.execute(
+        'ALTER TABLE comments DROP CONSTRAINT comments_legacy_pkey, '
+        'ADD CONSTRAINT comments_pkey PRIMARY KEY (id)'
+    )
+    op.execute('ALTER TABLE comments RENAME CONSTRAINT comments_legacy_user_id_fkey TO comments_user_id_fkey')
+    op.execute('CREATE INDEX ix_comments_id ON comments (id)')
+    for name, _, _ in INDEXES:
+        op.execute(f'ALTER INDEX {legacy_name(name)} RENAME TO {name}')
+    op.execute(NOTIFY_TRIGGER.format(table='comments'))
@@ -0,0 +1,127 @@
+"""add_comment_stats_rollups
+
+Revision ID: 20261017104500
+Revises: 20261017103000
+Create Date: 2026-10-17 10:45:00.000000
+
+Live comment counts per user and per day, kept current by statement-level
+triggers on comments. Each statement applies its net change through the
+transition tables in one grouped upsert per rollup, so bulk and batched
+inserts cost one counter update per user and day touched, not one per row.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017104500'
+down_revision: Union[str, None] = '20261017103000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UPDATE_COMMENT_STATS = """
+    CREATE OR REPLACE FUNCTION update_comment_stats() RETURNS trigger AS $$
+    DECLARE
+        delta text;
+    BEGIN
+        -- Only live comments are counted. An update counts as removing the old
+        -- row and adding the new one; edits that change neither is_deleted,
+        -- user_id nor the day cancel out and write nothing.
+        IF TG_OP = 'INSERT' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false';
+        ELSIF TG_OP = 'UPDATE' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false '
+                     'UNION ALL '
+                     'SELECT user_id, created_at::date, -1 FROM old_rows WHERE is_deleted = false';
+        ELSE
+            delta := 'SELECT user_id, created_at::date AS day, -1 AS n FROM old_rows WHERE is_deleted = false';
+        END IF;
+
+        -- Keys are upserted in order, so concurrent statements lock counter
+        -- rows in the same order and cannot deadlock on each other
+        EXECUTE format($sql$
+            WITH delta AS (%s),
+            by_user AS (
+                INSERT INTO comment_stats_by_user AS stats (user_id, comment_count)
+                SELECT user_id, sum(n) FROM delta
+                WHERE user_id IS NOT NULL
+                GROUP BY user_id HAVING sum(n) <> 0
+                ORDER BY user_id
+                ON CONFLICT (user_id) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+            )
+            INSERT INTO comment_stats_by_day AS stats (day, comment_count)
+            SELECT day, sum(n) FROM delta
+            GROUP BY day HAVING sum(n) <> 0
+            ORDER BY day
+            ON CONFLICT (day) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+        $sql$, delta);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+REBUILD_COMMENT_STATS = """
+    CREATE OR REPLACE FUNCTION rebuild_comment_stats() RETURNS void AS $$
+    BEGIN
+        -- Hold off writers while counting, so no change lands between the
+        -- count and the triggers; readers keep seeing the old rollups until
+        -- this commits
+        LOCK TABLE comments IN SHARE MODE;
+        DELETE FROM comment_stats_by_user;
+        DELETE FROM comment_stats_by_day;
+        INSERT INTO comment_stats_by_user (user_id, comment_count)
+        SELECT user_id, count(*) FROM comments
+        WHERE is_deleted = false AND user_id IS NOT NULL
+        GROUP BY user_id;
+        INSERT INTO comment_stats_by_day (day, comment_count)
+        SELECT created_at::date, count(*) FROM comments
+        WHERE is_deleted = false
+        GROUP BY created_at::date;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    ('comments_stats_insert', 'INSERT', 'NEW TABLE AS new_rows'),
+    ('comments_stats_update', 'UPDATE', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('comments_stats_delete', 'DELETE', 'OLD TABLE AS old_rows'),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'comment_stats_by_user',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('comment_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.create_table(
+        'comment_stats_by_day',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('comment_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('day'),
+    )
+    op.execute(UPDATE_COMMENT_STATS)
+    op.execute(REBUILD_COMMENT_STATS)
+    # Transition tables are only allowed on statement-level triggers of a
+    # partitioned table; on the parent they see the rows of every partition
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} AFTER {event} ON comments '
+            f'REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION update_comment_stats()'
+        )
+    # One full count to start from; writes to comments wait until it is done
+    op.execute('SELECT rebuild_comment_stats()')
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON comments')
+    op.execute('DROP FUNCTION IF EXISTS rebuild_comment_stats()')
+    op.execute('DROP FUNCTION IF EXISTS update_comment_stats()')
+    op.drop_table('comment_stats_by_day')
+    op.drop_table('comment_stats_by_user')
@@ -0,0 +1,38 @@
+"""add_role_permissions_gin_index
+
+Revision ID: 20261017110000
+Revises: 20261017104500
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017110000'
+down_revision: Union[str, None] = '20261017104500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Answer "which roles grant these permissions" with the containment (@>)
+    # and any-element (?|) operators. The default jsonb_ops class is needed
+    # for ?|; jsonb_path_ops only supports @>.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_roles_live_permissions', 'roles', ['permissions'], unique=False,
+            postgresql_using='gin', postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_roles_live_permissions', table_name='roles',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,95 @@
+"""skip_comment_months_held_by_default
+
+Revision ID: 20261017111500
+Revises: 20261017110000
+Create Date: 2026-10-17 11:15:00.000000
+
+ensure_comment_partitions() used to stop at the first month whose rows had
+already landed in comments_default: creating that partition fails with a
+check_violation, which aborted the whole call, so no later month was created
+either and every new comment kept falling into the default partition. Such a
+month is now skipped with a warning and the loop goes on; moving its rows out
+is a manual step, described in scripts/manage_comment_partitions.py.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017111500'
+down_revision: Union[str, None] = '20261017110000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENSURE_COMMENT_PARTITIONS = """
+    CREATE OR REPLACE FUNCTION ensure_comment_partitions(months_ahead integer DEFAULT 3) RETURNS integer AS $$
+    DECLARE
+        month_start timestamp;
+        partition_name text;
+        created integer := 0;
+    BEGIN
+        -- Every API worker calls this on startup; let one of them do the work
+        PERFORM pg_advisory_xact_lock(hashtext('ensure_comment_partitions'));
+        FOR i IN 0..months_ahead LOOP
+            month_start := date_trunc('month', localtimestamp) + make_interval(months => i);
+            partition_name := 'comments_p' || to_char(month_start, 'YYYY_MM');
+            CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF comments FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_start + interval '1 month'
+                );
+                created := created + 1;
+            EXCEPTION
+                WHEN invalid_object_definition THEN
+                    -- The month is still covered by comments_legacy
+                    NULL;
+                WHEN check_violation THEN
+                    -- Rows for the month are already in comments_default. Leave
+                    -- them there and carry on with the later months.
+                    RAISE WARNING 'comments_default holds rows for %, not creating %',
+                        to_char(month_start, 'YYYY-MM'), partition_name;
+            END;
+        END LOOP;
+        RETURN created;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+PREVIOUS_ENSURE_COMMENT_PARTITIONS = """
+    CREATE OR REPLACE FUNCTION ensure_comment_partitions(months_ahead integer DEFAULT 3) RETURNS integer AS $$
+    DECLARE
+        month_start timestamp;
+        partition_name text;
+        created integer := 0;
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('ensure_comment_partitions'));
+        FOR i IN 0..months_ahead LOOP
+            month_start := date_trunc('month', localtimestamp) + make_interval(months => i);
+            partition_name := 'comments_p' || to_char(month_start, 'YYYY_MM');
+            CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF comments FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_start + interval '1 month'
+                );
+                created := created + 1;
+            EXCEPTION WHEN invalid_object_definition THEN
+                NULL;
+            END;
+        END LOOP;
+        RETURN created;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_COMMENT_PARTITIONS)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_ENSURE_COMMENT_PARTITIONS)
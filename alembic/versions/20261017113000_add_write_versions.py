@@ -0,0 +1,70 @@
+"""add_write_versions
+
+Revision ID: 20261017113000
+Revises: 20261017111500
+Create Date: 2026-10-17 11:30:00.000000
+
+A write counter per table for the list ETags. Every statement that writes
+comments or users bumps it in the writing transaction, so the new version
+becomes visible exactly when the write does. max(updated_at) could not give
+that: updated_at is the transaction start time, so a slow writer can commit a
+row older than a version a client has already been given.
+
+The counter is spread over shards picked by backend, and a version is the sum
+of a table's shards, so concurrent writers rarely wait on the same row lock.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017113000'
+down_revision: Union[str, None] = '20261017111500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SHARDS = 16
+TABLES = ['comments', 'users']
+
+BUMP_WRITE_VERSION = f"""
+    CREATE OR REPLACE FUNCTION bump_write_version() RETURNS trigger AS $$
+    BEGIN
+        UPDATE write_versions SET version = version + 1
+        WHERE table_name = TG_TABLE_NAME AND shard = pg_backend_pid() % {SHARDS};
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'write_versions',
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('shard', sa.SmallInteger(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('table_name', 'shard'),
+    )
+    for table in TABLES:
+        op.execute(
+            f"INSERT INTO write_versions (table_name, shard) "
+            f"SELECT '{table}', shard FROM generate_series(0, {SHARDS - 1}) AS shard"
+        )
+    op.execute(BUMP_WRITE_VERSION)
+    # Statement level: a bulk insert bumps the counter once, not once per row
+    for table in TABLES:
+        op.execute(
+            f'CREATE TRIGGER {table}_bump_write_version AFTER INSERT OR UPDATE OR DELETE ON {table} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION bump_write_version()'
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_bump_write_version ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS bump_write_version()')
+    op.drop_table('write_versions')
@@ -0,0 +1,135 @@
+"""shard_comment_stats_by_day
+
+Revision ID: 20261017114500
+Revises: 20261017113000
+Create Date: 2026-10-17 11:45:00.000000
+
+Every comment insert upserted today's single row in comment_stats_by_day and
+held its lock until commit, so all concurrent comment writers queued behind
+one another on it. Each day's count is now spread over shards picked by
+backend, like write_versions, and read back as their sum. A shard can go
+negative when a comment is deleted from another backend than the one that
+counted it; only the sum means anything.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017114500'
+down_revision: Union[str, None] = '20261017113000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SHARDS = 16
+
+UPDATE_COMMENT_STATS = f"""
+    CREATE OR REPLACE FUNCTION update_comment_stats() RETURNS trigger AS $$
+    DECLARE
+        delta text;
+    BEGIN
+        -- Only live comments are counted. An update counts as removing the old
+        -- row and adding the new one; edits that change neither is_deleted,
+        -- user_id nor the day cancel out and write nothing.
+        IF TG_OP = 'INSERT' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false';
+        ELSIF TG_OP = 'UPDATE' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false '
+                     'UNION ALL '
+                     'SELECT user_id, created_at::date, -1 FROM old_rows WHERE is_deleted = false';
+        ELSE
+            delta := 'SELECT user_id, created_at::date AS day, -1 AS n FROM old_rows WHERE is_deleted = false';
+        END IF;
+
+        -- Keys are upserted in order, so concurrent statements lock counter
+        -- rows in the same order and cannot deadlock on each other. Day rows
+        -- go to this backend's shard, so writers of the same day rarely meet.
+        EXECUTE format($sql$
+            WITH delta AS (%s),
+            by_user AS (
+                INSERT INTO comment_stats_by_user AS stats (user_id, comment_count)
+                SELECT user_id, sum(n) FROM delta
+                WHERE user_id IS NOT NULL
+                GROUP BY user_id HAVING sum(n) <> 0
+                ORDER BY user_id
+                ON CONFLICT (user_id) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+            )
+            INSERT INTO comment_stats_by_day AS stats (day, shard, comment_count)
+            SELECT day, %s, sum(n) FROM delta
+            GROUP BY day HAVING sum(n) <> 0
+            ORDER BY day
+            ON CONFLICT (day, shard) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+        $sql$, delta, pg_backend_pid() % {SHARDS});
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+PREVIOUS_UPDATE_COMMENT_STATS = """
+    CREATE OR REPLACE FUNCTION update_comment_stats() RETURNS trigger AS $$
+    DECLARE
+        delta text;
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false';
+        ELSIF TG_OP = 'UPDATE' THEN
+            delta := 'SELECT user_id, created_at::date AS day, 1 AS n FROM new_rows WHERE is_deleted = false '
+                     'UNION ALL '
+                     'SELECT user_id, created_at::date, -1 FROM old_rows WHERE is_deleted = false';
+        ELSE
+            delta := 'SELECT user_id, created_at::date AS day, -1 AS n FROM old_rows WHERE is_deleted = false';
+        END IF;
+
+        EXECUTE format($sql$
+            WITH delta AS (%s),
+            by_user AS (
+                INSERT INTO comment_stats_by_user AS stats (user_id, comment_count)
+                SELECT user_id, sum(n) FROM delta
+                WHERE user_id IS NOT NULL
+                GROUP BY user_id HAVING sum(n) <> 0
+                ORDER BY user_id
+                ON CONFLICT (user_id) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+            )
+            INSERT INTO comment_stats_by_day AS stats (day, comment_count)
+            SELECT day, sum(n) FROM delta
+            GROUP BY day HAVING sum(n) <> 0
+            ORDER BY day
+            ON CONFLICT (day) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count
+        $sql$, delta);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # rebuild_comment_stats() inserts without a shard, so its counts land in shard 0
+    op.add_column(
+        'comment_stats_by_day',
+        sa.Column('shard', sa.SmallInteger(), nullable=False, server_default='0'),
+    )
+    op.execute(
+        'ALTER TABLE comment_stats_by_day DROP CONSTRAINT comment_stats_by_day_pkey, '
+        'ADD CONSTRAINT comment_stats_by_day_pkey PRIMARY KEY (day, shard)'
+    )
+    op.execute(UPDATE_COMMENT_STATS)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_UPDATE_COMMENT_STATS)
+    # Fold every day back into one row
+    op.execute(
+        'CREATE TEMPORARY TABLE folded ON COMMIT DROP AS '
+        'SELECT day, sum(comment_count) AS comment_count FROM comment_stats_by_day GROUP BY day'
+    )
+    op.execute('DELETE FROM comment_stats_by_day')
+    op.execute('INSERT INTO comment_stats_by_day (day, shard, comment_count) SELECT day, 0, comment_count FROM folded')
+    op.execute(
+        'ALTER TABLE comment_stats_by_day DROP CONSTRAINT comment_stats_by_day_pkey, '
+        'ADD CONSTRAINT comment_stats_by_day_pkey PRIMARY KEY (day)'
+    )
+    op.drop_column('comment_stats_by_day', 'shard')
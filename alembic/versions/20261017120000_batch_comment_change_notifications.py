@@ -0,0 +1,94 @@
+"""batch_comment_change_notifications
+
+Revision ID: 20261017120000
+Revises: 20261017114500
+Create Date: 2026-10-17 12:00:00.000000
+
+The change feed trigger fired once per row, so a single bulk insert of 1000
+comments sent 1000 notifications and filled every SSE subscriber's queue on
+its own. Statement-level triggers now read the changed rows from transition
+tables and publish them as JSON arrays of up to NOTIFY_BATCH_SIZE events,
+which keeps each payload well under the 8000 byte NOTIFY limit.
+
+Statement-level triggers are not cloned to partitions, so writes made
+directly to a partition, such as moving rows out of comments_default by
+hand, are not announced.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261017120000'
+down_revision: Union[str, None] = '20261017114500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFY_BATCH_SIZE = 50
+
+NOTIFY_COMMENT_CHANGES = f"""
+    CREATE OR REPLACE FUNCTION notify_comment_changes() RETURNS trigger AS $$
+    DECLARE
+        changes text;
+        batch text;
+    BEGIN
+        -- A soft delete is reported as a delete. Purging a soft-deleted
+        -- comment is not reported; it was announced when it was soft deleted.
+        IF TG_OP = 'INSERT' THEN
+            changes := 'SELECT ''insert'' AS op, id, user_id, updated_at FROM new_rows';
+        ELSIF TG_OP = 'UPDATE' THEN
+            changes := 'SELECT CASE WHEN new_rows.is_deleted AND NOT coalesce(old_rows.is_deleted, false) '
+                       'THEN ''delete'' ELSE ''update'' END AS op, '
+                       'new_rows.id, new_rows.user_id, new_rows.updated_at '
+                       'FROM new_rows JOIN old_rows USING (id)';
+        ELSE
+            changes := 'SELECT ''delete'' AS op, id, user_id, updated_at FROM old_rows '
+                       'WHERE NOT coalesce(is_deleted, false)';
+        END IF;
+
+        -- NOTIFY is delivered on commit only
+        FOR batch IN EXECUTE format($sql$
+            SELECT json_agg(json_build_object('op', op, 'id', id, 'user_id', user_id, 'updated_at', updated_at))::text
+            FROM (SELECT *, (row_number() OVER () - 1) / {NOTIFY_BATCH_SIZE} AS chunk FROM (%s) AS changes) AS numbered
+            GROUP BY chunk
+            ORDER BY chunk
+        $sql$, changes)
+        LOOP
+            PERFORM pg_notify('comment_changes', batch);
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    ('comments_notify_insert', 'INSERT', 'NEW TABLE AS new_rows'),
+    ('comments_notify_update', 'UPDATE', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('comments_notify_delete', 'DELETE', 'OLD TABLE AS old_rows'),
+]
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_COMMENT_CHANGES)
+    # Dropping it on the parent drops its clones on every partition too
+    op.execute('DROP TRIGGER IF EXISTS comments_notify_change ON comments')
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} AFTER {event} ON comments '
+            f'REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION notify_comment_changes()'
+        )
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON comments')
+    # notify_comment_change() itself was never dropped
+    op.execute("""
+        CREATE TRIGGER comments_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON comments
+        FOR EACH ROW EXECUTE FUNCTION notify_comment_change()
+    """)
+    op.execute('DROP FUNCTION IF EXISTS notify_comment_changes()')
@@ -0,0 +1,115 @@
+"""
+Compare comment insert throughput with and without write batching.
+
+Runs the same number of concurrent writers in each mode. Direct mode uses
+one session and commit per insert, as POST /api/comments/ does by default.
+Batched mode uses a CommentWriteBatcher, as with COMMENT_WRITE_BATCHING=true.
+Inserted comments are deleted again at the end. Run from the repository root
+against a migrated database:
+
+    PYTHONPATH=src python -m scripts.bench_comment_write_batching --inserts 5000 --concurrency 64
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import delete, event, func, select
+
+from domain.models.comment import Comment
+from infrastructure.db.session import SessionLocal, engine
+from infrastructure.orm.comment_orm_model import CommentOrmModel
+from infrastructure.orm.user_orm_model import UserOrmModel
+from infrastructure.repositories.batching_comment_repository import CommentWriteBatcher
+from infrastructure.repositories.sql_comment_repository import SQLCommentRepository
+
+
+class CommitCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def commit(self, *args: Any) -> None:
+        self.count += 1
+
+
+async def direct_add(comment: Comment) -> None:
+    async with SessionLocal() as session:
+        await SQLCommentRepository(session).add(comment)
+
+
+async def run(
+    add: Callable[[Comment], Awaitable[None]],
+    make: Callable[[int], Comment],
+    inserts: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    next_index = iter(range(inserts))
+
+    async def writer() -> None:
+        for i in next_index:
+            started = time.perf_counter()
+            await add(make(i))
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(writer() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "inserts_per_second": inserts / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main(inserts: int, concurrency: int, max_batch_size: int, max_linger_ms: float) -> None:
+    engine.echo = False
+    counter = CommitCounter()
+    event.listen(engine.sync_engine, "commit", counter.commit)
+
+    async with engine.connect() as connection:
+        user_id = (await connection.execute(select(func.min(UserOrmModel.id)))).scalar()
+
+    if user_id is None:
+        raise SystemExit("Register at least one user first; comments reference users.id")
+
+    marker = f"write batching benchmark {uuid.uuid4()}"
+
+    def make_comment(i: int) -> Comment:
+        return Comment(name=f"benchmark {i}", description=marker, user_id=user_id, created_by=user_id)
+
+    batcher = CommentWriteBatcher(SessionLocal, max_batch_size, max_linger_ms / 1000)
+    modes = [("direct", direct_add), ("batched", batcher.add)]
+
+    # Warm up the pool and statement caches outside the measurement
+    for _, add in modes:
+        await run(add, make_comment, concurrency, concurrency)
+
+    for name, add in modes:
+        counter.count = 0
+        result = await run(add, make_comment, inserts, concurrency)
+        print(
+            f"{name:8} {result['inserts_per_second']:8.0f} inserts/s | "
+            f"p50 {result['p50_ms']:6.2f} ms | p99 {result['p99_ms']:6.2f} ms | "
+            f"{counter.count} commits"
+        )
+
+    await batcher.stop()
+    async with engine.begin() as connection:
+        await connection.execute(delete(CommentOrmModel).where(CommentOrmModel.description == marker))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inserts", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=100)
+    parser.add_argument("--max-linger-ms", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.inserts, args.concurrency, args.max_batch_size, args.max_linger_ms))
@@ -0,0 +1,135 @@
+"""
+Count database round trips and time per insert for the comment and role
+write paths, comparing the old add -> flush -> refresh -> commit sequence
+with the INSERT ... RETURNING implementation.
+
+Comment inserts are committed and deleted again at the end. Run from the
+repository root against a migrated database:
+
+    PYTHONPATH=src python -m scripts.bench_insert_round_trips --iterations 200
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import delete, event, func, inspect, select
+
+from domain.models.comment import Comment
+from domain.models.role import Role
+from infrastructure.db.session import SessionLocal, engine
+from infrastructure.orm.comment_orm_model import CommentOrmModel
+from infrastructure.orm.role_orm_model import RoleORM
+from infrastructure.orm.user_orm_model import UserOrmModel
+from infrastructure.repositories.sql_comment_repository import SQLCommentRepository
+from infrastructure.repositories.sql_role_repository import SQLRoleRepository
+
+
+class RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def statement(self, *args: Any) -> None:
+        self.count += 1
+
+    def commit(self, *args: Any) -> None:
+        self.count += 1
+
+
+async def legacy_comment_add(session: Any, comment: Comment) -> None:
+    orm_comment = CommentOrmModel.from_domain(comment)
+    session.add(orm_comment)
+    await session.flush()
+    await session.refresh(orm_comment)
+    comment.id = orm_comment.id
+    await session.commit()
+
+
+async def comment_add(session: Any, comment: Comment) -> None:
+    await SQLCommentRepository(session).add(comment)
+
+
+async def legacy_role_add(session: Any, role: Role) -> None:
+    role_orm = RoleORM.from_domain(role)
+    role_orm.permissions = [str(permission) for permission in role.permissions]
+    session.add(role_orm)
+    await session.flush()
+    await session.refresh(role_orm)
+
+
+async def role_add(session: Any, role: Role) -> None:
+    await SQLRoleRepository(session).add(role)
+
+
+async def measure(
+    counter: RoundTripCounter,
+    iterations: int,
+    add: Callable[[Any, Any], Awaitable[None]],
+    make: Callable[[int], Any],
+) -> Dict[str, float]:
+    async with SessionLocal() as session:
+        # Warm up the connection and statement cache outside the measurement
+        await add(session, make(-1))
+        await session.rollback()
+
+        counter.count = 0
+        started = time.perf_counter()
+        for i in range(iterations):
+            await add(session, make(i))
+        elapsed = time.perf_counter() - started
+        # Role writes are committed by the caller, so discard them
+        await session.rollback()
+
+    return {
+        "round_trips": counter.count / iterations,
+        "ms_per_insert": elapsed * 1000 / iterations,
+    }
+
+
+async def main(iterations: int) -> None:
+    engine.echo = False
+    counter = RoundTripCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter.statement)
+    event.listen(engine.sync_engine, "commit", counter.commit)
+
+    async with engine.connect() as connection:
+        tables = await connection.run_sync(lambda sync_connection: inspect(sync_connection).get_table_names())
+        user_id = (await connection.execute(select(func.min(UserOrmModel.id)))).scalar()
+
+    if user_id is None:
+        raise SystemExit("Register at least one user first; comments reference users.id")
+
+    marker = f"round trip benchmark {uuid.uuid4()}"
+
+    def make_comment(i: int) -> Comment:
+        return Comment(name=f"benchmark {i}", description=marker, user_id=user_id, created_by=user_id)
+
+    def make_role(i: int) -> Role:
+        return Role(name=f"benchmark {i}", permissions=[])
+
+    cases = [("comment", legacy_comment_add, comment_add, make_comment)]
+    if "roles" in tables:
+        cases.append(("role", legacy_role_add, role_add, make_role))
+    else:
+        print("roles table not found, skipping role inserts")
+
+    for name, legacy, current, make in cases:
+        before = await measure(counter, iterations, legacy, make)
+        after = await measure(counter, iterations, current, make)
+        print(
+            f"{name:8} before: {before['round_trips']:.1f} round trips, {before['ms_per_insert']:.2f} ms/insert | "
+            f"after: {after['round_trips']:.1f} round trips, {after['ms_per_insert']:.2f} ms/insert"
+        )
+
+    async with engine.begin() as connection:
+        await connection.execute(delete(CommentOrmModel).where(CommentOrmModel.description == marker))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,76 @@
+"""
+Register users in bulk from a CSV file (header: username,email,password) or
+an NDJSON file with one {"username", "email", "password"} object per line.
+Passwords are hashed in a process pool across all cores and users are
+inserted in batches; rows that are invalid or whose username or email is
+already taken are skipped and written to the report as NDJSON. Re-running
+after an interruption skips the users already imported. Run from the
+repository root against a migrated database:
+
+    PYTHONPATH=src python -m scripts.import_users users.csv
+    PYTHONPATH=src python -m scripts.import_users users.ndjson --report rejected.ndjson --workers 8
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Optional
+
+from application.use_cases.user_use_cases import UserUseCases
+from config import settings
+from infrastructure.db.session import SessionLocal, engine
+# Registers CommentOrmModel, which UserOrmModel has a relationship to
+import infrastructure.orm.comment_orm_model  # noqa: F401
+from infrastructure.repositories.sql_user_repository import SQLUserRepository
+from utils.password_hasher import PasswordHasher
+from utils.record_reader import RECORD_FORMATS, iter_lines, read_records
+
+CHUNK_SIZE = 1 << 16
+
+
+async def read_chunks(path: str) -> AsyncIterator[bytes]:
+    # Plain blocking reads: the event loop has nothing else to do meanwhile
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def main(path: str, input_format: str, workers: int, batch_size: int, report: Optional[str]) -> None:
+    engine.echo = False
+    password_hasher = PasswordHasher(ProcessPoolExecutor(max_workers=workers), max_concurrency=workers)
+    started = time.monotonic()
+    try:
+        async with SessionLocal() as session:
+            user_use_cases = UserUseCases(SQLUserRepository(session), password_hasher)
+            records = read_records(iter_lines(read_chunks(path)), input_format)
+            result = await user_use_cases.import_users(records, batch_size)
+    finally:
+        password_hasher.shutdown()
+        await engine.dispose()
+
+    output = open(report, "w") if report else sys.stdout
+    try:
+        for error in result.errors:
+            output.write(error.model_dump_json() + "\n")
+    finally:
+        if report:
+            output.close()
+    print(
+        f"imported {result.imported} users, skipped {len(result.errors)} rows "
+        f"in {time.monotonic() - started:.1f} s",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=RECORD_FORMATS, help="defaults to the file extension")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="password hashing processes")
+    parser.add_argument("--batch-size", type=int, default=settings.USER_IMPORT_BATCH_SIZE)
+    parser.add_argument("--report", help="write skipped rows here instead of stdout")
+    args = parser.parse_args()
+    input_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    asyncio.run(main(args.path, input_format, args.workers, args.batch_size, args.report))
@@ -0,0 +1,82 @@
+"""
+Create upcoming monthly partitions of the comments table and drop the ones
+that fell out of the retention window. Dropping a partition removes all of its
+comments, soft deleted or not, without a DELETE and without leaving dead rows
+behind. The API already creates upcoming partitions by itself; run this from
+cron to apply retention. Run from the repository root against a migrated
+database:
+
+    PYTHONPATH=src python -m scripts.manage_comment_partitions --months-ahead 3
+    PYTHONPATH=src python -m scripts.manage_comment_partitions --retention-months 24 --dry-run
+
+If partitions were not created for long enough, comments for a month end up in
+comments_default and that month's partition can no longer be created: the
+database function skips it with a warning ("comments_default holds rows for
+...") and goes on with the later months. Move the rows out by hand, in one
+transaction, off-peak, since ATTACH locks comments_default and builds the
+indexes of the new partition. For November 2026:
+
+    BEGIN;
+    CREATE TABLE comments_p2026_11 (LIKE comments INCLUDING DEFAULTS INCLUDING GENERATED);
+    WITH moved AS (
+        DELETE FROM comments_default
+        WHERE created_at >= '2026-11-01' AND created_at < '2026-12-01'
+        RETURNING id, name, description, user_id, created_at, created_by,
+                  updated_at, updated_by, is_deleted, deleted_at, deleted_by
+    )
+    INSERT INTO comments_p2026_11 (id, name, description, user_id, created_at, created_by,
+                                   updated_at, updated_by, is_deleted, deleted_at, deleted_by)
+    SELECT * FROM moved;
+    ALTER TABLE comments ATTACH PARTITION comments_p2026_11 FOR VALUES FROM ('2026-11-01') TO ('2026-12-01');
+    COMMIT;
+
+The comment statistics, write counter and change feed need no fixing: their
+triggers are statement-level triggers on comments itself and do not fire for
+statements run directly against a partition, so the move is neither counted
+nor announced.
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from infrastructure.db.session import engine
+from infrastructure.maintenance.comment_partitions import CommentPartitionManager
+
+
+def months_before(moment: datetime, months: int) -> datetime:
+    index = moment.year * 12 + moment.month - 1 - months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+async def main(months_ahead: int, retention_months: Optional[int], dry_run: bool) -> None:
+    engine.echo = False
+    manager = CommentPartitionManager(engine)
+
+    if not dry_run:
+        created = await manager.ensure(months_ahead)
+        print(f"created {created} partitions")
+
+    if retention_months is not None:
+        # created_at is stored as naive UTC
+        cutoff = months_before(datetime.utcnow(), retention_months)
+        dropped = await manager.drop_before(cutoff, dry_run=dry_run)
+        action = "would drop" if dry_run else "dropped"
+        print(f"{action} {len(dropped)} partitions before {cutoff:%Y-%m-%d}: {', '.join(dropped) or '-'}")
+
+    for partition in await manager.list():
+        bound = f"< {partition.upper_bound:%Y-%m-%d}" if partition.upper_bound else "default"
+        print(f"{partition.name:20} {bound}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument(
+        "--retention-months", type=int, help="drop partitions holding only comments older than this"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="only list what would be created or dropped")
+    args = parser.parse_args()
+    asyncio.run(main(args.months_ahead, args.retention_months, args.dry_run))
@@ -0,0 +1,66 @@
+"""
+Archive or hard-delete rows that were soft deleted longer ago than the
+retention window, in small batches at a bounded rate so it can run while the
+API is serving traffic. Safe to stop and rerun at any time.
+
+Clients syncing through /api/comments/changes only see a deleted comment's
+tombstone until it is purged, so keep the retention longer than any client
+may stay offline. Run from the repository root against a migrated database:
+
+    PYTHONPATH=src python -m scripts.purge_soft_deleted --retention-days 30
+    PYTHONPATH=src python -m scripts.purge_soft_deleted --tables roles --hard-delete --dry-run
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+from infrastructure.db.session import engine
+from infrastructure.maintenance.soft_delete_purger import PURGE_TARGETS, SoftDeletePurger
+
+
+async def main(
+    tables: List[str],
+    retention_days: float,
+    hard_delete: bool,
+    batch_size: int,
+    rows_per_second: float,
+    dry_run: bool,
+) -> None:
+    engine.echo = False
+    purger = SoftDeletePurger(
+        engine,
+        batch_size=batch_size,
+        rows_per_second=rows_per_second or None,
+        archive=not hard_delete,
+    )
+    # deleted_at is stored as naive UTC
+    deleted_before = datetime.utcnow() - timedelta(days=retention_days)
+    action = "delete" if hard_delete else "archive"
+
+    for table in tables:
+        if dry_run:
+            count = await purger.count(table, deleted_before)
+            print(f"{table:8} would {action} {count} rows deleted before {deleted_before:%Y-%m-%d %H:%M}")
+            continue
+        result = await purger.purge(table, deleted_before)
+        print(
+            f"{table:8} {action}d {result.purged} rows in {result.batches} batches, "
+            f"{result.elapsed_seconds:.1f} s"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", nargs="+", choices=sorted(PURGE_TARGETS), default=sorted(PURGE_TARGETS))
+    parser.add_argument("--retention-days", type=float, default=30)
+    parser.add_argument("--hard-delete", action="store_true", help="delete rows instead of archiving them")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--rows-per-second", type=float, default=1000, help="0 disables throttling")
+    parser.add_argument("--dry-run", action="store_true", help="only count the rows that would be purged")
+    args = parser.parse_args()
+    asyncio.run(main(
+        args.tables, args.retention_days, args.hard_delete, args.batch_size, args.rows_per_second, args.dry_run
+    ))
@@ -0,0 +1,39 @@
+"""
+Compare the per-user and per-day comment counts with a full count over the
+comments table and, unless --check is given, rebuild them from scratch. The
+rollups are kept current by triggers, so drift only appears after changes the
+triggers do not see, such as a TRUNCATE or a restore of some rows. Rebuilding
+holds off writes to comments while it counts. Run from the repository root
+against a migrated database:
+
+    PYTHONPATH=src python -m scripts.rebuild_comment_stats --check
+    PYTHONPATH=src python -m scripts.rebuild_comment_stats
+"""
+import argparse
+import asyncio
+
+from infrastructure.db.session import engine
+from infrastructure.maintenance.comment_stats import CommentStatsReconciler
+
+
+async def main(check: bool) -> None:
+    engine.echo = False
+    reconciler = CommentStatsReconciler(engine)
+
+    drift = await reconciler.drift()
+    for row in drift:
+        print(f"{row.table:22} {str(row.key):12} counted {row.counted:>8} stored {row.stored:>8}")
+    print(f"{len(drift)} rows out of step")
+
+    if not check:
+        await reconciler.rebuild()
+        print("rebuilt comment_stats_by_user and comment_stats_by_day")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="only report rows that are out of step")
+    args = parser.parse_args()
+    asyncio.run(main(args.check))
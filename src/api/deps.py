@@ -1,19 +1,34 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import AsyncGenerator, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Dict, Optional
 from jose import jwt, JWTError, ExpiredSignatureError
 from pydantic import ValidationError
 
 from infrastructure.db.session import SessionLocal
 from application.use_cases.comment_use_cases import CommentUseCases
 from infrastructure.repositories.sql_comment_repository import SQLCommentRepository
+from infrastructure.repositories.cached_comment_repository import CachedCommentRepository
+from infrastructure.repositories.batching_comment_repository import (
+    BatchingCommentRepository,
+    get_comment_write_batcher,
+)
 from application.use_cases.user_use_cases import UserUseCases
 from infrastructure.repositories.sql_user_repository import SQLUserRepository
+from application.use_cases.role_use_cases import RoleUseCases
+from application.services.request_loaders import RequestLoaders
+from application.services.role_permission_resolver import get_role_permission_resolver
+from infrastructure.repositories.sql_role_repository import SQLRoleRepository
 from application.use_cases.auth_use_cases import AuthUseCases
 from infrastructure.repositories.sql_auth_repository import SQLAuthRepository
 from domain.models.auth import TokenPayload
-from utils.security import SECRET_KEY, ALGORITHM
+from domain.repositories.comment_repository import CommentRepository
+from domain.models.user import User
+from infrastructure.cache.principal_cache import cache_principal, get_cached_principal
+from config import settings
+from utils.password_hasher import get_bulk_password_hasher
+from utils.security import SECRET_KEY, ALGORITHM, REFRESH_TOKEN_TYPE
 
 
 security = HTTPBearer()
@@ -25,8 +40,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def get_comment_use_cases(db: AsyncSession = Depends(get_db)) -> CommentUseCases:
-    comment_repository = SQLCommentRepository(db)
-    return CommentUseCases(comment_repository)
+    comment_repository: CommentRepository = SQLCommentRepository(db)
+    if settings.COMMENT_WRITE_BATCHING:
+        comment_repository = BatchingCommentRepository(comment_repository, get_comment_write_batcher())
+    return CommentUseCases(CachedCommentRepository(comment_repository))
+
+
+@asynccontextmanager
+async def comment_use_cases_scope() -> AsyncIterator[CommentUseCases]:
+    """
+    Comment use cases bound to a session owned by the caller. Streaming
+    responses outlive the request's dependencies, so they open their own.
+    """
+    async with SessionLocal() as session:
+        yield CommentUseCases(SQLCommentRepository(session))
 
 
 async def get_user_use_cases(db: AsyncSession = Depends(get_db)) -> UserUseCases:
@@ -34,6 +61,21 @@ async def get_user_use_cases(db: AsyncSession = Depends(get_db)) -> UserUseCases
     return UserUseCases(user_repository)
 
 
+async def get_user_import_use_cases(db: AsyncSession = Depends(get_db)) -> UserUseCases:
+    # Imports hash in their own process pool, away from the one logins use
+    return UserUseCases(SQLUserRepository(db), get_bulk_password_hasher())
+
+
+async def get_role_use_cases(db: AsyncSession = Depends(get_db)) -> RoleUseCases:
+    return RoleUseCases(SQLRoleRepository(db), get_role_permission_resolver())
+
+
+async def get_request_loaders(db: AsyncSession = Depends(get_db)) -> RequestLoaders:
+    # Dependencies are cached per request, so every dependant gets the same
+    # loaders and shares their batches and memoized results
+    return RequestLoaders(SQLUserRepository(db), SQLRoleRepository(db))
+
+
 async def get_auth_use_cases(db: AsyncSession = Depends(get_db)) -> AuthUseCases:
     auth_repository = SQLAuthRepository(db)
     return AuthUseCases(auth_repository)
@@ -58,24 +100,47 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
             )
-            
-        # Get user by ID
-        user_repository = SQLUserRepository(db)
-        user_service = UserUseCases(user_repository)
-        user = await user_repository.get_by_id(int(token_data.sub))
-        
-        if user is None:
+
+        # Refresh tokens are only accepted by the refresh endpoint
+        if token_data.type == REFRESH_TOKEN_TYPE:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Could not validate credentials",
             )
-            
+
+        if token_data.trusted:
+            # The signed claims are the source of truth until the token expires
+            return {
+                "user": User(
+                    id=token_data.sub,
+                    username=token_data.username or "",
+                    email=token_data.email or "",
+                    hashed_password="",
+                ),
+                "role_id": token_data.role_id,
+                "tenant_id": token_data.tenant_id,
+            }
+
+        # Get user by ID, going to the database only on a cache miss
+        user = get_cached_principal(token_data.sub)
+        if user is None:
+            user_repository = SQLUserRepository(db)
+            user = await user_repository.get_by_id(int(token_data.sub))
+
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                )
+
+            cache_principal(user)
+
         # For now, we'll return a simple dict with user info
         # In a real application, you would also include role and tenant info
         return {
             "user": user,
             "role_id": token_data.role_id,
-            "tenant_id": token_data.tenant_id
+            "tenant_id": token_data.tenant_id,
         }
             
     except ExpiredSignatureError:
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import HTTPBearer
 from typing import Dict
 
-from application.dto.auth_dto import UserLoginDTO
+from application.dto.auth_dto import UserLoginDTO, RefreshTokenDTO
 from application.use_cases.auth_use_cases import AuthUseCases
 from api.deps import get_auth_use_cases, get_current_user
 
@@ -25,7 +25,27 @@ async def login_json(
         "success": True,
         "error_code": None,
         "access_token": new_login.access_token,
-        "token_type": new_login.token_type
+        "token_type": new_login.token_type,
+        "refresh_token": new_login.refresh_token
+    }
+
+
+@router.post("/refresh", response_model=dict)
+async def refresh_token(
+    refresh_dto: RefreshTokenDTO,
+    auth_use_cases: AuthUseCases = Depends(get_auth_use_cases)
+) -> Dict:
+    """
+    Exchange a refresh token for a new access token.
+    """
+    token = await auth_use_cases.refresh_access_token(refresh_dto)
+    return {
+        "error_message": None,
+        "success": True,
+        "error_code": None,
+        "access_token": token.access_token,
+        "token_type": token.token_type,
+        "refresh_token": token.refresh_token
     }
 
 
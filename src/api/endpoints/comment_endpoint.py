@@ -1,15 +1,27 @@
-from typing import List, Optional
+import asyncio
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.deps import get_db, get_comment_use_cases
-from application.dto.comment_dto import CommentCreateDTO, CommentUpdateDTO
+from api.deps import get_db, get_comment_use_cases, get_request_loaders, comment_use_cases_scope
+from config import settings
+from application.dto.comment_dto import CommentBulkCreateResultDTO, CommentCreateDTO, CommentUpdateDTO
+from application.services.request_loaders import RequestLoaders
 from application.use_cases.comment_use_cases import CommentUseCases
-from domain.models.comment import Comment
+from domain.models.comment import (
+    Comment, CommentChanges, CommentCountByDay, CommentCountByUserPage, CommentPage, CommentWithAuthorPage
+)
+from infrastructure.events.comment_change_feed import get_comment_change_feed
+from utils.etag import etag_matches, make_etag
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
 
 router = APIRouter()
 
+MAX_BULK_CREATE_SIZE = 1000
+
 @router.post("/", response_model=Comment, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     comment_dto: CommentCreateDTO,
@@ -22,6 +34,142 @@ async def create_comment(
     new_comment = await comment_service.create(comment_dto, current_user_id)
     return new_comment
 
+@router.post("/bulk", response_model=CommentBulkCreateResultDTO, status_code=status.HTTP_201_CREATED)
+async def create_comments_bulk(
+    comment_dtos: List[CommentCreateDTO] = Body(..., min_length=1, max_length=MAX_BULK_CREATE_SIZE),
+    comment_service: CommentUseCases = Depends(get_comment_use_cases)
+) -> CommentBulkCreateResultDTO:
+    """Create many comments in one transaction. Returns the new ids in input order."""
+    # Since we don't have authentication yet, we'll use a placeholder user ID
+    current_user_id = 1  # Placeholder user ID
+
+    new_comments = await comment_service.create_many(comment_dtos, current_user_id)
+    return CommentBulkCreateResultDTO(ids=[comment.id for comment in new_comments])
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_comments(
+    user_id: Optional[int] = None,
+    updated_since: Optional[datetime] = None
+) -> StreamingResponse:
+    """Stream comments as newline-delimited JSON."""
+    async def lines() -> AsyncIterator[str]:
+        async with comment_use_cases_scope() as comment_service:
+            async for comment in comment_service.export(user_id, updated_since):
+                yield comment.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_comment_changes(user_id: Optional[int] = None) -> StreamingResponse:
+    """
+    Push comment changes as Server-Sent Events, one "insert", "update" or
+    "delete" event per change. The stream ends if the client falls too far
+    behind; reconnect and re-read the list to catch up.
+    """
+    feed = get_comment_change_feed()
+    # Connect before the response starts, so a failure is still a plain 500
+    await feed.listen()
+
+    async def events() -> AsyncIterator[str]:
+        async with feed.subscribe() as queue:
+            while True:
+                try:
+                    events = await asyncio.wait_for(queue.get(), settings.COMMENT_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle connection
+                    yield ": heartbeat\n\n"
+                    continue
+                if events is None:
+                    return
+                for event in events:
+                    if user_id is None or event.user_id == user_id:
+                        yield f"event: {event.op}\ndata: {event.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/changes", response_model=CommentChanges)
+async def get_comment_changes(
+    since: Optional[str] = None,
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    comment_service: CommentUseCases = Depends(get_comment_use_cases)
+) -> CommentChanges:
+    """
+    Get comments created, updated or deleted since a sync token, oldest first.
+    Omit since for a full sync, then pass next_token back as since; keep going
+    while has_more is true. Deleted comments come back with is_deleted set.
+    """
+    try:
+        return await comment_service.get_changes(limit, since)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+
+@router.get("/search", response_model=CommentPage)
+async def search_comments(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    comment_service: CommentUseCases = Depends(get_comment_use_cases)
+) -> CommentPage:
+    """Search comment names and descriptions, best matches first. Pass next_cursor back as cursor for the next page."""
+    try:
+        return await comment_service.search(q, limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+@router.get("/with-authors", response_model=CommentWithAuthorPage)
+async def get_comments_with_authors(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    comment_service: CommentUseCases = Depends(get_comment_use_cases),
+    loaders: RequestLoaders = Depends(get_request_loaders)
+) -> CommentWithAuthorPage:
+    """
+    Get a page of comments, each with its author's public fields. The authors
+    of the whole page are read in one query. Pass next_cursor back as cursor
+    for the next page.
+    """
+    try:
+        return await comment_service.get_page_with_authors(limit, loaders.users, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+@router.get("/stats/by-user", response_model=CommentCountByUserPage)
+async def get_comment_counts_by_user(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    comment_service: CommentUseCases = Depends(get_comment_use_cases)
+) -> CommentCountByUserPage:
+    """Get live comment counts per user, by user ID. Pass next_cursor back as cursor for the next page."""
+    try:
+        return await comment_service.get_counts_by_user(limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+@router.get("/stats/by-day", response_model=List[CommentCountByDay])
+async def get_comment_counts_by_day(
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    comment_service: CommentUseCases = Depends(get_comment_use_cases)
+) -> List[CommentCountByDay]:
+    """Get live comment counts per creation day (UTC), oldest first. Both bounds are inclusive."""
+    return await comment_service.get_counts_by_day(since, until)
+
 @router.get("/{comment_id}", response_model=Comment)
 async def get_comment(
     comment_id: int,
@@ -37,22 +185,64 @@ async def get_comment(
     
     return comment
 
-@router.get("/user/{user_id}", response_model=List[Comment])
+@router.get("/user/{user_id}", response_model=CommentPage)
 async def get_comments_by_user(
     user_id: int,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     comment_service: CommentUseCases = Depends(get_comment_use_cases)
-) -> List[Comment]:
-    """Get all comments by a specific user."""
-    comments = await comment_service.get_by_user_id(user_id)
-    return comments
+) -> CommentPage:
+    """
+    Get a page of comments by a specific user. Pass next_cursor back as cursor for the next page.
+    Answers 304 Not Modified when If-None-Match still matches the page's ETag.
+    """
+    # Compare against the cheap version query before loading any rows. The
+    # version covers all comments, so any comment write renews this ETag too.
+    etag = make_etag(await comment_service.get_version(), user_id, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    try:
+        return await comment_service.get_page_by_user_id(user_id, limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
-@router.get("/", response_model=List[Comment])
+@router.get("/", response_model=CommentPage)
 async def get_all_comments(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    ids: List[int] = Query([], max_length=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
     comment_service: CommentUseCases = Depends(get_comment_use_cases)
-) -> List[Comment]:
-    """Get all comments."""
-    comments = await comment_service.get_all()
-    return comments
+) -> CommentPage:
+    """
+    Get a page of comments. Pass next_cursor back as cursor for the next page.
+    Pass ids (repeated) instead to get just those comments, in that order and
+    in one query; ids that do not exist are left out.
+    Answers 304 Not Modified when If-None-Match still matches the page's ETag.
+    """
+    etag = make_etag(await comment_service.get_version(), limit, cursor, ids)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    if ids:
+        return CommentPage(items=list((await comment_service.get_many(ids)).values()))
+
+    try:
+        return await comment_service.get_page(limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 @router.put("/{comment_id}", response_model=Comment)
 async def update_comment(
@@ -0,0 +1,29 @@
+from typing import Dict
+
+from fastapi import APIRouter
+
+from config import settings
+from infrastructure.cache.comment_cache import comment_cache
+from infrastructure.cache.principal_cache import principal_cache
+from infrastructure.events.comment_change_feed import get_comment_change_feed
+from infrastructure.repositories.batching_comment_repository import get_comment_write_batcher
+from utils.password_hasher import get_password_hasher
+
+router = APIRouter()
+
+@router.get("/", response_model=dict)
+async def get_metrics() -> Dict:
+    """
+    In-process counters for this worker: cache sizes and hit ratios, the
+    password hasher's queue, comment change stream subscribers and, when
+    enabled, comment write batching.
+    """
+    metrics = {
+        "comment_cache": comment_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "password_hasher": get_password_hasher().stats(),
+        "comment_change_feed": get_comment_change_feed().stats(),
+    }
+    if settings.COMMENT_WRITE_BATCHING:
+        metrics["comment_write_batcher"] = get_comment_write_batcher().stats()
+    return metrics
@@ -1,19 +1,22 @@
-from typing import List, Optional
+from typing import Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from src.application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO, RoleResponseDTO
-from src.application.use_cases.role_use_cases import RoleUseCases
-from src.api.deps import get_role_use_cases
+from application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO, RoleResponseDTO
+from application.use_cases.role_use_cases import RoleUseCases
+from api.deps import get_current_user, get_role_use_cases
 
-router = APIRouter(prefix="/roles", tags=["roles"])
+router = APIRouter()
+
+# Upper bound on the ids one ?| lookup may probe the index for
+MAX_PERMISSION_IDS = 100
 
 
 @router.post("", response_model=RoleResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_role(
     role_data: RoleCreateDTO,
+    current_user: Dict = Depends(get_current_user),
     role_use_cases: RoleUseCases = Depends(get_role_use_cases)
 ):
     """Create a new role"""
@@ -33,6 +36,50 @@ async def create_role(
         )
 
 
+@router.get("/by-permission/{permission_id}", response_model=List[RoleResponseDTO])
+async def get_roles_by_permission(
+    permission_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    role_use_cases: RoleUseCases = Depends(get_role_use_cases)
+):
+    """Get the roles granting a permission"""
+    roles = await role_use_cases.get_roles_by_permission(permission_id, skip, limit)
+
+    return [
+        RoleResponseDTO(
+            id=role.id,
+            name=role.name,
+            permissions=role.permissions,
+            created_at=role.created_at.isoformat() if role.created_at else None,
+            updated_at=role.updated_at.isoformat() if role.updated_at else None
+        )
+        for role in roles
+    ]
+
+
+@router.get("/by-any-permission", response_model=List[RoleResponseDTO])
+async def get_roles_by_any_permission(
+    permission_ids: List[UUID] = Query([], alias="permission_id", min_length=1, max_length=MAX_PERMISSION_IDS),
+    skip: int = 0,
+    limit: int = 100,
+    role_use_cases: RoleUseCases = Depends(get_role_use_cases)
+):
+    """Get the roles granting at least one of the given permissions"""
+    roles = await role_use_cases.get_roles_by_any_permission(permission_ids, skip, limit)
+
+    return [
+        RoleResponseDTO(
+            id=role.id,
+            name=role.name,
+            permissions=role.permissions,
+            created_at=role.created_at.isoformat() if role.created_at else None,
+            updated_at=role.updated_at.isoformat() if role.updated_at else None
+        )
+        for role in roles
+    ]
+
+
 @router.get("/{role_id}", response_model=RoleResponseDTO)
 async def get_role(
     role_id: UUID,
@@ -80,6 +127,7 @@ async def get_all_roles(
 async def update_role(
     role_id: UUID,
     role_data: RoleUpdateDTO,
+    current_user: Dict = Depends(get_current_user),
     role_use_cases: RoleUseCases = Depends(get_role_use_cases)
 ):
     """Update an existing role"""
@@ -103,11 +151,13 @@ async def update_role(
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_role(
     role_id: UUID,
-    deleted_by: Optional[UUID] = None,
+    current_user: Dict = Depends(get_current_user),
     role_use_cases: RoleUseCases = Depends(get_role_use_cases)
 ):
     """Delete a role by ID"""
-    success = await role_use_cases.delete_role(role_id, deleted_by)
+    # deleted_by is left empty: it holds a UUID and user ids are integers,
+    # so there is no way to record the caller without trusting their input
+    success = await role_use_cases.delete_role(role_id)
     
     if not success:
         raise HTTPException(
@@ -115,4 +165,4 @@ async def delete_role(
             detail=f"Role with ID {role_id} not found"
         )
     
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None) 
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT) 
\ No newline at end of file
@@ -1,12 +1,16 @@
-from typing import List
+from typing import Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from application.dto.user_dto import UserRegistrationDTO
-from api.deps import get_db, get_user_use_cases
+from application.dto.user_dto import UserImportResultDTO, UserRegistrationDTO
+from api.deps import get_current_user, get_db, get_user_import_use_cases, get_user_use_cases
+from config import settings
 from application.use_cases.user_use_cases import UserUseCases
-from domain.models.user import User
+from domain.models.user import User, UserPage
 from dataclasses import asdict
+from utils.etag import etag_matches, make_etag
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from utils.record_reader import iter_lines, read_records
 
 router = APIRouter()
 
@@ -18,9 +22,54 @@ async def register(
     new_user = await user_service.register(user_dto)
     return new_user
 
-@router.get("/", response_model=List[User])
+@router.post("/import", response_model=UserImportResultDTO)
+async def import_users(
+        request: Request,
+        input_format: Literal["csv", "ndjson"] = Query("ndjson", alias="format"),
+        current_user: Dict = Depends(get_current_user),
+        user_service: UserUseCases = Depends(get_user_import_use_cases)
+) -> UserImportResultDTO:
+    """
+    Register users from a CSV (username,email,password header) or NDJSON
+    request body, read as it arrives. Rows that are invalid or whose username
+    or email is taken are skipped and listed in errors with their line number.
+    Each row costs a bcrypt hash on every core, so only signed-in users may
+    import and at most USER_IMPORT_MAX_ROWS rows are read; the row after that
+    is reported with reason "limit". Import larger files with
+    scripts/import_users.py, which skips the users already imported.
+    """
+    records = read_records(iter_lines(request.stream()), input_format)
+    return await user_service.import_users(
+        records, settings.USER_IMPORT_BATCH_SIZE, settings.USER_IMPORT_MAX_ROWS
+    )
+
+@router.get("/", response_model=UserPage)
 async def get_all_users(
+        response: Response,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        ids: List[int] = Query([], max_length=MAX_PAGE_SIZE),
+        if_none_match: Optional[str] = Header(None),
         user_service: UserUseCases = Depends(get_user_use_cases)
-) -> List[User]:
-    users = await user_service.get_all()
-    return users
\ No newline at end of file
+) -> UserPage:
+    """
+    Get a page of users, without their password hashes. Pass next_cursor back
+    as cursor for the next page, or pass ids (repeated) to get just those
+    users, in that order and in one query.
+    """
+    # Answer 304 Not Modified without loading the users when nothing changed
+    etag = make_etag(await user_service.get_version(), limit, cursor, ids)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    if ids:
+        return UserPage(items=list((await user_service.get_many(ids)).values()))
+
+    try:
+        return await user_service.get_page(limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
-from api.endpoints import user_endpoint, comment_endpoint, auth_endpoint
+from api.endpoints import user_endpoint, comment_endpoint, auth_endpoint, metrics_endpoint, role_endpoint
 
 api_router = APIRouter()
 
 api_router.include_router(user_endpoint.router, prefix="/users", tags=["Users"])
 api_router.include_router(comment_endpoint.router, prefix="/comments", tags=["Comments"])
+api_router.include_router(role_endpoint.router, prefix="/roles", tags=["Roles"])
 api_router.include_router(auth_endpoint.router, prefix="/auth", tags=["Authentication"])
+api_router.include_router(metrics_endpoint.router, prefix="/metrics", tags=["Metrics"])
@@ -3,4 +3,8 @@ from pydantic import BaseModel
 
 class UserLoginDTO(BaseModel):
     email: str
-    password: str 
\ No newline at end of file
+    password: str
+
+
+class RefreshTokenDTO(BaseModel):
+    refresh_token: str 
\ No newline at end of file
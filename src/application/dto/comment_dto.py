@@ -1,5 +1,5 @@
-from pydantic import Field
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from domain.models.comment import CommentBase
 
 # Remove id property for create
@@ -10,4 +10,8 @@ class CommentCreateDTO(CommentBase):
 class CommentUpdateDTO(CommentBase):
     name: Optional[str] = None
     description: Optional[str] = None
-    user_id: Optional[int] = None 
\ No newline at end of file
+    user_id: Optional[int] = None
+
+
+class CommentBulkCreateResultDTO(BaseModel):
+    ids: List[int]
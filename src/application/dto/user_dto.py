@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from domain.models.user import UserBase
 
 #remove id property for create
@@ -10,4 +10,18 @@ class UserRegistrationDTO(BaseModel):
 
 
 class UserUpdateDto(UserBase):
-    pass
\ No newline at end of file
+    pass
+
+
+class UserImportErrorDTO(BaseModel):
+    """A row that was not imported. reason is "invalid", "conflict" or "limit"."""
+    line: int
+    reason: str
+    detail: str
+    username: Optional[str] = None
+    email: Optional[str] = None
+
+
+class UserImportResultDTO(BaseModel):
+    imported: int = 0
+    errors: List[UserImportErrorDTO] = []
@@ -0,0 +1,24 @@
+import asyncio
+from uuid import UUID
+
+from domain.models.role import Role
+from domain.models.user import UserSummary
+from domain.repositories.role_repository import RoleRepository
+from domain.repositories.user_repository import UserRepository
+from utils.data_loader import DataLoader
+
+
+class RequestLoaders:
+    """
+    One batching loader per related entity type, shared by everything that
+    handles a single request. Enriching a list of rows with their users or
+    roles then costs one get_many per type however many rows there are, and
+    an id asked for twice in the request is looked up once.
+    """
+
+    def __init__(self, user_repository: UserRepository, role_repository: RoleRepository):
+        # The repositories share the request's session, which runs one query
+        # at a time, so batches of different types take turns
+        lock = asyncio.Lock()
+        self.users: DataLoader[int, UserSummary] = DataLoader(user_repository.get_many, lock=lock)
+        self.roles: DataLoader[UUID, Role] = DataLoader(role_repository.get_many, lock=lock)
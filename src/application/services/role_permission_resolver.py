@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from uuid import UUID
+
+from domain.models.role import Role
+from domain.repositories.role_repository import RoleRepository
+
+
+class RolePermissionResolver:
+    """
+    Answers whether a role grants a permission from memory, without I/O.
+
+    Each live role's permission list is compiled once into a frozenset, so a
+    check is two hash lookups however many permissions a role has. The index
+    is filled by ``reload`` and kept current by ``put`` and ``remove``, which
+    the role use cases call after every committed change. Each worker process
+    holds its own index; changes made through another worker are picked up on
+    the next full reload.
+    """
+
+    def __init__(self) -> None:
+        self._permissions: Dict[UUID, FrozenSet[UUID]] = {}
+        # Changes made while a reload is reading roles, replayed over its
+        # result so the reload cannot bring back an older version
+        self._changed_during_reload: Optional[Dict[UUID, Optional[FrozenSet[UUID]]]] = None
+
+    def has_permission(self, role_id: UUID, permission: UUID) -> bool:
+        """Whether the live role ``role_id`` grants ``permission``."""
+        permissions = self._permissions.get(role_id)
+        return permissions is not None and permission in permissions
+
+    def get_permissions(self, role_id: UUID) -> Optional[FrozenSet[UUID]]:
+        """The compiled permission set of a live role, or None if there is no such role."""
+        return self._permissions.get(role_id)
+
+    def put(self, role: Role) -> None:
+        """Add or replace one role; a deleted role is removed instead."""
+        if role.id is None:
+            return
+        self._apply(role.id, None if role.is_deleted else self._compile(role.permissions))
+
+    def remove(self, role_id: UUID) -> None:
+        self._apply(role_id, None)
+
+    async def reload(self, role_repository: RoleRepository, page_size: int = 1000) -> int:
+        """Rebuild the whole index from the live roles; return how many were loaded."""
+        self._changed_during_reload = {}
+        try:
+            permissions: Dict[UUID, FrozenSet[UUID]] = {}
+            # Keyset pages, so a role deleted by another worker mid-walk
+            # cannot shift the next live role past the page boundary
+            after: Optional[Tuple[datetime, UUID]] = None
+            while True:
+                roles = await role_repository.get_page(page_size, after)
+                for role in roles:
+                    if role.id is not None:
+                        permissions[role.id] = self._compile(role.permissions)
+                if len(roles) < page_size:
+                    break
+                last = roles[-1]
+                if last.created_at is None or last.id is None:
+                    raise ValueError("Roles must be read back with their created_at and id")
+                after = (last.created_at, last.id)
+            for role_id, changed in self._changed_during_reload.items():
+                if changed is None:
+                    permissions.pop(role_id, None)
+                else:
+                    permissions[role_id] = changed
+        finally:
+            self._changed_during_reload = None
+        # Swapped in whole, so checks never see a half-built index
+        self._permissions = permissions
+        return len(permissions)
+
+    def _apply(self, role_id: UUID, permissions: Optional[FrozenSet[UUID]]) -> None:
+        if permissions is None:
+            self._permissions.pop(role_id, None)
+        else:
+            self._permissions[role_id] = permissions
+        if self._changed_during_reload is not None:
+            self._changed_during_reload[role_id] = permissions
+
+    @staticmethod
+    def _compile(permissions: Iterable[UUID]) -> FrozenSet[UUID]:
+        return frozenset(permissions)
+
+
+_role_permission_resolver: Optional[RolePermissionResolver] = None
+
+
+def get_role_permission_resolver() -> RolePermissionResolver:
+    """Return the process-wide role permission resolver, creating it on first use."""
+    global _role_permission_resolver
+    if _role_permission_resolver is None:
+        _role_permission_resolver = RolePermissionResolver()
+    return _role_permission_resolver
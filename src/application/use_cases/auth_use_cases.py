@@ -1,6 +1,6 @@
 from domain.repositories.auth_repository import AuthRepository
 from domain.models.auth import Login, Token
-from application.dto.auth_dto import UserLoginDTO
+from application.dto.auth_dto import UserLoginDTO, RefreshTokenDTO
 
 
 class AuthUseCases:
@@ -13,4 +13,10 @@ class AuthUseCases:
         """
         login = Login(email=form_data.email, password=form_data.password)
         token = await self.auth_repository.login_access_token(login)
-        return token 
\ No newline at end of file
+        return token
+
+    async def refresh_access_token(self, refresh_dto: RefreshTokenDTO) -> Token:
+        """
+        Exchange a refresh token for a new access token.
+        """
+        return await self.auth_repository.refresh_access_token(refresh_dto.refresh_token) 
\ No newline at end of file
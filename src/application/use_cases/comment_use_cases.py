@@ -1,13 +1,26 @@
-from typing import List, Optional
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from domain.models.comment import Comment
+from config import settings
+from domain.models.comment import (
+    Comment, CommentChanges, CommentCountByDay, CommentCountByUserPage, CommentPage, CommentWithAuthor,
+    CommentWithAuthorPage
+)
+from domain.models.user import UserSummary
 from domain.repositories.comment_repository import CommentRepository
 from application.dto.comment_dto import CommentCreateDTO, CommentUpdateDTO
+from utils.data_loader import DataLoader
+from utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 
 class CommentUseCases:
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(self, comment_repository: CommentRepository, changes_lag: Optional[timedelta] = None):
         self.comment_repository = comment_repository
+        self.changes_lag = (
+            changes_lag if changes_lag is not None
+            else timedelta(seconds=settings.COMMENT_CHANGES_SAFETY_LAG_SECONDS)
+        )
 
     async def create(self, comment_dto: CommentCreateDTO, user_id: int) -> Comment:
         comment = Comment(
@@ -19,42 +32,149 @@ class CommentUseCases:
         await self.comment_repository.add(comment)
         return comment
 
+    async def create_many(self, comment_dtos: List[CommentCreateDTO], user_id: int) -> List[Comment]:
+        comments = [
+            Comment(
+                name=comment_dto.name,
+                description=comment_dto.description,
+                user_id=comment_dto.user_id,
+                created_by=user_id
+            )
+            for comment_dto in comment_dtos
+        ]
+        await self.comment_repository.add_many(comments)
+        return comments
+
     async def get_by_id(self, id: int) -> Optional[Comment]:
         return await self.comment_repository.get_by_id(id)
         
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        return await self.comment_repository.get_many(ids)
+        
     async def get_by_user_id(self, user_id: int) -> List[Comment]:
         return await self.comment_repository.get_by_user_id(user_id)
 
     async def get_all(self) -> List[Comment]:
         return await self.comment_repository.get_all()
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> CommentPage:
+        # Fetch one extra row to learn whether another page follows
+        comments = await self.comment_repository.get_page(limit + 1, self._decode_cursor(cursor))
+        return self._to_page(comments, limit)
+
+    async def get_page_with_authors(
+        self, limit: int, user_loader: DataLoader[int, UserSummary], cursor: Optional[str] = None
+    ) -> CommentWithAuthorPage:
+        page = await self.get_page(limit, cursor)
+        # Each comment asks for its own author; the loader turns the lookups
+        # into one query for the page's distinct user ids
+        items = await asyncio.gather(*(self._with_author(comment, user_loader) for comment in page.items))
+        return CommentWithAuthorPage(items=list(items), next_cursor=page.next_cursor)
+
+    async def get_page_by_user_id(self, user_id: int, limit: int, cursor: Optional[str] = None) -> CommentPage:
+        comments = await self.comment_repository.get_page_by_user_id(user_id, limit + 1, self._decode_cursor(cursor))
+        return self._to_page(comments, limit)
+
+    async def get_changes(self, limit: int, token: Optional[str] = None) -> CommentChanges:
+        # The token is the (updated_at, id) of the last change handed out, so
+        # it doubles as a keyset cursor over the updated_at index
+        after = self._decode_cursor(token)
+        comments = await self.comment_repository.get_changes(limit + 1, after, self.changes_lag)
+        items = comments[:limit]
+        if not items:
+            return CommentChanges(items=[], next_token=token)
+        last = items[-1]
+        return CommentChanges(
+            items=items,
+            next_token=encode_cursor(last.updated_at, last.id),
+            has_more=len(comments) > limit
+        )
+
+    async def get_version(self) -> int:
+        return await self.comment_repository.get_version()
+
+    async def search(self, query: str, limit: int, cursor: Optional[str] = None) -> CommentPage:
+        # Results are ordered by rank, which has no usable keyset, so the
+        # cursor carries an offset into the ranked result instead
+        offset = self._decode_offset(cursor)
+        comments = await self.comment_repository.search(query, limit + 1, offset)
+        if len(comments) <= limit:
+            return CommentPage(items=comments)
+        return CommentPage(items=comments[:limit], next_cursor=encode_cursor(offset + limit))
+
+    async def get_counts_by_user(self, limit: int, cursor: Optional[str] = None) -> CommentCountByUserPage:
+        after_user_id = self._decode_user_id(cursor)
+        counts = await self.comment_repository.get_counts_by_user(limit + 1, after_user_id)
+        if len(counts) <= limit:
+            return CommentCountByUserPage(items=counts)
+        return CommentCountByUserPage(items=counts[:limit], next_cursor=encode_cursor(counts[limit - 1].user_id))
+
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        return await self.comment_repository.get_counts_by_day(since, until)
+
+    def export(self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None) -> AsyncIterator[Comment]:
+        return self.comment_repository.stream(user_id, updated_since)
         
     async def update(self, id: int, comment_dto: CommentUpdateDTO, user_id: int) -> Optional[Comment]:
-        existing_comment = await self.comment_repository.get_by_id(id)
-        if not existing_comment:
-            return None
-            
-        # Update only provided fields
-        if comment_dto.name is not None:
-            existing_comment.name = comment_dto.name
-        if comment_dto.description is not None:
-            existing_comment.description = comment_dto.description
-        if comment_dto.user_id is not None:
-            existing_comment.user_id = comment_dto.user_id
-            
-        existing_comment.updated_by = user_id
-        
-        await self.comment_repository.update(existing_comment)
-        return existing_comment
+        # Update only provided fields; the repository returns None when the
+        # comment does not exist
+        changes = {
+            field: value
+            for field, value in comment_dto.model_dump(include={"name", "description", "user_id"}).items()
+            if value is not None
+        }
+        return await self.comment_repository.update(id, changes, user_id)
         
     async def delete(self, id: int, user_id: int) -> bool:
-        existing_comment = await self.comment_repository.get_by_id(id)
-        if not existing_comment:
-            return False
-            
-        # Soft delete by updating the deleted_by field
-        existing_comment.deleted_by = user_id
-        await self.comment_repository.update(existing_comment)
-        
-        # Hard delete
-        await self.comment_repository.delete(id)
-        return True 
\ No newline at end of file
+        # Soft delete, recording who deleted the comment
+        return await self.comment_repository.delete(id, user_id)
+
+    @staticmethod
+    async def _with_author(comment: Comment, user_loader: DataLoader[int, UserSummary]) -> CommentWithAuthor:
+        return CommentWithAuthor(**comment.model_dump(), author=await user_loader.load(comment.user_id))
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+        if cursor is None:
+            return None
+        values = decode_cursor(cursor)
+        try:
+            created_at, id = values
+            return datetime.fromisoformat(created_at), int(id)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor")
+
+    @staticmethod
+    def _decode_offset(cursor: Optional[str]) -> int:
+        if cursor is None:
+            return 0
+        values = decode_cursor(cursor)
+        try:
+            offset, = values
+            offset = int(offset)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor")
+        if offset < 0:
+            raise InvalidCursorError("Invalid cursor")
+        return offset
+
+    @staticmethod
+    def _decode_user_id(cursor: Optional[str]) -> Optional[int]:
+        if cursor is None:
+            return None
+        values = decode_cursor(cursor)
+        try:
+            user_id, = values
+            return int(user_id)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor")
+
+    @staticmethod
+    def _to_page(comments: List[Comment], limit: int) -> CommentPage:
+        if len(comments) <= limit:
+            return CommentPage(items=comments)
+        items = comments[:limit]
+        last = items[-1]
+        return CommentPage(items=items, next_cursor=encode_cursor(last.created_at, last.id))
@@ -2,16 +2,19 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from src.application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO
-from src.domain.models.role import Role
-from src.domain.repositories.role_repository import RoleRepository
+from application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO
+from application.services.role_permission_resolver import RolePermissionResolver
+from domain.models.role import Role
+from domain.repositories.role_repository import RoleRepository
 
 
 class RoleUseCases:
     """Use cases for Role domain model"""
 
-    def __init__(self, role_repository: RoleRepository):
+    def __init__(self, role_repository: RoleRepository, permission_resolver: Optional[RolePermissionResolver] = None):
         self.role_repository = role_repository
+        # Kept in step with every change made here, once it is committed
+        self.permission_resolver = permission_resolver
 
     async def create_role(self, role_create_dto: RoleCreateDTO) -> Role:
         """Create a new role"""
@@ -26,7 +29,10 @@ class RoleUseCases:
             updated_by=role_create_dto.created_by
         )
         
-        return await self.role_repository.add(role)
+        role = await self.role_repository.add(role)
+        if self.permission_resolver is not None:
+            self.permission_resolver.put(role)
+        return role
 
     async def get_role_by_id(self, role_id: UUID) -> Optional[Role]:
         """Get a role by ID"""
@@ -36,6 +42,16 @@ class RoleUseCases:
         """Get all roles with pagination"""
         return await self.role_repository.get_all(skip, limit)
 
+    async def get_roles_by_permission(self, permission: UUID, skip: int = 0, limit: int = 100) -> List[Role]:
+        """Get the roles granting a permission, with pagination"""
+        return await self.role_repository.get_by_permission(permission, skip, limit)
+
+    async def get_roles_by_any_permission(
+        self, permissions: List[UUID], skip: int = 0, limit: int = 100
+    ) -> List[Role]:
+        """Get the roles granting at least one of the given permissions, with pagination"""
+        return await self.role_repository.get_by_any_permission(permissions, skip, limit)
+
     async def update_role(self, role_id: UUID, role_update_dto: RoleUpdateDTO) -> Optional[Role]:
         """Update an existing role"""
         # Get the existing role
@@ -55,8 +71,14 @@ class RoleUseCases:
         existing_role.updated_by = role_update_dto.updated_by
         
         # Save the updated role
-        return await self.role_repository.update(existing_role)
+        updated_role = await self.role_repository.update(existing_role)
+        if updated_role is not None and self.permission_resolver is not None:
+            self.permission_resolver.put(updated_role)
+        return updated_role
 
     async def delete_role(self, role_id: UUID, deleted_by: Optional[UUID] = None) -> bool:
         """Delete a role by ID"""
-        return await self.role_repository.delete(role_id, deleted_by) 
\ No newline at end of file
+        deleted = await self.role_repository.delete(role_id, deleted_by)
+        if deleted and self.permission_resolver is not None:
+            self.permission_resolver.remove(role_id)
+        return deleted 
\ No newline at end of file
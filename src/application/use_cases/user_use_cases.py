@@ -1,23 +1,131 @@
-from typing import List
+import asyncio
+from typing import AsyncIterable, Dict, List, Optional, Tuple
 
-from domain.models.user import User
+from pydantic import ValidationError
+
+from domain.models.user import User, UserPage, UserSummary
 from domain.repositories.user_repository import UserRepository
-from application.dto.user_dto import UserRegistrationDTO
-from utils.security import get_password_hash
+from application.dto.user_dto import UserImportErrorDTO, UserImportResultDTO, UserRegistrationDTO
+from utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from utils.password_hasher import PasswordHasher, get_password_hasher
+from utils.record_reader import Record
 
 
 class UserUseCases:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, password_hasher: Optional[PasswordHasher] = None):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or get_password_hasher()
 
     async def register(self, user_dto: UserRegistrationDTO) -> User:
-        # Hash the password using the security utility
-        hashed_password = get_password_hash(user_dto.password)
+        # Hash the password in the worker pool so the event loop is not blocked
+        hashed_password = await self.password_hasher.hash(user_dto.password)
 
         user = User(username=user_dto.username, email=user_dto.email, hashed_password=hashed_password)
         await self.user_repository.add(user)
         return user
 
+    async def import_users(
+        self, records: AsyncIterable[Tuple[int, Record]], batch_size: int = 1000, max_rows: Optional[int] = None
+    ) -> UserImportResultDTO:
+        """
+        Register users from numbered records in batches. Rows that fail
+        validation or clash with an existing or earlier username or email are
+        skipped and reported; the rest of the import carries on. Reading stops
+        after max_rows records, with the first one left out reported as "limit".
+        """
+        result = UserImportResultDTO()
+        batch: List[Tuple[int, UserRegistrationDTO]] = []
+        rows = 0
+        async for line, record in records:
+            rows += 1
+            if max_rows is not None and rows > max_rows:
+                result.errors.append(UserImportErrorDTO(
+                    line=line, reason="limit", detail=f"only {max_rows} rows are imported per request"
+                ))
+                break
+            if isinstance(record, str):
+                result.errors.append(UserImportErrorDTO(line=line, reason="invalid", detail=record))
+                continue
+            try:
+                batch.append((line, UserRegistrationDTO.model_validate(record)))
+            except ValidationError as error:
+                result.errors.append(UserImportErrorDTO(
+                    line=line, reason="invalid", detail=self._describe(error),
+                    username=record.get("username"), email=record.get("email")
+                ))
+                continue
+            if len(batch) >= batch_size:
+                await self._import_batch(batch, result)
+                batch = []
+        if batch:
+            await self._import_batch(batch, result)
+        result.errors.sort(key=lambda error: error.line)
+        return result
+
+    async def _import_batch(self, batch: List[Tuple[int, UserRegistrationDTO]], result: UserImportResultDTO) -> None:
+        # Drop rows that are known to clash before hashing, so re-running an
+        # import that stopped halfway does not pay for bcrypt again
+        taken_usernames, taken_emails = await self.user_repository.get_existing(
+            [dto.username for _, dto in batch], [dto.email for _, dto in batch]
+        )
+        fresh: List[Tuple[int, UserRegistrationDTO]] = []
+        for line, dto in batch:
+            if dto.username in taken_usernames or dto.email in taken_emails:
+                result.errors.append(self._conflict(line, dto))
+            else:
+                fresh.append((line, dto))
+
+        hashes = await asyncio.gather(*(self.password_hasher.hash(dto.password) for _, dto in fresh))
+        users = [
+            User(username=dto.username, email=dto.email, hashed_password=hashed_password)
+            for (_, dto), hashed_password in zip(fresh, hashes)
+        ]
+        await self.user_repository.add_many_new(users)
+
+        for (line, dto), user in zip(fresh, users):
+            if user.id is None:
+                result.errors.append(self._conflict(line, dto))
+            else:
+                result.imported += 1
+
     async def get_all(self) -> List[User]:
         users = await self.user_repository.get_all()
-        return users
\ No newline at end of file
+        return users
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> UserPage:
+        # Fetch one extra row to learn whether another page follows
+        users = await self.user_repository.get_page(limit + 1, self._decode_cursor(cursor))
+        if len(users) <= limit:
+            return UserPage(items=users)
+        items = users[:limit]
+        return UserPage(items=items, next_cursor=encode_cursor(items[-1].id))
+
+    async def get_many(self, user_ids: List[int]) -> Dict[int, UserSummary]:
+        return await self.user_repository.get_many(user_ids)
+
+    async def get_version(self) -> int:
+        return await self.user_repository.get_version()
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        if cursor is None:
+            return None
+        values = decode_cursor(cursor)
+        try:
+            id, = values
+            return int(id)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor")
+
+    @staticmethod
+    def _conflict(line: int, dto: UserRegistrationDTO) -> UserImportErrorDTO:
+        return UserImportErrorDTO(
+            line=line, reason="conflict", detail="username or email already exists",
+            username=dto.username, email=dto.email
+        )
+
+    @staticmethod
+    def _describe(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+        )
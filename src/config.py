@@ -12,6 +12,59 @@ class Settings(BaseSettings):
     POSTGRES_SYNC_CONNECTION_STRING: str
     SECRET_KEY: str = secrets.token_urlsafe(32)
 
+    # "thread" or "process"; bcrypt releases the GIL so threads are usually enough
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+
+    # Bulk user imports hash in their own process pool, so a large import
+    # cannot queue logins behind thousands of hashes; rows are hashed and
+    # inserted this many at a time
+    USER_IMPORT_HASH_WORKERS: int = os.cpu_count() or 1
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    # Rows accepted per POST /users/import; larger files go through
+    # scripts/import_users.py
+    USER_IMPORT_MAX_ROWS: int = 10000
+
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60
+
+    COMMENT_CACHE_MAX_SIZE: int = 10000
+    COMMENT_CACHE_TTL_SECONDS: float = 30
+
+    # Coalesce concurrent comment inserts into one multi-row INSERT and commit.
+    # A batch is flushed once it holds MAX_SIZE comments or its first comment
+    # has waited MAX_LINGER_MS, whichever comes first.
+    COMMENT_WRITE_BATCHING: bool = False
+    COMMENT_WRITE_BATCH_MAX_SIZE: int = 100
+    COMMENT_WRITE_BATCH_MAX_LINGER_MS: float = 5
+
+    # Comment change stream: comment lines sent to keep idle connections open,
+    # and notifications (up to 50 changes each, one or more per write
+    # statement) buffered per subscriber before a slow one is disconnected
+    COMMENT_STREAM_HEARTBEAT_SECONDS: float = 15
+    COMMENT_STREAM_QUEUE_SIZE: int = 1000
+
+    # Changes newer than this are held back from /comments/changes. updated_at
+    # is set when a transaction starts, so a slow one can commit a change
+    # older than one already handed out; the lag must exceed such transactions.
+    COMMENT_CHANGES_SAFETY_LAG_SECONDS: float = 5
+
+    # comments is partitioned by month on created_at; the API makes sure the
+    # partitions for this many months ahead exist, on startup and then at
+    # this interval
+    COMMENT_PARTITION_MONTHS_AHEAD: int = 3
+    COMMENT_PARTITION_CHECK_INTERVAL_SECONDS: float = 86400
+
+    # Role permission sets are held in memory by every worker and reloaded in
+    # full at this interval, which bounds how long a role change made through
+    # another worker goes unseen
+    ROLE_PERMISSION_RELOAD_INTERVAL_SECONDS: float = 60
+
+    # Embed the profile (username and email, no permissions) in short-lived
+    # access tokens so get_current_user can skip the user lookup; the DB is
+    # hit on refresh only
+    TRUSTED_CLAIMS_TOKENS: bool = False
+
     class Config:
         case_sensitive = True
         env_file = os.path.join(Path(__file__).resolve().parent.parent, '.env')
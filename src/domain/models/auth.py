@@ -10,9 +10,15 @@ class Login(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
 
 
 class TokenPayload(BaseModel):
     sub: Optional[int] = None
     role_id: Optional[int] = None
-    tenant_id: Optional[int] = None 
\ No newline at end of file
+    tenant_id: Optional[int] = None
+    type: Optional[str] = None
+    # Profile claims, only present in tokens issued with TRUSTED_CLAIMS_TOKENS
+    trusted: bool = False
+    username: Optional[str] = None
+    email: Optional[str] = None 
\ No newline at end of file
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
+
+from domain.models.user import UserSummary
 
 class CommentBase(BaseModel):
     id: Optional[int] = None
@@ -15,4 +17,51 @@ class Comment(CommentBase):
     updated_by: Optional[int] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    deleted_by: Optional[int] = None 
\ No newline at end of file
+    deleted_by: Optional[int] = None
+
+
+class CommentPage(BaseModel):
+    items: List[Comment]
+    next_cursor: Optional[str] = None
+
+
+class CommentWithAuthor(Comment):
+    author: Optional[UserSummary] = None
+
+
+class CommentWithAuthorPage(BaseModel):
+    items: List[CommentWithAuthor]
+    next_cursor: Optional[str] = None
+
+
+class CommentChanges(BaseModel):
+    """
+    Comments changed since a sync token, oldest change first. Deleted comments
+    are included as tombstones with is_deleted set.
+    """
+    items: List[Comment]
+    next_token: Optional[str] = None
+    has_more: bool = False
+
+
+class CommentEvent(BaseModel):
+    """A change to one comment: op is "insert", "update" or "delete"."""
+    op: str
+    id: int
+    user_id: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+
+class CommentCountByUser(BaseModel):
+    user_id: int
+    count: int
+
+
+class CommentCountByUserPage(BaseModel):
+    items: List[CommentCountByUser]
+    next_cursor: Optional[str] = None
+
+
+class CommentCountByDay(BaseModel):
+    day: date
+    count: int
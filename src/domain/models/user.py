@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 from datetime import datetime
@@ -16,4 +16,17 @@ class User(UserBase):
     updated_by: Optional[int] = None
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
-    deleted_by: Optional[int] = None
\ No newline at end of file
+    deleted_by: Optional[int] = None
+
+
+class UserSummary(BaseModel):
+    """The public fields of a user, for listings; never carries the password hash."""
+    id: int
+    username: str
+    email: str
+    created_at: Optional[datetime] = None
+
+
+class UserPage(BaseModel):
+    items: List[UserSummary]
+    next_cursor: Optional[str] = None
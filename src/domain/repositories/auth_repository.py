@@ -5,4 +5,8 @@ from domain.models.auth import Login, Token
 class AuthRepository(ABC):
     @abstractmethod
     async def login_access_token(self, form_data: Login) -> Token:
+        pass
+
+    @abstractmethod
+    async def refresh_access_token(self, refresh_token: str) -> Token:
         pass 
\ No newline at end of file
@@ -1,16 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from domain.models.comment import Comment
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
+from domain.models.comment import Comment, CommentCountByDay, CommentCountByUser
 
 class CommentRepository(ABC):
     @abstractmethod
     async def add(self, comment: Comment) -> None:
         pass
 
+    @abstractmethod
+    async def add_many(self, comments: List[Comment]) -> None:
+        """Insert all comments in one transaction, setting their generated ids in input order."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, id: int) -> Optional[Comment]:
         pass
         
+    @abstractmethod
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        """Return the live comments with the given ids, keyed by id in the order asked for; missing ids are left out."""
+        pass
+
     @abstractmethod
     async def get_by_user_id(self, user_id: int) -> List[Comment]:
         pass
@@ -18,11 +29,67 @@ class CommentRepository(ABC):
     @abstractmethod
     async def get_all(self) -> List[Comment]:
         pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Comment]:
+        """Return up to limit comments ordered by (created_at, id), starting after the given key."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_user_id(
+        self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Comment]:
+        pass
+
+    @abstractmethod
+    async def get_changes(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None, lag: timedelta = timedelta(0)
+    ) -> List[Comment]:
+        """
+        Return up to limit comments, deleted ones included, ordered by
+        (updated_at, id) and starting after the given key. Comments updated
+        within the last lag are left out.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self) -> int:
+        """
+        Return a number that changes with every committed write to comments,
+        and only then. It is not ordered across tables or meaningful alone.
+        """
+        pass
+
+    @abstractmethod
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Comment]:
+        """Return up to limit comments matching a web-style search query, best matches first."""
+        pass
+
+    @abstractmethod
+    async def get_counts_by_user(self, limit: int, after_user_id: Optional[int] = None) -> List[CommentCountByUser]:
+        """Return up to limit per-user live comment counts in user_id order, starting after the given user."""
+        pass
+
+    @abstractmethod
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        """Return live comment counts per creation day in day order, both bounds inclusive."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Comment]:
+        """Yield matching comments one at a time without loading the whole result."""
+        pass
         
     @abstractmethod
-    async def update(self, comment: Comment) -> None:
+    async def update(self, id: int, changes: Dict[str, Any], updated_by: int) -> Optional[Comment]:
+        """Apply the given field changes to a non-deleted comment; None if there is no such comment."""
         pass
         
     @abstractmethod
-    async def delete(self, id: int) -> None:
+    async def delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
+        """Soft delete a comment; False if there is no such non-deleted comment."""
         pass 
\ No newline at end of file
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from src.domain.models.role import Role
+from domain.models.role import Role
 
 
 class RoleRepository(ABC):
@@ -18,14 +19,34 @@ class RoleRepository(ABC):
         """Get a role by its ID"""
         pass
 
+    @abstractmethod
+    async def get_many(self, role_ids: List[UUID]) -> Dict[UUID, Role]:
+        """Get the roles with the given IDs, keyed by ID in the order asked for"""
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Role]:
         """Get all roles with pagination"""
         pass
 
     @abstractmethod
-    async def update(self, role: Role) -> Role:
-        """Update an existing role"""
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[Role]:
+        """Return up to limit live roles ordered by (created_at, id), starting after the given key."""
+        pass
+
+    @abstractmethod
+    async def get_by_permission(self, permission: UUID, skip: int = 0, limit: int = 100) -> List[Role]:
+        """Get the roles granting a permission, with pagination"""
+        pass
+
+    @abstractmethod
+    async def get_by_any_permission(self, permissions: List[UUID], skip: int = 0, limit: int = 100) -> List[Role]:
+        """Get the roles granting at least one of the given permissions, with pagination"""
+        pass
+
+    @abstractmethod
+    async def update(self, role: Role) -> Optional[Role]:
+        """Update an existing role; None if it no longer exists"""
         pass
 
     @abstractmethod
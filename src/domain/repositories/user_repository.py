@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from domain.models.user import User
+from typing import Dict, Optional, List, Set, Tuple
+from domain.models.user import User, UserSummary
 
 class UserRepository(ABC):
     @abstractmethod
     async def add(self, user: User) -> None:
         pass
 
+    @abstractmethod
+    async def add_many_new(self, users: List[User]) -> None:
+        """
+        Insert the users that do not clash with an existing username or email
+        and set their ids; users left without an id were skipped.
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Return which of the given usernames and emails are already taken."""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         pass
@@ -15,6 +28,21 @@ class UserRepository(ABC):
     async def get_all(self) -> List[User]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, after_id: Optional[int] = None) -> List[UserSummary]:
+        """Return up to limit user summaries ordered by id, starting after the given id."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: int) -> Optional[User]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_many(self, user_ids: List[int]) -> Dict[int, UserSummary]:
+        """Return the users with the given ids, keyed by id in the order asked for; missing ids are left out."""
+        pass
+
+    @abstractmethod
+    async def get_version(self) -> int:
+        """Return a number that changes with every committed write to users, and only then."""
+        pass
@@ -0,0 +1,19 @@
+from typing import Union
+
+from config import settings
+from domain.models.comment import Comment
+from utils.cache import TTLCache
+
+# Stored in place of a comment to remember that an id does not exist
+COMMENT_NOT_FOUND = object()
+
+# Comments keyed by id, shared by all requests in this worker process. Writes
+# made through another worker become visible once the entry expires.
+comment_cache: TTLCache[int, Union[Comment, object]] = TTLCache(
+    maxsize=settings.COMMENT_CACHE_MAX_SIZE,
+    ttl=settings.COMMENT_CACHE_TTL_SECONDS,
+)
+
+
+def clear_comment_cache() -> None:
+    comment_cache.clear()
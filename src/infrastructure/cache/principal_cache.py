@@ -0,0 +1,31 @@
+from typing import Optional
+
+from config import settings
+from domain.models.user import User
+from utils.cache import TTLCache
+
+# Authenticated users keyed by id. Each worker process keeps its own copy, so
+# the TTL bounds how long a change made through another worker can go unseen.
+principal_cache: TTLCache[int, User] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_principal(user_id: int) -> Optional[User]:
+    user = principal_cache.get(user_id)
+    return user.model_copy() if user is not None else None
+
+
+def cache_principal(user: User) -> None:
+    if user.id is not None:
+        principal_cache.set(user.id, user.model_copy())
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a cached principal. Call this whenever a user is changed or deleted."""
+    principal_cache.invalidate(user_id)
+
+
+def clear_principal_cache() -> None:
+    principal_cache.clear()
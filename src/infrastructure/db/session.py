@@ -5,5 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
 
-engine = create_async_engine(settings.POSTGRES_CONNECTION_STRING, echo=True)
+# Timestamps are stored naive and read as UTC, and the comment stats bucket by
+# created_at::date, so pin every session to UTC whatever the server default is
+engine = create_async_engine(
+    settings.POSTGRES_CONNECTION_STRING, echo=True, connect_args={"server_settings": {"timezone": "UTC"}}
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
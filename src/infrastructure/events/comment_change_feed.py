@@ -0,0 +1,127 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+import asyncpg
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.engine import make_url
+
+from config import settings
+from domain.models.comment import CommentEvent
+
+# Channel the comments_notify_* triggers publish to
+COMMENT_CHANGES_CHANNEL = "comment_changes"
+
+# A subscriber queue receives the events of one notification at a time, and
+# None when the feed closes it
+Subscription = asyncio.Queue[Optional[List[CommentEvent]]]
+
+# Each trigger statement publishes a JSON array of up to 50 events
+_EVENTS = TypeAdapter(List[CommentEvent])
+
+
+class CommentChangeFeed:
+    """
+    Fans comment change notifications out to in-process subscribers.
+
+    A single LISTEN connection is opened per worker on the first subscription
+    and shared by all of them. Events are queued a notification at a time, so
+    a bulk write takes a few queue slots, not one per comment. A subscriber
+    whose queue fills up, or every
+    subscriber when the connection is lost, is closed so the client can
+    reconnect and catch up instead of silently missing events.
+    """
+
+    def __init__(self, dsn: str, queue_size: int):
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self._connection: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: Set[Subscription] = set()
+        self._received = 0
+        self._dropped_subscribers = 0
+
+    @classmethod
+    def from_settings(cls) -> "CommentChangeFeed":
+        # asyncpg takes a plain libpq URL, without SQLAlchemy's driver suffix
+        url = make_url(settings.POSTGRES_CONNECTION_STRING).set(drivername="postgresql")
+        return cls(url.render_as_string(hide_password=False), settings.COMMENT_STREAM_QUEUE_SIZE)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[Subscription]:
+        await self.listen()
+        queue: Subscription = asyncio.Queue(self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "listening": int(self._connection is not None),
+            "subscribers": len(self._subscribers),
+            "received": self._received,
+            "dropped_subscribers": self._dropped_subscribers,
+        }
+
+    async def stop(self) -> None:
+        for queue in list(self._subscribers):
+            self._close(queue)
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    async def listen(self) -> None:
+        """Open the shared LISTEN connection unless it is already open."""
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            connection = await asyncpg.connect(self.dsn)
+            connection.add_termination_listener(self._on_terminated)
+            await connection.add_listener(COMMENT_CHANGES_CHANNEL, self._on_notification)
+            self._connection = connection
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            events = _EVENTS.validate_json(payload)
+        except ValidationError:
+            return
+        self._received += len(events)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(events)
+            except asyncio.QueueFull:
+                self._dropped_subscribers += 1
+                self._close(queue)
+
+    def _on_terminated(self, connection: Any) -> None:
+        if connection is self._connection:
+            self._connection = None
+            for queue in list(self._subscribers):
+                self._close(queue)
+
+    def _close(self, queue: Subscription) -> None:
+        self._subscribers.discard(queue)
+        # Make room for the end-of-stream marker
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+
+_comment_change_feed: Optional[CommentChangeFeed] = None
+
+
+def get_comment_change_feed() -> CommentChangeFeed:
+    """Return the process-wide comment change feed, creating it on first use."""
+    global _comment_change_feed
+    if _comment_change_feed is None:
+        _comment_change_feed = CommentChangeFeed.from_settings()
+    return _comment_change_feed
+
+
+async def stop_comment_change_feed() -> None:
+    global _comment_change_feed
+    if _comment_change_feed is not None:
+        await _comment_change_feed.stop()
+        _comment_change_feed = None
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import settings
+from infrastructure.db.session import engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+_SUBTRACT_FROM_STATS = [
+    'UPDATE comment_stats_by_user AS stats SET comment_count = stats.comment_count - dropped.n '
+    'FROM (SELECT user_id, count(*) AS n FROM "{partition}" '
+    'WHERE is_deleted = false AND user_id IS NOT NULL GROUP BY user_id) AS dropped '
+    'WHERE stats.user_id = dropped.user_id',
+    # A day is the sum of its shards, so take the whole count off shard 0
+    'INSERT INTO comment_stats_by_day AS stats (day, shard, comment_count) '
+    'SELECT created_at::date, 0, -count(*) FROM "{partition}" '
+    'WHERE is_deleted = false GROUP BY created_at::date '
+    'ON CONFLICT (day, shard) DO UPDATE SET comment_count = stats.comment_count + EXCLUDED.comment_count',
+]
+
+_BUMP_WRITE_VERSION = "UPDATE write_versions SET version = version + 1 WHERE table_name = 'comments' AND shard = 0"
+
+
+@dataclass
+class CommentPartition:
+    name: str
+    # Exclusive; None for the default partition, which has no range
+    upper_bound: Optional[datetime]
+
+
+class CommentPartitionManager:
+    """
+    Maintains the monthly partitions of the comments table.
+
+    New partitions are created ahead of time by the ensure_comment_partitions()
+    database function, so inserts never fall through to the default partition.
+    Old rows are removed by detaching and dropping whole partitions, which
+    frees their space at once instead of leaving dead tuples for VACUUM.
+    """
+
+    def __init__(self, engine: AsyncEngine, lock_timeout_ms: int = 5000):
+        self.engine = engine
+        self.lock_timeout_ms = lock_timeout_ms
+
+    async def ensure(self, months_ahead: int) -> int:
+        """Create any missing partition up to ``months_ahead`` months out; return how many were created."""
+        async with self.engine.begin() as connection:
+            result = await connection.execute(
+                text("SELECT ensure_comment_partitions(:months_ahead)"), {"months_ahead": months_ahead}
+            )
+            return int(result.scalar_one())
+
+    async def list(self) -> List[CommentPartition]:
+        """Return the partitions of comments, oldest first, the default partition last."""
+        async with self.engine.connect() as connection:
+            result = await connection.execute(text(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'comments'::regclass"
+            ))
+            partitions = [
+                CommentPartition(name=name, upper_bound=self._upper_bound(bound)) for name, bound in result.all()
+            ]
+        return sorted(partitions, key=lambda partition: (partition.upper_bound is None, partition.upper_bound))
+
+    async def drop_before(self, cutoff: datetime, dry_run: bool = False) -> List[str]:
+        """
+        Drop every partition whose rows were all created before ``cutoff`` and
+        return their names. Partitions that straddle the cutoff are kept.
+        """
+        expired = [
+            partition.name for partition in await self.list()
+            if partition.upper_bound is not None and partition.upper_bound <= cutoff
+        ]
+        if dry_run:
+            return expired
+
+        for name in expired:
+            # Detaching locks out every query on comments, so give up rather
+            # than queue traffic behind a long-running transaction; a later
+            # run retries. DETACH ... CONCURRENTLY is not allowed while a
+            # default partition exists.
+            async with self.engine.begin() as connection:
+                await connection.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+                # Dropping fires no triggers, so take the partition's rows out
+                # of the comment stats rollups by hand. Only writes to this
+                # partition wait while it is counted; the detach comes last so
+                # comments itself is locked just for the moment it takes.
+                await connection.execute(text(f'LOCK TABLE "{name}" IN SHARE MODE'))
+                for statement in _SUBTRACT_FROM_STATS:
+                    await connection.execute(text(statement.format(partition=name)))
+                # Nor the write counter, which the comment list ETags are built from
+                await connection.execute(text(_BUMP_WRITE_VERSION))
+                await connection.execute(text(f'ALTER TABLE comments DETACH PARTITION "{name}"'))
+                await connection.execute(text(f'DROP TABLE "{name}"'))
+        return expired
+
+    @staticmethod
+    def _upper_bound(bound: str) -> Optional[datetime]:
+        match = _UPPER_BOUND.search(bound)
+        return datetime.fromisoformat(match.group(1)) if match else None
+
+
+async def maintain_comment_partitions(manager: CommentPartitionManager, months_ahead: int, interval: float) -> None:
+    """Keep future partitions in place for as long as the process runs."""
+    while True:
+        try:
+            await manager.ensure(months_ahead)
+        except Exception:
+            # Retried on the next round; the default partition takes any rows
+            # that arrive for a missing month in the meantime
+            logger.exception("Could not create comment partitions")
+        await asyncio.sleep(interval)
+
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+def start_comment_partition_maintenance() -> None:
+    global _maintenance_task
+    if _maintenance_task is None:
+        _maintenance_task = asyncio.create_task(maintain_comment_partitions(
+            CommentPartitionManager(default_engine),
+            settings.COMMENT_PARTITION_MONTHS_AHEAD,
+            settings.COMMENT_PARTITION_CHECK_INTERVAL_SECONDS,
+        ))
+
+
+async def stop_comment_partition_maintenance() -> None:
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        try:
+            await _maintenance_task
+        except asyncio.CancelledError:
+            pass
+        _maintenance_task = None
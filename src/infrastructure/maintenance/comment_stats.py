@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Union
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Rollup rows that disagree with a fresh count over comments; missing rows on
+# either side count as zero
+_DRIFT = {
+    "comment_stats_by_user": (
+        "SELECT key, counted, stored FROM ("
+        " SELECT coalesce(fresh.user_id, stats.user_id) AS key,"
+        " coalesce(fresh.n, 0) AS counted, coalesce(stats.comment_count, 0) AS stored"
+        " FROM (SELECT user_id, count(*) AS n FROM comments"
+        " WHERE is_deleted = false AND user_id IS NOT NULL GROUP BY user_id) AS fresh"
+        " FULL JOIN comment_stats_by_user AS stats ON stats.user_id = fresh.user_id"
+        ") AS compared WHERE counted <> stored ORDER BY key"
+    ),
+    "comment_stats_by_day": (
+        "SELECT key, counted, stored FROM ("
+        " SELECT coalesce(fresh.day, stats.day) AS key,"
+        " coalesce(fresh.n, 0) AS counted, coalesce(stats.comment_count, 0) AS stored"
+        " FROM (SELECT created_at::date AS day, count(*) AS n FROM comments"
+        " WHERE is_deleted = false GROUP BY created_at::date) AS fresh"
+        " FULL JOIN (SELECT day, sum(comment_count) AS comment_count FROM comment_stats_by_day GROUP BY day)"
+        " AS stats ON stats.day = fresh.day"
+        ") AS compared WHERE counted <> stored ORDER BY key"
+    ),
+}
+
+
+@dataclass
+class StatsDrift:
+    table: str
+    key: Union[int, date]
+    counted: int
+    stored: int
+
+
+class CommentStatsReconciler:
+    """
+    Checks the comment stats rollups against a full count over comments and
+    rebuilds them from scratch. Both read the whole table, so they are meant
+    for occasional maintenance runs, not for serving requests.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    async def drift(self) -> List[StatsDrift]:
+        """Return every rollup row that differs from a fresh count."""
+        drift: List[StatsDrift] = []
+        async with self.engine.connect() as connection:
+            # One snapshot for both comparisons
+            await connection.execution_options(isolation_level="REPEATABLE READ")
+            for table, query in _DRIFT.items():
+                result = await connection.execute(text(query))
+                drift.extend(
+                    StatsDrift(table=table, key=key, counted=counted, stored=stored)
+                    for key, counted, stored in result.all()
+                )
+        return drift
+
+    async def rebuild(self) -> None:
+        """Recount both rollups. Writes to comments wait until this commits."""
+        async with self.engine.begin() as connection:
+            await connection.execute(text("SELECT rebuild_comment_stats()"))
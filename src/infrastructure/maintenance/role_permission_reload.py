@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from application.services.role_permission_resolver import RolePermissionResolver, get_role_permission_resolver
+from config import settings
+from infrastructure.db.session import SessionLocal
+from infrastructure.repositories.sql_role_repository import SQLRoleRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def reload_role_permissions(resolver: RolePermissionResolver, session_factory: sessionmaker) -> int:
+    """Load every live role into ``resolver``; return how many were loaded."""
+    async with session_factory() as session:
+        return await resolver.reload(SQLRoleRepository(session))
+
+
+async def keep_role_permissions_loaded(
+    resolver: RolePermissionResolver, session_factory: sessionmaker, interval: float
+) -> None:
+    """Reload the role permission index for as long as the process runs."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reload_role_permissions(resolver, session_factory)
+        except Exception:
+            # The previous index stays in use until a later round succeeds
+            logger.exception("Could not reload role permissions")
+
+
+_reload_task: Optional[asyncio.Task] = None
+
+
+async def start_role_permission_reload() -> None:
+    """Load role permissions before the first request, then keep them current."""
+    global _reload_task
+    if _reload_task is not None:
+        return
+    resolver = get_role_permission_resolver()
+    try:
+        await reload_role_permissions(resolver, SessionLocal)
+    except Exception:
+        # Start anyway; until a reload succeeds every check is denied
+        logger.exception("Could not load role permissions")
+    _reload_task = asyncio.create_task(keep_role_permissions_loaded(
+        resolver, SessionLocal, settings.ROLE_PERMISSION_RELOAD_INTERVAL_SECONDS,
+    ))
+
+
+async def stop_role_permission_reload() -> None:
+    global _reload_task
+    if _reload_task is not None:
+        _reload_task.cancel()
+        try:
+            await _reload_task
+        except asyncio.CancelledError:
+            pass
+        _reload_task = None
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, func
+from sqlalchemy.dialects.postgresql import UUID as PgUUID, JSONB
+
+from infrastructure.db.base_class import Base
+
+
+class CommentArchiveOrmModel(Base):
+    """Soft-deleted comments moved out of the comments table by the purge job."""
+    __tablename__ = "comments_archive"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    description = Column(Text)
+    user_id = Column(Integer)
+
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(Integer)
+    updated_at = Column(DateTime, nullable=False)
+    updated_by = Column(Integer)
+
+    is_deleted = Column(Boolean)
+    deleted_at = Column(DateTime)
+    deleted_by = Column(Integer)
+
+    archived_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+class RoleArchiveORM(Base):
+    """Soft-deleted roles moved out of the roles table by the purge job."""
+    __tablename__ = "roles_archive"
+
+    id = Column(PgUUID(as_uuid=True), primary_key=True)
+    name = Column(String, nullable=False)
+    permissions = Column(JSONB, nullable=False)
+
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    created_by = Column(PgUUID(as_uuid=True), nullable=True)
+    updated_by = Column(PgUUID(as_uuid=True), nullable=True)
+    is_deleted = Column(Boolean, nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    deleted_by = Column(PgUUID(as_uuid=True), nullable=True)
+
+    archived_at = Column(DateTime, server_default=func.now(), nullable=False)
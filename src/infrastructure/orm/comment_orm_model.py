@@ -1,18 +1,24 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, func, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, func, Text, ForeignKey, Index, text, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from domain.models.comment import Comment
 from infrastructure.db.base_class import Base
 
+# Text search configuration used both to build search_vector and to parse queries
+SEARCH_CONFIG = "english"
+
 class CommentOrmModel(Base):
     __tablename__ = "comments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # The table is range-partitioned on created_at, so its primary key has to
+    # include it; ids alone stay unique through the sequence
+    id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, index=True)
     description = Column(Text)
     user_id = Column(Integer, ForeignKey("users.id"))
     
-    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=func.current_timestamp())
     created_by = Column(Integer)
     updated_at = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
     updated_by = Column(Integer)
@@ -20,10 +26,49 @@ class CommentOrmModel(Base):
     is_deleted = Column(Boolean, default=False)
     deleted_at = Column(DateTime)
     deleted_by = Column(Integer)
+
+    # Maintained by Postgres from name and description; deferred so it is only
+    # loaded when a query asks for it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_CONFIG}', coalesce(name, '') || ' ' || coalesce(description, ''))",
+            persisted=True
+        )
+    ))
     
     # Relationship with User model
     user = relationship("UserOrmModel", back_populates="comments")
 
+    __table_args__ = (
+        # Partial indexes over live rows only, so soft-deleted comments do not
+        # slow down the keyset-paginated listings
+        Index(
+            "ix_comments_live_created_at_id", "created_at", "id",
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index(
+            "ix_comments_live_user_id_created_at_id", "user_id", "created_at", "id",
+            postgresql_where=text("is_deleted = false")
+        ),
+        # Deleted rows included: changes-since sync and exports walk updated_at
+        Index("ix_comments_updated_at_id", "updated_at", "id"),
+        Index("ix_comments_user_id_updated_at", "user_id", "updated_at"),
+        # Soft-deleted rows only, in the order the purge job walks them
+        Index(
+            "ix_comments_deleted_deleted_at_id", "deleted_at", "id",
+            postgresql_where=text("is_deleted = true")
+        ),
+        Index(
+            "ix_comments_live_search_vector", "search_vector",
+            postgresql_using="gin", postgresql_where=text("is_deleted = false")
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Rows are still identified by id alone
+    __mapper_args__ = {"primary_key": [id]}
+
     @staticmethod
     def from_domain(comment: Comment):
         """Create a CommentOrmModel instance from a Comment domain model."""
@@ -51,6 +96,7 @@ class CommentOrmModel(Base):
             created_by=self.created_by,
             updated_at=self.updated_at,
             updated_by=self.updated_by,
+            is_deleted=bool(self.is_deleted),
             deleted_at=self.deleted_at,
             deleted_by=self.deleted_by
         ) 
\ No newline at end of file
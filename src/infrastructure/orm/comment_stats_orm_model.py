@@ -0,0 +1,27 @@
+from sqlalchemy import BigInteger, Column, Date, Integer, SmallInteger
+
+from domain.models.comment import CommentCountByUser
+from infrastructure.db.base_class import Base
+
+
+class CommentStatsByUserOrmModel(Base):
+    """Live comments per user, maintained by triggers on comments."""
+    __tablename__ = "comment_stats_by_user"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    comment_count = Column(BigInteger, nullable=False)
+
+    def to_domain(self) -> CommentCountByUser:
+        return CommentCountByUser(user_id=self.user_id, count=self.comment_count)
+
+
+class CommentStatsByDayOrmModel(Base):
+    """
+    One shard of the live comments per creation day (UTC), maintained by
+    triggers on comments. A day's count is the sum over its shards.
+    """
+    __tablename__ = "comment_stats_by_day"
+
+    day = Column(Date, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, autoincrement=False, server_default="0")
+    comment_count = Column(BigInteger, nullable=False)
@@ -2,13 +2,11 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Boolean, DateTime, func
+from sqlalchemy import Column, String, Boolean, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID as PgUUID, JSONB
-from sqlalchemy.ext.declarative import declarative_base
 
-from src.domain.models.role import Role
-
-Base = declarative_base()
+from domain.models.role import Role
+from infrastructure.db.base_class import Base
 
 
 class RoleORM(Base):
@@ -28,13 +26,26 @@ class RoleORM(Base):
     deleted_at = Column(DateTime, nullable=True)
     deleted_by = Column(PgUUID(as_uuid=True), nullable=True)
 
+    __table_args__ = (
+        # Every read filters on is_deleted = false; index only the live rows
+        Index("ix_roles_live_created_at_id", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        # Serves the permission lookups (@> and ?|) over live roles
+        Index(
+            "ix_roles_live_permissions", "permissions",
+            postgresql_using="gin", postgresql_where=text("is_deleted = false"),
+        ),
+        # Soft-deleted rows only, in the order the purge job walks them
+        Index("ix_roles_deleted_deleted_at_id", "deleted_at", "id", postgresql_where=text("is_deleted = true")),
+    )
+
     @classmethod
     def from_domain(cls, role: Role) -> "RoleORM":
         """Convert domain model to ORM model"""
         return cls(
             id=role.id,
             name=role.name,
-            permissions=role.permissions,
+            # JSONB cannot serialize UUID objects, so store their string form
+            permissions=[str(permission) for permission in role.permissions],
             created_at=role.created_at,
             updated_at=role.updated_at,
             created_by=role.created_by,
@@ -49,7 +60,8 @@ class RoleORM(Base):
         return Role(
             id=self.id,
             name=self.name,
-            permissions=self.permissions,
+            # Stored as strings, see from_domain
+            permissions=[UUID(permission) for permission in self.permissions],
             created_at=self.created_at,
             updated_at=self.updated_at,
             created_by=self.created_by,
@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, SmallInteger, String
+
+from infrastructure.db.base_class import Base
+
+
+class WriteVersionOrmModel(Base):
+    """One shard of a table's write counter, bumped by statement triggers on that table."""
+    __tablename__ = "write_versions"
+
+    table_name = Column(String, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False, server_default="0")
@@ -0,0 +1,211 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from domain.models.comment import Comment, CommentCountByDay, CommentCountByUser
+from domain.repositories.comment_repository import CommentRepository
+from infrastructure.db.session import SessionLocal
+from infrastructure.repositories.sql_comment_repository import SQLCommentRepository
+
+
+class CommentWriteBatcher:
+    """
+    Collects comments from concurrent callers and inserts them with one
+    multi-row INSERT and one commit per batch, on a session of its own.
+
+    A batch is flushed when it holds ``max_batch_size`` comments or when its
+    first comment has waited ``max_linger`` seconds. Each caller waits for the
+    batch holding its comment and gets the generated id set on it, or the
+    error that made the insert fail.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_batch_size: int,
+        max_linger: float,
+        repository_factory: Callable[[AsyncSession], CommentRepository] = SQLCommentRepository
+    ):
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.max_batch_size = max_batch_size
+        self.max_linger = max_linger
+        self._queue: "asyncio.Queue[Tuple[Comment, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._batches = 0
+        self._inserted = 0
+
+    @classmethod
+    def from_settings(cls) -> "CommentWriteBatcher":
+        return cls(
+            SessionLocal,
+            max_batch_size=settings.COMMENT_WRITE_BATCH_MAX_SIZE,
+            max_linger=settings.COMMENT_WRITE_BATCH_MAX_LINGER_MS / 1000,
+        )
+
+    async def add(self, comment: Comment) -> None:
+        """Queue a comment and wait until the batch holding it is committed."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((comment, future))
+        await future
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "batches": self._batches,
+            "inserted": self._inserted,
+            "average_batch_size": self._inserted / self._batches if self._batches else 0.0,
+        }
+
+    async def stop(self) -> None:
+        """Flush everything already queued, then stop the worker."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_linger
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    else:
+                        # Past the deadline, still take whatever is already waiting
+                        item = self._queue.get_nowait()
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                batch.append(item)
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[Comment, asyncio.Future]]) -> None:
+        # Callers that gave up while queued are dropped, not inserted
+        batch = [(comment, future) for comment, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            async with self.session_factory() as session:
+                await self.repository_factory(session).add_many([comment for comment, _ in batch])
+        except Exception as error:
+            if len(batch) > 1:
+                # One bad row fails the whole statement; retry one by one so
+                # only the caller that sent it sees the error
+                for item in batch:
+                    await self._flush([item])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(error)
+            return
+
+        self._batches += 1
+        self._inserted += len(batch)
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+
+class BatchingCommentRepository(CommentRepository):
+    """
+    Hands single comment inserts to a CommentWriteBatcher so that concurrent
+    requests share one INSERT and one commit. Everything else goes to the
+    wrapped repository.
+    """
+
+    def __init__(self, repository: CommentRepository, batcher: CommentWriteBatcher):
+        self.repository = repository
+        self.batcher = batcher
+
+    async def add(self, comment: Comment) -> None:
+        await self.batcher.add(comment)
+
+    async def add_many(self, comments: List[Comment]) -> None:
+        # Already a single statement, so there is nothing to coalesce
+        await self.repository.add_many(comments)
+
+    async def get_by_id(self, id: int) -> Optional[Comment]:
+        return await self.repository.get_by_id(id)
+
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        return await self.repository.get_many(ids)
+
+    async def get_by_user_id(self, user_id: int) -> List[Comment]:
+        return await self.repository.get_by_user_id(user_id)
+
+    async def get_all(self) -> List[Comment]:
+        return await self.repository.get_all()
+
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Comment]:
+        return await self.repository.get_page(limit, after)
+
+    async def get_page_by_user_id(
+        self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Comment]:
+        return await self.repository.get_page_by_user_id(user_id, limit, after)
+
+    async def get_changes(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None, lag: timedelta = timedelta(0)
+    ) -> List[Comment]:
+        return await self.repository.get_changes(limit, after, lag)
+
+    async def get_version(self) -> int:
+        return await self.repository.get_version()
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Comment]:
+        return await self.repository.search(query, limit, offset)
+
+    async def get_counts_by_user(self, limit: int, after_user_id: Optional[int] = None) -> List[CommentCountByUser]:
+        return await self.repository.get_counts_by_user(limit, after_user_id)
+
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        return await self.repository.get_counts_by_day(since, until)
+
+    def stream(
+        self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Comment]:
+        return self.repository.stream(user_id, updated_since)
+
+    async def update(self, id: int, changes: Dict[str, Any], updated_by: int) -> Optional[Comment]:
+        return await self.repository.update(id, changes, updated_by)
+
+    async def delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
+        return await self.repository.delete(id, deleted_by)
+
+
+_comment_write_batcher: Optional[CommentWriteBatcher] = None
+
+
+def get_comment_write_batcher() -> CommentWriteBatcher:
+    """Return the process-wide comment write batcher, creating it on first use."""
+    global _comment_write_batcher
+    if _comment_write_batcher is None:
+        _comment_write_batcher = CommentWriteBatcher.from_settings()
+    return _comment_write_batcher
+
+
+async def stop_comment_write_batcher() -> None:
+    global _comment_write_batcher
+    if _comment_write_batcher is not None:
+        await _comment_write_batcher.stop()
+        _comment_write_batcher = None
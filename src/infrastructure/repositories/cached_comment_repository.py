@@ -0,0 +1,118 @@
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from domain.models.comment import Comment, CommentCountByDay, CommentCountByUser
+from domain.repositories.comment_repository import CommentRepository
+from infrastructure.cache.comment_cache import COMMENT_NOT_FOUND, comment_cache
+from utils.cache import TTLCache
+
+
+class CachedCommentRepository(CommentRepository):
+    """
+    Serves get_by_id from an in-process cache in front of another comment
+    repository, remembering missing ids as well. Every write through this
+    repository drops the affected entries; all other reads are passed through.
+    """
+
+    def __init__(
+        self,
+        repository: CommentRepository,
+        cache: TTLCache[int, Union[Comment, object]] = comment_cache
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    async def add(self, comment: Comment) -> None:
+        await self.repository.add(comment)
+        self._invalidate(comment.id)
+
+    async def add_many(self, comments: List[Comment]) -> None:
+        await self.repository.add_many(comments)
+        for comment in comments:
+            self._invalidate(comment.id)
+
+    async def get_by_id(self, id: int) -> Optional[Comment]:
+        cached = self.cache.get(id)
+        if cached is COMMENT_NOT_FOUND:
+            return None
+        if cached is not None:
+            # Hand out copies so callers cannot change the cached instance
+            return cached.model_copy()
+
+        comment = await self.repository.get_by_id(id)
+        self.cache.set(id, comment.model_copy() if comment is not None else COMMENT_NOT_FOUND)
+        return comment
+
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        found: Dict[int, Comment] = {}
+        missing: List[int] = []
+        for id in ids:
+            cached = self.cache.get(id)
+            if cached is None:
+                missing.append(id)
+            elif cached is not COMMENT_NOT_FOUND:
+                found[id] = cached.model_copy()
+
+        if missing:
+            # Only the ids the cache could not answer go to the database
+            loaded = await self.repository.get_many(missing)
+            for id in missing:
+                comment = loaded.get(id)
+                self.cache.set(id, comment.model_copy() if comment is not None else COMMENT_NOT_FOUND)
+                if comment is not None:
+                    found[id] = comment
+        return {id: found[id] for id in ids if id in found}
+
+    async def get_by_user_id(self, user_id: int) -> List[Comment]:
+        return await self.repository.get_by_user_id(user_id)
+
+    async def get_all(self) -> List[Comment]:
+        return await self.repository.get_all()
+
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Comment]:
+        return await self.repository.get_page(limit, after)
+
+    async def get_page_by_user_id(
+        self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Comment]:
+        return await self.repository.get_page_by_user_id(user_id, limit, after)
+
+    async def get_changes(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None, lag: timedelta = timedelta(0)
+    ) -> List[Comment]:
+        return await self.repository.get_changes(limit, after, lag)
+
+    async def get_version(self) -> int:
+        return await self.repository.get_version()
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Comment]:
+        return await self.repository.search(query, limit, offset)
+
+    async def get_counts_by_user(self, limit: int, after_user_id: Optional[int] = None) -> List[CommentCountByUser]:
+        return await self.repository.get_counts_by_user(limit, after_user_id)
+
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        return await self.repository.get_counts_by_day(since, until)
+
+    def stream(
+        self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Comment]:
+        return self.repository.stream(user_id, updated_since)
+
+    async def update(self, id: int, changes: Dict[str, Any], updated_by: int) -> Optional[Comment]:
+        try:
+            return await self.repository.update(id, changes, updated_by)
+        finally:
+            self._invalidate(id)
+
+    async def delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
+        try:
+            return await self.repository.delete(id, deleted_by)
+        finally:
+            self._invalidate(id)
+
+    def _invalidate(self, id: Optional[int]) -> None:
+        if id is not None:
+            self.cache.invalidate(id)
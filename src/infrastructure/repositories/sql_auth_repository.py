@@ -1,17 +1,34 @@
 import datetime
-from fastapi import HTTPException
+from typing import Optional
+
+from fastapi import HTTPException, status
+from jose import jwt, JWTError, ExpiredSignatureError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from domain.models.auth import Login, Token
+from config import settings
+from domain.models.auth import Login, Token, TokenPayload
+from domain.models.user import User
 from domain.repositories.auth_repository import AuthRepository
 from infrastructure.orm.user_orm_model import UserOrmModel
-from utils.security import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from utils.password_hasher import PasswordHasher, get_password_hasher
+from utils.security import (
+    create_access_token,
+    create_refresh_token,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    TRUSTED_ACCESS_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_TYPE,
+    SECRET_KEY,
+    ALGORITHM,
+)
 
 
 class SQLAuthRepository(AuthRepository):
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, password_hasher: Optional[PasswordHasher] = None):
         self.db_session = db_session
+        self.password_hasher = password_hasher or get_password_hasher()
 
     async def login_access_token(self, form_data: Login) -> Token:
         """
@@ -20,11 +37,11 @@ class SQLAuthRepository(AuthRepository):
         # Query the user by email
         result = await self.db_session.execute(select(UserOrmModel).filter(UserOrmModel.email == form_data.email))
         orm_user = result.scalars().first()
-        
+
         if orm_user is None:
             raise HTTPException(status_code=400, detail="Wrong User")
-            
-        if not verify_password(form_data.password, orm_user.hashed_password):
+
+        if not await self.password_hasher.verify(form_data.password, orm_user.hashed_password):
             raise HTTPException(status_code=400, detail="Wrong Email / Password")
 
         user = orm_user.to_domain()
@@ -33,9 +50,64 @@ class SQLAuthRepository(AuthRepository):
         # In a real application, you would query these from the database
         role_id = 1  # Default role
         tenant_id = 1  # Default tenant
-            
+
+        if settings.TRUSTED_CLAIMS_TOKENS:
+            return self._create_trusted_tokens(user, role_id, tenant_id)
+
         # Create and return JWT token
         access_token_expires = datetime.timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         return Token(
             access_token=create_access_token(user.id, role_id, tenant_id, expires_delta=access_token_expires)
-        ) 
\ No newline at end of file
+        )
+
+    async def refresh_access_token(self, refresh_token: str) -> Token:
+        """
+        Exchange a refresh token for a new access token. The user is reloaded
+        so that the new token carries the current profile.
+        """
+        try:
+            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+            token_data = TokenPayload(**payload)
+        except ExpiredSignatureError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired")
+        except (JWTError, ValidationError):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Could not validate credentials")
+
+        if token_data.type != REFRESH_TOKEN_TYPE or token_data.sub is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Could not validate credentials")
+
+        result = await self.db_session.execute(select(UserOrmModel).filter(UserOrmModel.id == token_data.sub))
+        orm_user = result.scalars().first()
+
+        if orm_user is None or orm_user.is_deleted:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+        user = orm_user.to_domain()
+
+        if settings.TRUSTED_CLAIMS_TOKENS:
+            return self._create_trusted_tokens(user, token_data.role_id, token_data.tenant_id)
+
+        access_token_expires = datetime.timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        return Token(
+            access_token=create_access_token(
+                user.id, token_data.role_id, token_data.tenant_id, expires_delta=access_token_expires
+            ),
+            refresh_token=refresh_token
+        )
+
+    def _create_trusted_tokens(self, user: User, role_id: Optional[int], tenant_id: Optional[int]) -> Token:
+        # Profile fields only: users are not linked to roles yet, so there is
+        # no permission set to embed, and an empty one would deny everyone
+        claims = {
+            "trusted": True,
+            "username": user.username,
+            "email": user.email,
+        }
+        access_token_expires = datetime.timedelta(minutes=TRUSTED_ACCESS_TOKEN_EXPIRE_MINUTES)
+        refresh_token_expires = datetime.timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
+        return Token(
+            access_token=create_access_token(
+                user.id, role_id, tenant_id, expires_delta=access_token_expires, claims=claims
+            ),
+            refresh_token=create_refresh_token(user.id, role_id, tenant_id, expires_delta=refresh_token_expires)
+        )
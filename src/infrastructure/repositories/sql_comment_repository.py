@@ -1,29 +1,72 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy.sql import Select
+from sqlalchemy import Integer, any_, bindparam, update, delete, insert, tuple_, func
+from sqlalchemy.dialects.postgresql import ARRAY, websearch_to_tsquery
 
-from domain.models.comment import Comment
+from domain.models.comment import Comment, CommentCountByDay, CommentCountByUser
 from domain.repositories.comment_repository import CommentRepository
-from infrastructure.orm.comment_orm_model import CommentOrmModel
+from infrastructure.orm.comment_orm_model import SEARCH_CONFIG, CommentOrmModel
+from infrastructure.orm.comment_stats_orm_model import CommentStatsByDayOrmModel, CommentStatsByUserOrmModel
+from infrastructure.orm.write_version_orm_model import WriteVersionOrmModel
+from utils.single_flight import SingleFlight
+
+# Rows fetched per round trip when streaming from a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+# Shared by every repository in this worker process, so concurrent requests
+# for the same comment run one SELECT between them
+comment_reads: SingleFlight[int, Optional[Comment]] = SingleFlight()
 
 class SQLCommentRepository(CommentRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
     async def add(self, comment: Comment) -> None:
-        orm_comment = CommentOrmModel.from_domain(comment)
-        self.db_session.add(orm_comment)
-        await self.db_session.flush()
-        # Refresh to get the generated ID
-        await self.db_session.refresh(orm_comment)
-        # Update the domain model with the generated ID
-        comment.id = orm_comment.id
+        # INSERT ... RETURNING hands back the generated ID and defaults in the
+        # same round trip, so no flush + refresh SELECT is needed
+        result = await self.db_session.execute(
+            insert(CommentOrmModel)
+            .values(**self._insert_values(comment))
+            .returning(CommentOrmModel.id, CommentOrmModel.created_at, CommentOrmModel.updated_at)
+        )
+        row = result.one()
+        # Update the domain model with the generated values
+        comment.id = row.id
+        comment.created_at = row.created_at
+        comment.updated_at = row.updated_at
+        await self.db_session.commit()
+
+    async def add_many(self, comments: List[Comment]) -> None:
+        if not comments:
+            return
+
+        # One multi-row INSERT ... RETURNING; sort_by_parameter_order keeps the
+        # returned rows aligned with the input list
+        result = await self.db_session.execute(
+            insert(CommentOrmModel).returning(
+                CommentOrmModel.id,
+                CommentOrmModel.created_at,
+                CommentOrmModel.updated_at,
+                sort_by_parameter_order=True
+            ),
+            [self._insert_values(comment) for comment in comments]
+        )
+        for comment, row in zip(comments, result.all()):
+            comment.id = row.id
+            comment.created_at = row.created_at
+            comment.updated_at = row.updated_at
         await self.db_session.commit()
 
     async def get_by_id(self, id: int) -> Optional[Comment]:
+        comment = await comment_reads.do(id, lambda: self._get_by_id(id))
+        # Callers that shared the flight must not share one instance
+        return comment.model_copy() if comment is not None else None
+
+    async def _get_by_id(self, id: int) -> Optional[Comment]:
         result = await self.db_session.execute(
             select(CommentOrmModel).filter(CommentOrmModel.id == id, CommentOrmModel.is_deleted == False)
         )
@@ -33,6 +76,20 @@ class SQLCommentRepository(CommentRepository):
             return None
 
         return orm_comment.to_domain()
+
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        if not ids:
+            return {}
+        # id = ANY(:ids) binds the whole list as one array parameter, so there
+        # is one round trip and one statement to prepare whatever the count
+        result = await self.db_session.execute(
+            select(CommentOrmModel).filter(
+                CommentOrmModel.id == any_(bindparam("ids", list(ids), type_=ARRAY(Integer))),
+                CommentOrmModel.is_deleted == False
+            )
+        )
+        found = {comment.id: comment.to_domain() for comment in result.scalars().all()}
+        return {id: found[id] for id in ids if id in found}
         
     async def get_by_user_id(self, user_id: int) -> List[Comment]:
         result = await self.db_session.execute(
@@ -50,17 +107,139 @@ class SQLCommentRepository(CommentRepository):
         )
         orm_comments = result.scalars().all()
         return [comment.to_domain() for comment in orm_comments]
+
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Comment]:
+        query = select(CommentOrmModel).filter(CommentOrmModel.is_deleted == False)
+        result = await self.db_session.execute(self._keyset_page(query, limit, after))
+        return [comment.to_domain() for comment in result.scalars().all()]
+
+    async def get_page_by_user_id(
+        self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Comment]:
+        query = select(CommentOrmModel).filter(
+            CommentOrmModel.user_id == user_id,
+            CommentOrmModel.is_deleted == False
+        )
+        result = await self.db_session.execute(self._keyset_page(query, limit, after))
+        return [comment.to_domain() for comment in result.scalars().all()]
+
+    async def get_changes(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None, lag: timedelta = timedelta(0)
+    ) -> List[Comment]:
+        # Deleted rows are included on purpose: they are the tombstones
+        query = select(CommentOrmModel).filter(CommentOrmModel.updated_at < func.current_timestamp() - lag)
+        if after is not None:
+            query = query.filter(tuple_(CommentOrmModel.updated_at, CommentOrmModel.id) > tuple_(*after))
+        query = query.order_by(CommentOrmModel.updated_at, CommentOrmModel.id).limit(limit)
+        result = await self.db_session.execute(query)
+        return [comment.to_domain() for comment in result.scalars().all()]
+
+    async def get_version(self) -> int:
+        # The write counter is bumped inside each writing transaction, so it
+        # moves exactly when a change becomes visible; max(updated_at) holds
+        # transaction start times and can miss a slow writer's commit
+        result = await self.db_session.execute(
+            select(func.coalesce(func.sum(WriteVersionOrmModel.version), 0))
+            .filter(WriteVersionOrmModel.table_name == CommentOrmModel.__tablename__)
+        )
+        return int(result.scalar_one())
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Comment]:
+        # websearch_to_tsquery accepts free-form user input (quoted phrases,
+        # "or", leading "-") without raising syntax errors
+        ts_query = websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(CommentOrmModel.search_vector, ts_query)
+        result = await self.db_session.execute(
+            select(CommentOrmModel)
+            .filter(CommentOrmModel.is_deleted == False, CommentOrmModel.search_vector.bool_op("@@")(ts_query))
+            .order_by(rank.desc(), CommentOrmModel.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [comment.to_domain() for comment in result.scalars().all()]
+
+    async def get_counts_by_user(self, limit: int, after_user_id: Optional[int] = None) -> List[CommentCountByUser]:
+        # Read from the rollup the comments triggers keep current, so this
+        # costs one primary key range scan instead of a GROUP BY over comments.
+        # Counts drop to zero rather than disappearing when comments go.
+        query = select(CommentStatsByUserOrmModel).filter(CommentStatsByUserOrmModel.comment_count > 0)
+        if after_user_id is not None:
+            query = query.filter(CommentStatsByUserOrmModel.user_id > after_user_id)
+        result = await self.db_session.execute(query.order_by(CommentStatsByUserOrmModel.user_id).limit(limit))
+        return [stats.to_domain() for stats in result.scalars().all()]
+
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        # Each day is spread over a few shards to keep writers apart; add them up
+        count = func.sum(CommentStatsByDayOrmModel.comment_count)
+        query = select(CommentStatsByDayOrmModel.day, count).group_by(CommentStatsByDayOrmModel.day).having(count > 0)
+        if since is not None:
+            query = query.filter(CommentStatsByDayOrmModel.day >= since)
+        if until is not None:
+            query = query.filter(CommentStatsByDayOrmModel.day <= until)
+        result = await self.db_session.execute(query.order_by(CommentStatsByDayOrmModel.day))
+        return [CommentCountByDay(day=day, count=day_count) for day, day_count in result.all()]
+
+    async def stream(
+        self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Comment]:
+        query = select(CommentOrmModel).filter(CommentOrmModel.is_deleted == False)
+        if user_id is not None:
+            query = query.filter(CommentOrmModel.user_id == user_id)
+        if updated_since is not None:
+            query = query.filter(CommentOrmModel.updated_at >= updated_since)
+        query = query.order_by(CommentOrmModel.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+
+        result = await self.db_session.stream_scalars(query)
+        async for orm_comment in result:
+            yield orm_comment.to_domain()
+
+    @staticmethod
+    def _insert_values(comment: Comment) -> Dict[str, Any]:
+        return {
+            "name": comment.name,
+            "description": comment.description,
+            "user_id": comment.user_id,
+            "created_by": comment.created_by,
+            "is_deleted": False,
+        }
+
+    @staticmethod
+    def _keyset_page(query: Select, limit: int, after: Optional[Tuple[datetime, int]]) -> Select:
+        # Seek past the last seen (created_at, id) instead of using OFFSET, so
+        # every page costs the same no matter how deep into the table it is
+        if after is not None:
+            query = query.filter(
+                tuple_(CommentOrmModel.created_at, CommentOrmModel.id) > tuple_(*after),
+                # Implied by the row comparison, but only a plain range on the
+                # partition key lets Postgres skip the older partitions
+                CommentOrmModel.created_at >= after[0],
+            )
+        return query.order_by(CommentOrmModel.created_at, CommentOrmModel.id).limit(limit)
         
-    async def update(self, comment: Comment) -> None:
-        orm_comment = CommentOrmModel.from_domain(comment)
-        await self.db_session.merge(orm_comment)
+    async def update(self, id: int, changes: Dict[str, Any], updated_by: int) -> Optional[Comment]:
+        # A single UPDATE ... RETURNING both applies the change and tells us
+        # whether the comment exists, without loading it first
+        result = await self.db_session.execute(
+            update(CommentOrmModel)
+            .where(CommentOrmModel.id == id, CommentOrmModel.is_deleted == False)
+            .values(**changes, updated_by=updated_by)
+            .returning(CommentOrmModel)
+            .execution_options(synchronize_session=False)
+        )
+        orm_comment = result.scalars().first()
+        # Convert before commit expires the ORM instance
+        comment = orm_comment.to_domain() if orm_comment is not None else None
         await self.db_session.commit()
+        return comment
         
-    async def delete(self, id: int) -> None:
+    async def delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
         # Soft delete - update is_deleted flag and deleted_at timestamp
-        await self.db_session.execute(
+        result = await self.db_session.execute(
             update(CommentOrmModel)
-            .where(CommentOrmModel.id == id)
-            .values(is_deleted=True, deleted_at=datetime.utcnow())
+            .where(CommentOrmModel.id == id, CommentOrmModel.is_deleted == False)
+            .values(is_deleted=True, deleted_at=datetime.utcnow(), deleted_by=deleted_by)
         )
-        await self.db_session.commit() 
\ No newline at end of file
+        await self.db_session.commit()
+        return result.rowcount > 0 
\ No newline at end of file
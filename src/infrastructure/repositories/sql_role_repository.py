@@ -1,13 +1,14 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, any_, bindparam, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PgUUID, array
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.models.role import Role
-from src.domain.repositories.role_repository import RoleRepository
-from src.infrastructure.orm.role_orm_model import RoleORM
+from domain.models.role import Role
+from domain.repositories.role_repository import RoleRepository
+from infrastructure.orm.role_orm_model import RoleORM
 
 
 class SQLRoleRepository(RoleRepository):
@@ -18,11 +19,21 @@ class SQLRoleRepository(RoleRepository):
 
     async def add(self, role: Role) -> Role:
         """Add a new role to the repository"""
+        # Let the database fill in the id and server defaults and hand the
+        # full row back from the INSERT itself instead of a refresh SELECT
         role_orm = RoleORM.from_domain(role)
-        self.session.add(role_orm)
-        await self.session.flush()
-        await self.session.refresh(role_orm)
-        return role_orm.to_domain()
+        values = {
+            column.key: getattr(role_orm, column.key) for column in RoleORM.__table__.columns
+            if getattr(role_orm, column.key) is not None
+        }
+        result = await self.session.execute(
+            insert(RoleORM).values(**values).returning(RoleORM)
+        )
+        role = result.scalars().one().to_domain()
+        # Committed here, like the other repositories, so callers caching the
+        # result never hold a change that could still be rolled back
+        await self.session.commit()
+        return role
 
     async def get_by_id(self, role_id: UUID) -> Optional[Role]:
         """Get a role by its ID"""
@@ -38,27 +49,78 @@ class SQLRoleRepository(RoleRepository):
             
         return role_orm.to_domain()
 
+    async def get_many(self, role_ids: List[UUID]) -> Dict[UUID, Role]:
+        """Get the roles with the given IDs, keyed by ID in the order asked for"""
+        if not role_ids:
+            return {}
+        # One query for all IDs, bound as a single array parameter
+        query = select(RoleORM).where(
+            RoleORM.id == any_(bindparam("ids", list(role_ids), type_=ARRAY(PgUUID(as_uuid=True)))),
+            RoleORM.is_deleted == False
+        )
+        result = await self.session.execute(query)
+        found = {role_orm.id: role_orm.to_domain() for role_orm in result.scalars().all()}
+        return {role_id: found[role_id] for role_id in role_ids if role_id in found}
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Role]:
         """Get all roles with pagination"""
+        # A stable order keeps offset pages from overlapping or skipping rows
         query = select(RoleORM).where(
             RoleORM.is_deleted == False
-        ).offset(skip).limit(limit)
+        ).order_by(RoleORM.created_at, RoleORM.id).offset(skip).limit(limit)
         
         result = await self.session.execute(query)
         role_orms = result.scalars().all()
         
         return [role_orm.to_domain() for role_orm in role_orms]
 
-    async def update(self, role: Role) -> Role:
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[Role]:
+        """Return up to limit live roles ordered by (created_at, id), starting after the given key."""
+        query = select(RoleORM).where(RoleORM.is_deleted == False)
+        # Seek past the last seen key instead of using OFFSET, so rows deleted
+        # between pages cannot shift a live role out of the walk
+        if after is not None:
+            query = query.where(tuple_(RoleORM.created_at, RoleORM.id) > tuple_(*after))
+        query = query.order_by(RoleORM.created_at, RoleORM.id).limit(limit)
+
+        result = await self.session.execute(query)
+        return [role_orm.to_domain() for role_orm in result.scalars().all()]
+
+    async def get_by_permission(self, permission: UUID, skip: int = 0, limit: int = 100) -> List[Role]:
+        """Get the roles granting a permission, with pagination"""
+        # permissions @> '["<id>"]', a probe of the GIN index on live roles
+        return await self._get_page(RoleORM.permissions.contains([str(permission)]), skip, limit)
+
+    async def get_by_any_permission(self, permissions: List[UUID], skip: int = 0, limit: int = 100) -> List[Role]:
+        """Get the roles granting at least one of the given permissions, with pagination"""
+        if not permissions:
+            return []
+        # permissions ?| array[...], one GIN probe per id
+        return await self._get_page(
+            RoleORM.permissions.has_any(array([str(permission) for permission in permissions])), skip, limit
+        )
+
+    async def update(self, role: Role) -> Optional[Role]:
         """Update an existing role"""
         role_orm = RoleORM.from_domain(role)
-        
-        # Merge the updated role with the session
-        merged_role = await self.session.merge(role_orm)
-        await self.session.flush()
-        await self.session.refresh(merged_role)
-        
-        return merged_role.to_domain()
+
+        # One UPDATE ... RETURNING instead of merge, flush and a refresh SELECT
+        query = update(RoleORM).where(
+            RoleORM.id == role.id,
+            RoleORM.is_deleted == False
+        ).values(
+            name=role_orm.name,
+            permissions=role_orm.permissions,
+            updated_at=role_orm.updated_at or func.now(),
+            updated_by=role_orm.updated_by
+        ).returning(RoleORM)
+
+        result = await self.session.execute(query)
+        updated_orm = result.scalars().one_or_none()
+        # Convert before commit expires the ORM instance
+        updated_role = updated_orm.to_domain() if updated_orm is not None else None
+        await self.session.commit()
+        return updated_role
 
     async def delete(self, role_id: UUID, deleted_by: Optional[UUID] = None) -> bool:
         """Soft delete a role by its ID"""
@@ -74,6 +136,15 @@ class SQLRoleRepository(RoleRepository):
         )
         
         result = await self.session.execute(query)
-        await self.session.flush()
+        await self.session.commit()
         
-        return result.rowcount > 0 
\ No newline at end of file
+        return result.rowcount > 0
+
+    async def _get_page(self, condition: ColumnElement[bool], skip: int, limit: int) -> List[Role]:
+        query = select(RoleORM).where(
+            condition,
+            RoleORM.is_deleted == False
+        ).order_by(RoleORM.created_at, RoleORM.id).offset(skip).limit(limit)
+
+        result = await self.session.execute(query)
+        return [role_orm.to_domain() for role_orm in result.scalars().all()] 
\ No newline at end of file
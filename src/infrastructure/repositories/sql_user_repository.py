@@ -1,10 +1,20 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
+from sqlalchemy import Integer, any_, bindparam, func, or_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Session
 from sqlalchemy.future import select
-from domain.models.user import User
+from domain.models.user import User, UserSummary
 from domain.repositories.user_repository import UserRepository
 from infrastructure.orm.user_orm_model import UserOrmModel
+from infrastructure.orm.write_version_orm_model import WriteVersionOrmModel
+from infrastructure.cache.principal_cache import invalidate_principal
+from utils.single_flight import SingleFlight
+
+# Shared by every repository in this worker process, so concurrent lookups of
+# the same user, by id or by email, run one SELECT between them
+user_reads: SingleFlight[Tuple[str, object], Optional[User]] = SingleFlight()
 
 class SQLUserRepository(UserRepository):
     def __init__(self, db_session: Session):
@@ -16,12 +26,87 @@ class SQLUserRepository(UserRepository):
         users = [item.to_domain() for item in orm_users]
         return users
 
+    async def get_page(self, limit: int, after_id: Optional[int] = None) -> List[UserSummary]:
+        # Select only the public columns into plain rows: no password hashes,
+        # no ORM instances in the identity map, and a keyset on the primary
+        # key so each page reads just its own rows
+        query = select(UserOrmModel.id, UserOrmModel.username, UserOrmModel.email, UserOrmModel.created_at)
+        if after_id is not None:
+            query = query.filter(UserOrmModel.id > after_id)
+        result = await self.db_session.execute(query.order_by(UserOrmModel.id).limit(limit))
+        return [UserSummary.model_validate(row._mapping) for row in result]
+
+    async def get_many(self, user_ids: List[int]) -> Dict[int, UserSummary]:
+        if not user_ids:
+            return {}
+        # Public columns only, as in get_page; one array parameter for all ids
+        result = await self.db_session.execute(
+            select(UserOrmModel.id, UserOrmModel.username, UserOrmModel.email, UserOrmModel.created_at)
+            .filter(UserOrmModel.id == any_(bindparam("ids", list(user_ids), type_=ARRAY(Integer))))
+        )
+        found = {row.id: UserSummary.model_validate(row._mapping) for row in result}
+        return {user_id: found[user_id] for user_id in user_ids if user_id in found}
+
     async def add(self, user: User) -> None:
         orm_user = UserOrmModel.from_domain(user)
         await self.db_session.merge(orm_user)
         await self.db_session.commit()
+        # merge() overwrites an existing row when the id is already set
+        if user.id is not None:
+            invalidate_principal(user.id)
+
+    async def add_many_new(self, users: List[User]) -> None:
+        if not users:
+            return
+
+        # One multi-row INSERT; ON CONFLICT DO NOTHING skips rows whose
+        # username or email is taken, including by an earlier row of the same
+        # batch, instead of failing the whole statement
+        result = await self.db_session.execute(
+            insert(UserOrmModel)
+            .on_conflict_do_nothing()
+            .returning(UserOrmModel.id, UserOrmModel.username, UserOrmModel.email),
+            [
+                {
+                    "username": user.username,
+                    "email": user.email,
+                    "hashed_password": user.hashed_password,
+                    "is_deleted": False,
+                }
+                for user in users
+            ]
+        )
+        # Skipped rows return nothing, so match the inserted ones back by key;
+        # of two identical rows only the first can have been inserted
+        pending: Dict[Tuple[str, str], List[User]] = defaultdict(list)
+        for user in users:
+            pending[(user.username, user.email)].append(user)
+        for row in result.all():
+            pending[(row.username, row.email)].pop(0).id = row.id
+        await self.db_session.commit()
+
+    async def get_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        result = await self.db_session.execute(
+            select(UserOrmModel.username, UserOrmModel.email)
+            .filter(or_(UserOrmModel.username.in_(usernames), UserOrmModel.email.in_(emails)))
+        )
+        rows = result.all()
+        requested_usernames, requested_emails = set(usernames), set(emails)
+        return (
+            {row.username for row in rows if row.username in requested_usernames},
+            {row.email for row in rows if row.email in requested_emails},
+        )
 
     async def get_by_email(self, email: str) -> Optional[User]:
+        user = await user_reads.do(("email", email), lambda: self._get_by_email(email))
+        # Callers that shared the flight must not share one instance
+        return user.model_copy() if user is not None else None
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        user = await user_reads.do(("id", user_id), lambda: self._get_by_id(user_id))
+        return user.model_copy() if user is not None else None
+
+    async def _get_by_email(self, email: str) -> Optional[User]:
         result = await self.db_session.execute(select(UserOrmModel).filter(UserOrmModel.email == email))
         orm_user = result.scalars().first()
 
@@ -31,7 +116,7 @@ class SQLUserRepository(UserRepository):
         user = orm_user.to_domain()
         return user
         
-    async def get_by_id(self, user_id: int) -> Optional[User]:
+    async def _get_by_id(self, user_id: int) -> Optional[User]:
         result = await self.db_session.execute(select(UserOrmModel).filter(UserOrmModel.id == user_id))
         orm_user = result.scalars().first()
 
@@ -39,4 +124,12 @@ class SQLUserRepository(UserRepository):
             return None
 
         user = orm_user.to_domain()
-        return user
\ No newline at end of file
+        return user
+
+    async def get_version(self) -> int:
+        # Bumped by a trigger in each writing transaction, see SQLCommentRepository.get_version
+        result = await self.db_session.execute(
+            select(func.coalesce(func.sum(WriteVersionOrmModel.version), 0))
+            .filter(WriteVersionOrmModel.table_name == UserOrmModel.__tablename__)
+        )
+        return int(result.scalar_one())
@@ -1,12 +1,38 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 # Type-ignore for modules without stubs
 from infrastructure.db.session import SessionLocal  # type: ignore
 import uvicorn
 from api.router import api_router  # type: ignore
+from utils.password_hasher import shutdown_password_hasher
+from infrastructure.repositories.batching_comment_repository import stop_comment_write_batcher
+from infrastructure.events.comment_change_feed import stop_comment_change_feed
+from infrastructure.maintenance.comment_partitions import (
+    start_comment_partition_maintenance,
+    stop_comment_partition_maintenance,
+)
+from infrastructure.maintenance.role_permission_reload import (
+    start_role_permission_reload,
+    stop_role_permission_reload,
+)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    start_comment_partition_maintenance()
+    await start_role_permission_reload()
+    yield
+    await stop_role_permission_reload()
+    await stop_comment_partition_maintenance()
+    # Commit comments still waiting in the write batcher before the pool goes
+    await stop_comment_write_batcher()
+    await stop_comment_change_feed()
+    shutdown_password_hasher()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(api_router, prefix='/api')
 
 
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces per-id lookups into batched ones.
+
+    Every key passed to ``load`` in the same turn of the event loop is queued,
+    and the whole queue goes to ``batch_load`` in one call on the next turn,
+    so code that awaits one related row per item (typically under
+    asyncio.gather) costs one query instead of one per item. Results, missing
+    keys included, are memoized for the life of the loader: create one per
+    request, so nothing outlives the session it reads through.
+
+    ``batch_load`` takes a list of distinct keys and returns the values found,
+    keyed the same way. Loaders reading through the same session should share
+    ``lock``, since a session cannot run two queries at once.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: Optional[int] = None,
+        lock: Optional[asyncio.Lock] = None
+    ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.lock = lock or asyncio.Lock()
+        self.batches = 0
+        self._futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._queue: List[K] = []
+        # Keep dispatched batches referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Return the value for ``key``, or None if there is none."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._queue:
+                # Runs once everything already scheduled for this turn has
+                # had its chance to queue a key
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        # A cancelled caller must not cancel the load for everyone sharing it
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Return the values for ``keys`` in order, with None for any that are missing."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            task = asyncio.create_task(self._load_batch(keys[start:start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, keys: List[K]) -> None:
+        try:
+            async with self.lock:
+                self.batches += 1
+                values = await self.batch_load(keys)
+        except BaseException as error:
+            # Forget the failed keys so a later load tries them again
+            for key in keys:
+                future = self._futures.pop(key)
+                if future.done():
+                    continue
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(values.get(key))
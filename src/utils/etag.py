@@ -0,0 +1,26 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from a data version and the request parameters that
+    shape the response, so each page of a listing gets its own validator.
+    """
+    raw = json.dumps([part.isoformat() if isinstance(part, datetime) else part for part in parts])
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
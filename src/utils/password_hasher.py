@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from config import settings
+from utils.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a worker pool so the event loop
+    keeps serving other requests while a password is being checked.
+
+    At most ``max_concurrency`` calls are handed to the pool at once; the rest
+    wait on a semaphore and are reported as ``queue_depth``.
+    """
+
+    def __init__(self, executor: Executor, max_concurrency: int):
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+
+    @classmethod
+    def from_settings(cls) -> "PasswordHasher":
+        max_workers = settings.PASSWORD_HASH_MAX_WORKERS
+        executor: Executor
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        return cls(executor, max_concurrency=max_workers)
+
+    async def hash(self, password: str) -> str:
+        """Generate a password hash without blocking the event loop."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._queued,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+
+_password_hasher: Optional[PasswordHasher] = None
+_bulk_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide password hasher, creating it on first use."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher.from_settings()
+    return _password_hasher
+
+
+def get_bulk_password_hasher() -> PasswordHasher:
+    """
+    Return the process-wide hasher for bulk imports: a process pool with one
+    worker per core, separate from the pool that serves logins.
+    """
+    global _bulk_password_hasher
+    if _bulk_password_hasher is None:
+        workers = settings.USER_IMPORT_HASH_WORKERS
+        _bulk_password_hasher = PasswordHasher(ProcessPoolExecutor(max_workers=workers), max_concurrency=workers)
+    return _bulk_password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _password_hasher, _bulk_password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
+    if _bulk_password_hasher is not None:
+        _bulk_password_hasher.shutdown()
+        _bulk_password_hasher = None
@@ -0,0 +1,83 @@
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Tuple, Union
+
+RECORD_FORMATS = ("csv", "ndjson")
+
+# A parsed record, or the reason the line could not be parsed
+Record = Union[Dict[str, Any], str]
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 byte chunks into lines without reading it all first."""
+    pending = b""
+    first = True
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            # Spreadsheet exports often start with a byte order mark
+            yield line.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+            first = False
+    if pending:
+        yield pending.decode("utf-8-sig" if first else "utf-8").rstrip("\r")
+
+
+async def read_records(lines: AsyncIterable[str], format: str) -> AsyncIterator[Tuple[int, Record]]:
+    """
+    Parse CSV (with a header row) or newline-delimited JSON objects one record
+    at a time, yielding each with the line number it starts on. A malformed
+    record is yielded as an error message instead, so one bad line does not
+    stop the rest.
+    """
+    if format == "csv":
+        records = _read_csv(lines)
+    elif format == "ndjson":
+        records = _read_ndjson(lines)
+    else:
+        raise ValueError(f"Unknown record format {format!r}")
+    async for number, record in records:
+        yield number, record
+
+
+async def _read_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[Tuple[int, Record]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield number, f"invalid JSON: {error}"
+            continue
+        yield number, record if isinstance(record, dict) else "expected a JSON object"
+
+
+async def _read_csv(lines: AsyncIterable[str]) -> AsyncIterator[Tuple[int, Record]]:
+    header: Optional[list] = None
+    number = 0
+    start = 0
+    buffered = ""
+    async for line in lines:
+        number += 1
+        if not buffered:
+            start = number
+        buffered = f"{buffered}\n{line}" if buffered else line
+        # A quoted field may span lines; quotes inside fields are doubled, so
+        # an odd count means the record continues on the next line
+        if buffered.count('"') % 2:
+            continue
+        text, buffered = buffered, ""
+        if not text.strip():
+            continue
+        row = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in row]
+            continue
+        if len(row) != len(header):
+            yield start, f"expected {len(header)} fields, got {len(row)}"
+            continue
+        yield start, dict(zip(header, row))
+    if buffered:
+        yield start, "unterminated quoted field"
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Dict, Optional, Union
 from jose import jwt
 from passlib.context import CryptContext
 from src.config import settings
@@ -8,6 +8,11 @@ from src.config import settings
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TRUSTED_ACCESS_TOKEN_EXPIRE_MINUTES = 5
+REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -24,18 +29,41 @@ def get_password_hash(password: str) -> str:
 
 
 def create_access_token(
+    subject: Union[str, Any], 
+    role_id: Union[str, Any], 
+    tenant_id: Union[str, Any], 
+    expires_delta: timedelta,
+    claims: Optional[Dict[str, Any]] = None
+) -> str:
+    """Create a JWT access token, optionally carrying extra trusted claims."""
+    expire = datetime.utcnow() + expires_delta
+    to_encode = {
+        "exp": expire, 
+        "sub": str(subject), 
+        "role_id": str(role_id), 
+        "tenant_id": str(tenant_id),
+        "type": ACCESS_TOKEN_TYPE
+    }
+    if claims:
+        to_encode.update(claims)
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+
+def create_refresh_token(
     subject: Union[str, Any], 
     role_id: Union[str, Any], 
     tenant_id: Union[str, Any], 
     expires_delta: timedelta
 ) -> str:
-    """Create a JWT access token."""
+    """Create a JWT refresh token that can only be exchanged for a new access token."""
     expire = datetime.utcnow() + expires_delta
     to_encode = {
         "exp": expire, 
         "sub": str(subject), 
         "role_id": str(role_id), 
-        "tenant_id": str(tenant_id)
+        "tenant_id": str(tenant_id),
+        "type": REFRESH_TOKEN_TYPE
     }
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt 
\ No newline at end of file
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Lets concurrent identical calls share one execution.
+
+    The first ``do`` for a key runs ``call``; every ``do`` for the same key
+    made while it is still running waits for that result (or exception)
+    instead of starting its own. Nothing is kept once the call finishes, so
+    the next caller runs it again: this bounds the number of concurrent
+    queries by distinct keys, it does not cache.
+
+    If the caller running the flight is cancelled, the others do not fail
+    with it; one of them runs the call again.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[K, "asyncio.Future[V]"] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: K, call: Callable[[], Awaitable[V]]) -> V:
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if flight.cancelled() and task is not None and not task.cancelling():
+                    # The caller running the flight went away; take over
+                    continue
+                raise
+            self.shared += 1
+            return result
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self.calls += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as error:
+            flight.set_exception(error)
+            # Mark it retrieved, so a flight nobody else joined is not logged
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
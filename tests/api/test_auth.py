@@ -0,0 +1,147 @@
+import pytest
+from datetime import datetime, timedelta
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from api.deps import get_current_user
+from api.endpoints.auth_endpoint import refresh_token
+from application.dto.auth_dto import RefreshTokenDTO
+from application.use_cases.auth_use_cases import AuthUseCases
+from domain.models.user import User
+from infrastructure.cache.principal_cache import clear_principal_cache
+from infrastructure.repositories.sql_auth_repository import SQLAuthRepository
+from utils.security import ALGORITHM, SECRET_KEY, create_access_token, create_refresh_token
+
+
+@pytest.fixture(autouse=True)
+def empty_principal_cache():
+    clear_principal_cache()
+    yield
+    clear_principal_cache()
+
+
+def make_session(user: Optional[User] = None) -> MagicMock:
+    """A session whose every SELECT finds ``user``."""
+    orm_user = None
+    if user is not None:
+        orm_user = MagicMock(is_deleted=False)
+        orm_user.to_domain.return_value = user
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = orm_user
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_refresh_token():
+    # Arrange
+    db = make_session(User(id=7, username="alice", email="alice@example.com", hashed_password="hashed"))
+    refresh_token = create_refresh_token(7, 1, 1, expires_delta=timedelta(minutes=5))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(db, bearer(refresh_token))
+
+    # Assert
+    assert error.value.status_code == 403
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_trusted_claims_skip_repository():
+    # Arrange
+    db = make_session()
+    access_token = create_access_token(
+        7, 1, 2,
+        expires_delta=timedelta(minutes=5),
+        claims={"trusted": True, "username": "alice", "email": "alice@example.com"}
+    )
+
+    # Act
+    principal = await get_current_user(db, bearer(access_token))
+
+    # Assert
+    assert principal["user"].id == 7
+    assert principal["user"].username == "alice"
+    assert principal["user"].email == "alice@example.com"
+    assert principal["user"].hashed_password == ""
+    assert principal["role_id"] == 1
+    assert principal["tenant_id"] == 2
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_accepts_untyped_legacy_token():
+    # Arrange
+    user = User(id=7, username="alice", email="alice@example.com", hashed_password="hashed")
+    db = make_session(user)
+    legacy_token = jwt.encode(
+        {"sub": "7", "role_id": "1", "tenant_id": "1", "exp": datetime.utcnow() + timedelta(minutes=5)},
+        SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+
+    # Act
+    principal = await get_current_user(db, bearer(legacy_token))
+
+    # Assert
+    assert principal["user"].id == 7
+    assert principal["user"].username == "alice"
+    db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_missing_user():
+    # Arrange
+    db = make_session(None)
+    access_token = create_access_token(7, 1, 1, expires_delta=timedelta(minutes=5))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(db, bearer(access_token))
+
+    # Assert
+    assert error.value.status_code == 401
+    assert error.value.detail == "User not found"
+
+
+@pytest.mark.asyncio
+async def test_refresh_endpoint_rejects_access_token():
+    # Arrange
+    db = make_session(User(id=7, username="alice", email="alice@example.com", hashed_password="hashed"))
+    access_token = create_access_token(7, 1, 1, expires_delta=timedelta(minutes=5))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await refresh_token(RefreshTokenDTO(refresh_token=access_token), AuthUseCases(SQLAuthRepository(db)))
+
+    # Assert
+    assert error.value.status_code == 403
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_endpoint_returns_token():
+    # Arrange
+    db = make_session(User(id=7, username="alice", email="alice@example.com", hashed_password="hashed"))
+    issued_refresh_token = create_refresh_token(7, 1, 1, expires_delta=timedelta(minutes=5))
+
+    # Act
+    body = await refresh_token(
+        RefreshTokenDTO(refresh_token=issued_refresh_token), AuthUseCases(SQLAuthRepository(db))
+    )
+
+    # Assert
+    assert body["success"] is True
+    assert body["token_type"] == "bearer"
+    assert body["refresh_token"] == issued_refresh_token
+    assert jwt.decode(body["access_token"], SECRET_KEY, algorithms=[ALGORITHM])["sub"] == "7"
@@ -1,12 +1,16 @@
 import pytest
+from collections import Counter
 from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from application.use_cases.comment_use_cases import CommentUseCases
 from application.dto.comment_dto import CommentCreateDTO, CommentUpdateDTO
-from domain.models.comment import Comment
+from domain.models.comment import Comment, CommentCountByDay, CommentCountByUser
+from domain.models.user import UserSummary
 from domain.repositories.comment_repository import CommentRepository
+from utils.data_loader import DataLoader
+from utils.pagination import InvalidCursorError
 
 
 class MockCommentRepository(CommentRepository):
@@ -15,6 +19,7 @@ class MockCommentRepository(CommentRepository):
     def __init__(self):
         self.comments = {}
         self.next_id = 1
+        self.version = 0
         
     async def add(self, comment: Comment) -> None:
         comment.id = self.next_id
@@ -22,24 +27,111 @@ class MockCommentRepository(CommentRepository):
         comment.updated_at = datetime.utcnow()
         self.comments[self.next_id] = comment
         self.next_id += 1
+        self.version += 1
+
+    async def add_many(self, comments: List[Comment]) -> None:
+        for comment in comments:
+            await self.add(comment)
         
     async def get_by_id(self, id: int) -> Optional[Comment]:
         return self.comments.get(id)
         
+    async def get_many(self, ids: List[int]) -> Dict[int, Comment]:
+        return {id: self.comments[id] for id in ids if id in self.comments}
+        
     async def get_by_user_id(self, user_id: int) -> List[Comment]:
         return [comment for comment in self.comments.values() if comment.user_id == user_id]
         
     async def get_all(self) -> List[Comment]:
         return list(self.comments.values())
+
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Comment]:
+        return self._page(list(self.comments.values()), limit, after)
+
+    async def get_page_by_user_id(
+        self, user_id: int, limit: int, after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Comment]:
+        return self._page(await self.get_by_user_id(user_id), limit, after)
+
+    async def get_changes(
+        self, limit: int, after: Optional[Tuple[datetime, int]] = None, lag: timedelta = timedelta(0)
+    ) -> List[Comment]:
+        settled_before = datetime.utcnow() - lag
+        comments = sorted(
+            (comment for comment in self.comments.values() if comment.updated_at < settled_before),
+            key=lambda comment: (comment.updated_at, comment.id)
+        )
+        if after is not None:
+            comments = [comment for comment in comments if (comment.updated_at, comment.id) > after]
+        return comments[:limit]
+
+    async def get_version(self) -> int:
+        return self.version
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Comment]:
+        terms = query.lower().split()
+        matches = [
+            comment for comment in self.comments.values()
+            if all(term in f"{comment.name} {comment.description}".lower() for term in terms)
+        ]
+        return matches[offset:offset + limit]
+
+    async def get_counts_by_user(self, limit: int, after_user_id: Optional[int] = None) -> List[CommentCountByUser]:
+        counts = Counter(comment.user_id for comment in self.comments.values() if not comment.is_deleted)
+        return [
+            CommentCountByUser(user_id=user_id, count=count)
+            for user_id, count in sorted(counts.items())
+            if after_user_id is None or user_id > after_user_id
+        ][:limit]
+
+    async def get_counts_by_day(
+        self, since: Optional[date] = None, until: Optional[date] = None
+    ) -> List[CommentCountByDay]:
+        counts = Counter(comment.created_at.date() for comment in self.comments.values() if not comment.is_deleted)
+        return [
+            CommentCountByDay(day=day, count=count)
+            for day, count in sorted(counts.items())
+            if (since is None or day >= since) and (until is None or day <= until)
+        ]
+
+    async def stream(
+        self, user_id: Optional[int] = None, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[Comment]:
+        for comment in list(self.comments.values()):
+            if user_id is not None and comment.user_id != user_id:
+                continue
+            if updated_since is not None and comment.updated_at < updated_since:
+                continue
+            yield comment
+
+    @staticmethod
+    def _page(comments: List[Comment], limit: int, after: Optional[Tuple[datetime, int]]) -> List[Comment]:
+        comments = sorted(comments, key=lambda comment: (comment.created_at, comment.id))
+        if after is not None:
+            comments = [comment for comment in comments if (comment.created_at, comment.id) > after]
+        return comments[:limit]
         
-    async def update(self, comment: Comment) -> None:
-        if comment.id in self.comments:
-            comment.updated_at = datetime.utcnow()
-            self.comments[comment.id] = comment
+    async def update(self, id: int, changes: Dict[str, Any], updated_by: int) -> Optional[Comment]:
+        comment = self.comments.get(id)
+        if comment is None or comment.is_deleted:
+            return None
+        updated_comment = comment.model_copy(
+            update={**changes, "updated_by": updated_by, "updated_at": datetime.utcnow()}
+        )
+        self.comments[id] = updated_comment
+        self.version += 1
+        return updated_comment
             
-    async def delete(self, id: int) -> None:
-        if id in self.comments:
-            self.comments[id].deleted_at = datetime.utcnow()
+    async def delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
+        comment = self.comments.get(id)
+        if comment is None or comment.is_deleted:
+            return False
+        comment.is_deleted = True
+        comment.deleted_at = datetime.utcnow()
+        comment.deleted_by = deleted_by
+        comment.updated_at = datetime.utcnow()
+        self.version += 1
+        return True
 
 
 @pytest.mark.asyncio
@@ -67,6 +159,26 @@ async def test_create_comment_success():
     assert result.created_at is not None
 
 
+@pytest.mark.asyncio
+async def test_create_many_comments_returns_ids_in_input_order():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    comment_dtos = [
+        CommentCreateDTO(name=f"Comment {i}", description="Description", user_id=1)
+        for i in range(3)
+    ]
+
+    # Act
+    result = await comment_use_cases.create_many(comment_dtos, 2)
+
+    # Assert
+    assert [comment.id for comment in result] == [1, 2, 3]
+    assert [comment.name for comment in result] == ["Comment 0", "Comment 1", "Comment 2"]
+    assert all(comment.created_by == 2 for comment in result)
+
+
 @pytest.mark.asyncio
 async def test_get_comment_by_id_success():
     # Arrange
@@ -151,6 +263,180 @@ async def test_get_all_comments():
     assert len(all_comments) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_comment_pages_follow_cursor():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    for i in range(5):
+        await comment_repository.add(Comment(name=f"Comment {i}", description="Description", user_id=1, created_by=1))
+
+    # Act
+    first_page = await comment_use_cases.get_page(2)
+    second_page = await comment_use_cases.get_page(2, first_page.next_cursor)
+    last_page = await comment_use_cases.get_page(2, second_page.next_cursor)
+
+    # Assert
+    assert [comment.id for comment in first_page.items] == [1, 2]
+    assert [comment.id for comment in second_page.items] == [3, 4]
+    assert [comment.id for comment in last_page.items] == [5]
+    assert last_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_comment_page_with_authors_loads_authors_in_one_batch():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+    for user_id in [1, 2, 1, 404]:
+        await comment_repository.add(Comment(name="c", description="d", user_id=user_id))
+    calls = []
+
+    async def get_many(user_ids: List[int]) -> Dict[int, UserSummary]:
+        calls.append(user_ids)
+        return {user_id: UserSummary(id=user_id, username=f"user{user_id}", email="e") for user_id in user_ids
+                if user_id != 404}
+
+    # Act
+    page = await comment_use_cases.get_page_with_authors(3, DataLoader(get_many))
+
+    # Assert
+    assert [comment.author.username for comment in page.items] == ["user1", "user2", "user1"]
+    assert page.next_cursor is not None
+    assert calls == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_get_comment_page_by_user_id():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    await comment_repository.add(Comment(name="User 1 Comment", description="Description", user_id=1, created_by=1))
+    await comment_repository.add(Comment(name="User 2 Comment", description="Description", user_id=2, created_by=2))
+
+    # Act
+    page = await comment_use_cases.get_page_by_user_id(2, 10)
+
+    # Assert
+    assert [comment.user_id for comment in page.items] == [2]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_comment_page_invalid_cursor():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    # Act / Assert
+    with pytest.raises(InvalidCursorError):
+        await comment_use_cases.get_page(10, "not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_search_comments_pages_through_matches():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+    for i in range(5):
+        await comment_repository.add(Comment(name=f"Zebra {i}", description="Striped", user_id=1, created_by=1))
+    await comment_repository.add(Comment(name="Horse", description="Plain", user_id=1, created_by=1))
+
+    # Act
+    first_page = await comment_use_cases.search("zebra", 3)
+    second_page = await comment_use_cases.search("zebra", 3, first_page.next_cursor)
+
+    # Assert
+    assert [comment.name for comment in first_page.items] == ["Zebra 0", "Zebra 1", "Zebra 2"]
+    assert [comment.name for comment in second_page.items] == ["Zebra 3", "Zebra 4"]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_user_pages_through_live_comments():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+    for user_id in [1, 1, 2, 3, 3, 3]:
+        await comment_repository.add(Comment(name="Comment", description="d", user_id=user_id, created_by=1))
+    await comment_repository.delete(1, 1)
+
+    # Act
+    first_page = await comment_use_cases.get_counts_by_user(2)
+    second_page = await comment_use_cases.get_counts_by_user(2, first_page.next_cursor)
+
+    # Assert
+    assert [(count.user_id, count.count) for count in first_page.items] == [(1, 1), (2, 1)]
+    assert [(count.user_id, count.count) for count in second_page.items] == [(3, 3)]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_user_invalid_cursor():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    # Act / Assert
+    with pytest.raises(InvalidCursorError):
+        await comment_use_cases.get_counts_by_user(2, "not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_changes_follows_token_and_includes_deletes():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository, changes_lag=timedelta(0))
+    for i in range(3):
+        await comment_repository.add(Comment(name=f"Comment {i}", description="d", user_id=1, created_by=1))
+
+    # Act
+    first = await comment_use_cases.get_changes(2)
+    second = await comment_use_cases.get_changes(2, first.next_token)
+    await comment_repository.delete(1, 1)
+    third = await comment_use_cases.get_changes(2, second.next_token)
+    fourth = await comment_use_cases.get_changes(2, third.next_token)
+
+    # Assert
+    assert [comment.id for comment in first.items] == [1, 2] and first.has_more
+    assert [comment.id for comment in second.items] == [3] and not second.has_more
+    assert [(comment.id, comment.is_deleted) for comment in third.items] == [(1, True)]
+    assert fourth.items == [] and fourth.next_token == third.next_token
+
+
+@pytest.mark.asyncio
+async def test_get_changes_holds_back_recent_changes():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository, changes_lag=timedelta(minutes=1))
+    await comment_repository.add(Comment(name="Recent", description="d", user_id=1, created_by=1))
+
+    # Act
+    result = await comment_use_cases.get_changes(10)
+
+    # Assert
+    assert result.items == []
+    assert result.next_token is None
+
+
+@pytest.mark.asyncio
+async def test_export_comments_filters_by_user_id():
+    # Arrange
+    comment_repository = MockCommentRepository()
+    comment_use_cases = CommentUseCases(comment_repository)
+
+    await comment_repository.add(Comment(name="User 1 Comment", description="Description", user_id=1, created_by=1))
+    await comment_repository.add(Comment(name="User 2 Comment", description="Description", user_id=2, created_by=2))
+
+    # Act
+    exported = [comment async for comment in comment_use_cases.export(user_id=1)]
+
+    # Assert
+    assert [comment.name for comment in exported] == ["User 1 Comment"]
+
+
 @pytest.mark.asyncio
 async def test_update_comment_success():
     # Arrange
@@ -0,0 +1,178 @@
+import pytest
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO
+from application.services.role_permission_resolver import RolePermissionResolver
+from application.use_cases.role_use_cases import RoleUseCases
+from domain.models.role import Role
+from domain.repositories.role_repository import RoleRepository
+
+
+class MockRoleRepository(RoleRepository):
+    """Mock implementation of RoleRepository for testing"""
+
+    def __init__(self):
+        self.roles: Dict[UUID, Role] = {}
+
+    async def add(self, role: Role) -> Role:
+        role.id = uuid4()
+        role.created_at = datetime.utcnow()
+        self.roles[role.id] = role
+        return role
+
+    async def get_by_id(self, role_id: UUID) -> Optional[Role]:
+        role = self.roles.get(role_id)
+        return role if role is not None and not role.is_deleted else None
+
+    async def get_many(self, role_ids: List[UUID]) -> Dict[UUID, Role]:
+        return {role_id: role for role_id in role_ids if (role := await self.get_by_id(role_id)) is not None}
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Role]:
+        live = [role for role in self.roles.values() if not role.is_deleted]
+        return live[skip:skip + limit]
+
+    async def get_page(self, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[Role]:
+        live = sorted(
+            (role for role in self.roles.values() if not role.is_deleted), key=lambda role: (role.created_at, role.id)
+        )
+        return [role for role in live if after is None or (role.created_at, role.id) > after][:limit]
+
+    async def get_by_permission(self, permission: UUID, skip: int = 0, limit: int = 100) -> List[Role]:
+        return await self.get_by_any_permission([permission], skip, limit)
+
+    async def get_by_any_permission(self, permissions: List[UUID], skip: int = 0, limit: int = 100) -> List[Role]:
+        wanted = set(permissions)
+        granting = [role for role in await self.get_all(0, len(self.roles)) if wanted & set(role.permissions)]
+        return granting[skip:skip + limit]
+
+    async def update(self, role: Role) -> Optional[Role]:
+        self.roles[role.id] = role
+        return role
+
+    async def delete(self, role_id: UUID, deleted_by: Optional[UUID] = None) -> bool:
+        role = await self.get_by_id(role_id)
+        if role is None:
+            return False
+        role.is_deleted = True
+        role.deleted_at = datetime.utcnow()
+        role.deleted_by = deleted_by
+        return True
+
+
+@pytest.mark.asyncio
+async def test_reload_compiles_live_roles_across_pages():
+    # Arrange
+    repository = MockRoleRepository()
+    read, write = uuid4(), uuid4()
+    roles = [await repository.add(Role(name=f"role {i}", permissions=[read])) for i in range(3)]
+    await repository.delete(roles[2].id)
+    roles[1].permissions.append(write)
+    resolver = RolePermissionResolver()
+
+    # Act
+    loaded = await resolver.reload(repository, page_size=1)
+
+    # Assert
+    assert loaded == 2
+    assert resolver.has_permission(roles[0].id, read)
+    assert not resolver.has_permission(roles[0].id, write)
+    assert resolver.get_permissions(roles[1].id) == frozenset({read, write})
+    assert not resolver.has_permission(roles[2].id, read)
+    assert not resolver.has_permission(uuid4(), read)
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_roles_after_one_deleted_mid_walk():
+    # Arrange
+    repository = MockRoleRepository()
+    read = uuid4()
+    for i in range(3):
+        await repository.add(Role(name=f"role {i}", permissions=[read]))
+    resolver = RolePermissionResolver()
+    get_page = repository.get_page
+
+    async def get_page_then_delete(limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[Role]:
+        roles = await get_page(limit, after)
+        if after is None:
+            # Another worker deletes the role just read
+            await repository.delete(roles[0].id)
+        return roles
+
+    repository.get_page = get_page_then_delete
+
+    # Act
+    loaded = await resolver.reload(repository, page_size=1)
+
+    # Assert
+    assert loaded == 3
+    assert all(resolver.has_permission(role.id, read) for role in await repository.get_all())
+
+
+@pytest.mark.asyncio
+async def test_role_changes_update_the_resolver():
+    # Arrange
+    resolver = RolePermissionResolver()
+    role_use_cases = RoleUseCases(MockRoleRepository(), resolver)
+    read, write = uuid4(), uuid4()
+
+    # Act
+    role = await role_use_cases.create_role(RoleCreateDTO(name="editor", permissions=[read]))
+    created = resolver.get_permissions(role.id)
+    await role_use_cases.update_role(role.id, RoleUpdateDTO(permissions=[write]))
+    updated = resolver.get_permissions(role.id)
+    await role_use_cases.delete_role(role.id)
+
+    # Assert
+    assert created == frozenset({read})
+    assert updated == frozenset({write})
+    assert resolver.get_permissions(role.id) is None
+    assert not resolver.has_permission(role.id, write)
+
+
+@pytest.mark.asyncio
+async def test_changes_made_during_a_reload_are_kept():
+    # Arrange
+    repository = MockRoleRepository()
+    resolver = RolePermissionResolver()
+    role_use_cases = RoleUseCases(repository, resolver)
+    read, write = uuid4(), uuid4()
+    kept = await repository.add(Role(name="kept", permissions=[read]))
+    removed = await repository.add(Role(name="removed", permissions=[read]))
+    get_page = repository.get_page
+
+    async def get_page_then_change(limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[Role]:
+        # The page is read before these changes, as a slow query would be
+        roles = [Role(name=role.name, permissions=list(role.permissions), id=role.id, created_at=role.created_at)
+                 for role in await get_page(limit, after)]
+        await role_use_cases.update_role(kept.id, RoleUpdateDTO(permissions=[write]))
+        await role_use_cases.delete_role(removed.id)
+        return roles
+
+    repository.get_page = get_page_then_change
+
+    # Act
+    await resolver.reload(repository)
+
+    # Assert
+    assert resolver.get_permissions(kept.id) == frozenset({write})
+    assert resolver.get_permissions(removed.id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_roles_by_any_permission():
+    # Arrange
+    role_use_cases = RoleUseCases(MockRoleRepository())
+    read, write, admin = uuid4(), uuid4(), uuid4()
+    reader = await role_use_cases.create_role(RoleCreateDTO(name="reader", permissions=[read]))
+    writer = await role_use_cases.create_role(RoleCreateDTO(name="writer", permissions=[read, write]))
+    await role_use_cases.create_role(RoleCreateDTO(name="admin", permissions=[admin]))
+
+    # Act
+    by_write = await role_use_cases.get_roles_by_permission(write)
+    by_any = await role_use_cases.get_roles_by_any_permission([read, write])
+
+    # Assert
+    assert [role.id for role in by_write] == [writer.id]
+    assert [role.id for role in by_any] == [reader.id, writer.id]
@@ -1,12 +1,13 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from application.use_cases.user_use_cases import UserUseCases
 from application.dto.user_dto import UserRegistrationDTO
-from domain.models.user import User
+from domain.models.user import User, UserSummary
 from domain.repositories.user_repository import UserRepository
+from utils.pagination import InvalidCursorError
 
 
 class MockUserRepository(UserRepository):
@@ -16,6 +17,7 @@ class MockUserRepository(UserRepository):
         self.users = {}
         self.next_id = 1
         self.users_by_email = {}
+        self.version = 0
         
     async def add(self, user: User) -> None:
         user.id = self.next_id
@@ -24,19 +26,69 @@ class MockUserRepository(UserRepository):
         self.users[self.next_id] = user
         self.users_by_email[user.email] = user
         self.next_id += 1
+        self.version += 1
         
+    async def add_many_new(self, users: List[User]) -> None:
+        for user in users:
+            taken = any(
+                existing.username == user.username or existing.email == user.email
+                for existing in self.users.values()
+            )
+            if not taken:
+                await self.add(user)
+
+    async def get_existing(self, usernames: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        return (
+            {user.username for user in self.users.values() if user.username in usernames},
+            {user.email for user in self.users.values() if user.email in emails},
+        )
+
     async def get_by_email(self, email: str) -> Optional[User]:
         return self.users_by_email.get(email)
         
     async def get_all(self) -> List[User]:
         return list(self.users.values())
 
+    async def get_page(self, limit: int, after_id: Optional[int] = None) -> List[UserSummary]:
+        return [
+            UserSummary(id=user.id, username=user.username, email=user.email, created_at=user.created_at)
+            for id, user in sorted(self.users.items())
+            if after_id is None or id > after_id
+        ][:limit]
+
+    async def get_many(self, user_ids: List[int]) -> Dict[int, UserSummary]:
+        return {
+            user_id: UserSummary(id=user_id, username=user.username, email=user.email, created_at=user.created_at)
+            for user_id in user_ids
+            if (user := self.users.get(user_id)) is not None
+        }
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return self.users.get(user_id)
+
+    async def get_version(self) -> int:
+        return self.version
+
+
+class FakePasswordHasher:
+    def __init__(self):
+        self.hashed: List[str] = []
+
+    async def hash(self, password: str) -> str:
+        self.hashed.append(password)
+        return password + "_hashed"
+
+
+async def records(*items) -> AsyncIterator:
+    for item in items:
+        yield item
+
 
 @pytest.mark.asyncio
 async def test_register_user_success():
     # Arrange
     user_repository = MockUserRepository()
-    user_use_cases = UserUseCases(user_repository)
+    user_use_cases = UserUseCases(user_repository, FakePasswordHasher())
     
     user_dto = UserRegistrationDTO(
         username="testuser",
@@ -77,6 +129,84 @@ async def test_get_all_users():
     assert any(user.username == "user2" for user in all_users)
 
 
+@pytest.mark.asyncio
+async def test_get_user_pages_follow_cursor_without_password_hashes():
+    # Arrange
+    user_repository = MockUserRepository()
+    user_use_cases = UserUseCases(user_repository)
+    for i in range(3):
+        await user_repository.add(User(username=f"user{i}", email=f"user{i}@example.com", hashed_password="hashed"))
+
+    # Act
+    first_page = await user_use_cases.get_page(2)
+    second_page = await user_use_cases.get_page(2, first_page.next_cursor)
+
+    # Assert
+    assert [user.username for user in first_page.items] == ["user0", "user1"]
+    assert [user.username for user in second_page.items] == ["user2"]
+    assert second_page.next_cursor is None
+    assert "hashed_password" not in first_page.model_dump()["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_get_user_page_invalid_cursor():
+    # Arrange
+    user_repository = MockUserRepository()
+    user_use_cases = UserUseCases(user_repository)
+
+    # Act / Assert
+    with pytest.raises(InvalidCursorError):
+        await user_use_cases.get_page(10, "not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_invalid_and_conflicting_rows():
+    # Arrange
+    user_repository = MockUserRepository()
+    password_hasher = FakePasswordHasher()
+    user_use_cases = UserUseCases(user_repository, password_hasher)
+    await user_repository.add(User(username="taken", email="taken@example.com", hashed_password="hashed"))
+
+    # Act
+    result = await user_use_cases.import_users(records(
+        (2, {"username": "ann", "email": "ann@example.com", "password": "a"}),
+        (3, {"username": "taken", "email": "new@example.com", "password": "b"}),
+        (4, "expected 3 fields, got 1"),
+        (5, {"username": "bob", "email": "bob@example.com"}),
+        (6, {"username": "ann", "email": "ann2@example.com", "password": "c"}),
+        (7, {"username": "cid", "email": "cid@example.com", "password": "d"}),
+    ), batch_size=2)
+
+    # Assert
+    assert result.imported == 2
+    assert [(error.line, error.reason) for error in result.errors] == [
+        (3, "conflict"), (4, "invalid"), (5, "invalid"), (6, "conflict")
+    ]
+    assert (await user_repository.get_by_email("ann@example.com")).hashed_password == "a_hashed"
+    # Rows already known to clash are never hashed
+    assert "b" not in password_hasher.hashed
+
+
+@pytest.mark.asyncio
+async def test_import_users_stops_after_max_rows():
+    # Arrange
+    user_repository = MockUserRepository()
+    user_use_cases = UserUseCases(user_repository, FakePasswordHasher())
+
+    # Act
+    result = await user_use_cases.import_users(records(
+        (2, {"username": "ann", "email": "ann@example.com", "password": "a"}),
+        (3, "expected 3 fields, got 1"),
+        (4, {"username": "bob", "email": "bob@example.com", "password": "b"}),
+        (5, {"username": "cid", "email": "cid@example.com", "password": "c"}),
+    ), batch_size=10, max_rows=2)
+
+    # Assert
+    assert result.imported == 1
+    assert [(error.line, error.reason) for error in result.errors] == [(3, "invalid"), (4, "limit")]
+    assert await user_repository.get_by_email("bob@example.com") is None
+
+
 @pytest.mark.asyncio
 async def test_user_model_has_is_deleted_field():
     """Test to ensure the User model has the is_deleted field as per CursorRules"""
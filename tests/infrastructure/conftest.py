@@ -0,0 +1,33 @@
+"""
+Fixtures for the tests that run against a migrated PostgreSQL database. Every
+test that uses them, directly or through another fixture, is skipped unless
+RUN_DB_TESTS=1 is set.
+"""
+import os
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from config import settings
+
+
+@pytest_asyncio.fixture
+async def engine():
+    if os.getenv("RUN_DB_TESTS") != "1":
+        pytest.skip("needs a migrated PostgreSQL database (set RUN_DB_TESTS=1)")
+    engine = create_async_engine(
+        settings.POSTGRES_CONNECTION_STRING, poolclass=NullPool, connect_args={"server_settings": {"timezone": "UTC"}}
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        # Commits inside the repository only release a savepoint
+        yield AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+        await transaction.rollback()
@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from domain.models.comment import Comment
+from domain.repositories.comment_repository import CommentRepository
+from infrastructure.repositories.cached_comment_repository import CachedCommentRepository
+from utils.cache import TTLCache
+
+
+def make_repository(comment=None):
+    inner = AsyncMock(spec=CommentRepository)
+    inner.get_by_id.return_value = comment
+    return inner, CachedCommentRepository(inner, TTLCache(maxsize=10, ttl=60))
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_served_from_cache():
+    # Arrange
+    inner, repository = make_repository(Comment(id=1, name="Cached", description="d", user_id=1))
+
+    # Act
+    first = await repository.get_by_id(1)
+    second = await repository.get_by_id(1)
+
+    # Assert
+    assert first.name == second.name == "Cached"
+    assert inner.get_by_id.await_count == 1
+    assert repository.cache.stats()["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_missing_ids_are_cached():
+    # Arrange
+    inner, repository = make_repository(None)
+
+    # Act
+    first = await repository.get_by_id(404)
+    second = await repository.get_by_id(404)
+
+    # Assert
+    assert first is None and second is None
+    assert inner.get_by_id.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate_entry():
+    # Arrange
+    inner, repository = make_repository(Comment(id=1, name="Cached", description="d", user_id=1))
+    await repository.get_by_id(1)
+
+    # Act
+    await repository.update(1, {"name": "Changed"}, 2)
+    await repository.get_by_id(1)
+    await repository.delete(1, 2)
+    await repository.get_by_id(1)
+
+    # Assert
+    assert inner.get_by_id.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_comment_cannot_be_changed_by_caller():
+    # Arrange
+    inner, repository = make_repository(Comment(id=1, name="Cached", description="d", user_id=1))
+
+    # Act
+    (await repository.get_by_id(1)).name = "Mutated"
+    result = await repository.get_by_id(1)
+
+    # Assert
+    assert result.name == "Cached"
+
+
+@pytest.mark.asyncio
+async def test_get_many_loads_only_uncached_ids_in_one_call():
+    # Arrange
+    inner, repository = make_repository(Comment(id=1, name="Cached", description="d", user_id=1))
+    inner.get_many.return_value = {3: Comment(id=3, name="Loaded", description="d", user_id=1)}
+    await repository.get_by_id(1)
+
+    # Act
+    first = await repository.get_many([3, 1, 404])
+    second = await repository.get_many([404, 3])
+
+    # Assert
+    assert [(id, comment.name) for id, comment in first.items()] == [(3, "Loaded"), (1, "Cached")]
+    assert list(second) == [3]
+    inner.get_many.assert_awaited_once_with([3, 404])
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from infrastructure.events.comment_change_feed import CommentChangeFeed
+
+
+class OfflineCommentChangeFeed(CommentChangeFeed):
+    """Feed that never connects, so notifications can be injected directly."""
+
+    async def listen(self) -> None:
+        pass
+
+
+def notify(feed: CommentChangeFeed, op: str, *ids: int) -> None:
+    payload = json.dumps([{"op": op, "id": id, "user_id": 1, "updated_at": "2026-01-01T00:00:00"} for id in ids])
+    feed._on_notification(None, 0, "comment_changes", payload)
+
+
+@pytest.mark.asyncio
+async def test_notifications_fan_out_to_every_subscriber():
+    # Arrange
+    feed = OfflineCommentChangeFeed("postgresql://unused", queue_size=10)
+
+    # Act
+    async with feed.subscribe() as first, feed.subscribe() as second:
+        notify(feed, "insert", 1)
+        received = [first.get_nowait(), second.get_nowait()]
+
+    # Assert
+    assert [[(event.op, event.id) for event in events] for events in received] == [[("insert", 1)], [("insert", 1)]]
+    assert feed.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_a_batched_notification_takes_one_queue_slot():
+    # Arrange
+    feed = OfflineCommentChangeFeed("postgresql://unused", queue_size=1)
+
+    # Act
+    async with feed.subscribe() as queue:
+        notify(feed, "insert", *range(1, 51))
+        received = queue.get_nowait()
+
+    # Assert
+    assert [event.id for event in received] == list(range(1, 51))
+    assert feed.stats()["received"] == 50
+    assert feed.stats()["dropped_subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_closed_when_its_queue_is_full():
+    # Arrange
+    feed = OfflineCommentChangeFeed("postgresql://unused", queue_size=1)
+
+    # Act
+    async with feed.subscribe() as queue:
+        notify(feed, "insert", 1)
+        notify(feed, "update", 1)
+        received = queue.get_nowait()
+
+    # Assert
+    assert received is None
+    assert feed.stats()["dropped_subscribers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lost_connection_closes_subscribers():
+    # Arrange
+    feed = OfflineCommentChangeFeed("postgresql://unused", queue_size=10)
+    connection = object()
+    feed._connection = connection
+
+    # Act
+    async with feed.subscribe() as queue:
+        feed._on_terminated(connection)
+        received = queue.get_nowait()
+
+    # Assert
+    assert received is None
+    assert feed.stats()["listening"] == 0
@@ -0,0 +1,48 @@
+"""
+Checks partition maintenance against a migrated PostgreSQL database. Nothing
+is dropped: retention is only exercised as a dry run.
+
+Opt in with RUN_DB_TESTS=1.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from infrastructure.maintenance.comment_partitions import CommentPartitionManager
+
+@pytest_asyncio.fixture
+async def manager(engine):
+    return CommentPartitionManager(engine)
+
+
+@pytest.mark.asyncio
+async def test_ensure_covers_months_ahead_and_is_idempotent(manager):
+    await manager.ensure(2)
+
+    created = await manager.ensure(2)
+    partitions = await manager.list()
+
+    assert created == 0
+    now = datetime.utcnow()
+    three_months_out = datetime(now.year + (now.month + 2) // 12, (now.month + 2) % 12 + 1, 1)
+    assert max(p.upper_bound for p in partitions if p.upper_bound) >= three_months_out
+
+
+@pytest.mark.asyncio
+async def test_list_orders_partitions_by_range(manager):
+    partitions = await manager.list()
+
+    assert partitions[0].name == "comments_legacy"
+    assert partitions[-1].name == "comments_default"
+    assert partitions[-1].upper_bound is None
+    bounds = [partition.upper_bound for partition in partitions[:-1]]
+    assert bounds == sorted(bounds)
+
+
+@pytest.mark.asyncio
+async def test_drop_before_keeps_partitions_straddling_the_cutoff(manager):
+    legacy, following = (await manager.list())[:2]
+
+    assert await manager.drop_before(legacy.upper_bound - timedelta(seconds=1), dry_run=True) == []
+    assert await manager.drop_before(legacy.upper_bound, dry_run=True) == [legacy.name]
+    assert await manager.drop_before(following.upper_bound, dry_run=True) == [legacy.name, following.name]
@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List
+
+import pytest
+
+from domain.models.comment import Comment
+from infrastructure.repositories.batching_comment_repository import CommentWriteBatcher
+
+
+class RecordingRepository:
+    """Stands in for SQLCommentRepository, recording each add_many batch."""
+
+    def __init__(self, batches: List[List[Comment]]):
+        self.batches = batches
+
+    async def add_many(self, comments: List[Comment]) -> None:
+        if any(comment.user_id == 0 for comment in comments):
+            raise ValueError("no such user")
+        self.batches.append(list(comments))
+        for comment in comments:
+            comment.id = id(comment)
+
+
+@asynccontextmanager
+async def fake_session():
+    yield None
+
+
+def make_batcher(batches: List[List[Comment]], max_batch_size: int = 10, max_linger: float = 0.01):
+    return CommentWriteBatcher(
+        fake_session, max_batch_size, max_linger, repository_factory=lambda session: RecordingRepository(batches)
+    )
+
+
+def make_comment(i: int, user_id=1) -> Comment:
+    return Comment(name=f"Comment {i}", description="Description", user_id=user_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_adds_share_a_batch():
+    # Arrange
+    batches: List[List[Comment]] = []
+    batcher = make_batcher(batches)
+    comments = [make_comment(i) for i in range(5)]
+
+    # Act
+    await asyncio.gather(*(batcher.add(comment) for comment in comments))
+    await batcher.stop()
+
+    # Assert
+    assert len(batches) == 1
+    assert all(comment.id is not None for comment in comments)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size():
+    # Arrange
+    batches: List[List[Comment]] = []
+    batcher = make_batcher(batches, max_batch_size=2, max_linger=1)
+
+    # Act
+    await asyncio.gather(*(batcher.add(make_comment(i)) for i in range(5)))
+    await batcher.stop()
+
+    # Assert
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_failing_comment_only_fails_its_own_caller():
+    # Arrange
+    batches: List[List[Comment]] = []
+    batcher = make_batcher(batches)
+    good, bad = make_comment(1), make_comment(2, user_id=0)
+
+    # Act
+    results = await asyncio.gather(batcher.add(good), batcher.add(bad), return_exceptions=True)
+    await batcher.stop()
+
+    # Assert
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert batches == [[good]]
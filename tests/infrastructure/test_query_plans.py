@@ -0,0 +1,207 @@
+"""
+Query-plan regression tests for the hot repository reads.
+
+These run the real repository methods against a migrated PostgreSQL database,
+capture the SQL they emit and EXPLAIN it. Each test seeds a realistically shaped
+data set (many users, a large share of soft-deleted rows) inside a transaction
+that is rolled back afterwards, and analyzes it so the planner has statistics.
+
+Opt in with RUN_DB_TESTS=1.
+"""
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from infrastructure.repositories.sql_comment_repository import SQLCommentRepository
+from infrastructure.repositories.sql_role_repository import SQLRoleRepository
+from infrastructure.repositories.sql_user_repository import SQLUserRepository
+
+@pytest_asyncio.fixture
+async def connection(engine):
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        await seed(connection)
+        yield connection
+        await transaction.rollback()
+
+
+async def seed(connection: AsyncConnection) -> None:
+    prefix = uuid.uuid4().hex
+    await connection.exec_driver_sql(
+        "INSERT INTO users (username, email, created_at, updated_at) "
+        f"SELECT '{prefix}-' || n, '{prefix}-' || n || '@example.com', now(), now() "
+        "FROM generate_series(1, 500) AS n"
+    )
+    await connection.exec_driver_sql(
+        "INSERT INTO comments (name, description, user_id, created_at, updated_at, is_deleted) "
+        "SELECT 'comment ' || n, CASE WHEN n % 1000 = 0 THEN 'rare needle' ELSE 'description' END, u.id, now() - n * interval '1 minute', now(), n % 3 = 0 "
+        "FROM generate_series(1, 20000) AS n "
+        f"JOIN users u ON u.username = '{prefix}-' || (n % 500 + 1)"
+    )
+    await connection.exec_driver_sql(
+        "INSERT INTO roles (id, name, permissions, is_deleted) "
+        "SELECT gen_random_uuid(), 'role ' || n, jsonb_build_array(gen_random_uuid()::text), n % 10 <> 0 "
+        "FROM generate_series(1, 20000) AS n"
+    )
+    await connection.exec_driver_sql("ANALYZE users, comments, roles")
+
+
+async def explain(connection: AsyncConnection, call: Callable[[AsyncSession], Awaitable[Any]]) -> Set[str]:
+    """
+    Run a repository call and return the index names used by its plan. Indexes
+    on partitions are reported as the partitioned index they belong to.
+    """
+    plan = await explain_plan(connection, call)
+    result = await connection.exec_driver_sql(
+        "SELECT child.relname, parent.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "WHERE child.relkind = 'i'"
+    )
+    parents = dict(result.all())
+    return {parents.get(name, name) for name in plan_values(plan, "Index Name")}
+
+
+async def explain_plan(connection: AsyncConnection, call: Callable[[AsyncSession], Awaitable[Any]]) -> Dict[str, Any]:
+    """Run a repository call and return the plan of the first statement it sends."""
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        statements.append((statement, parameters))
+
+    sync_engine = connection.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call(AsyncSession(bind=connection))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[0]
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    return result.scalar()[0]["Plan"]
+
+
+def plan_values(plan: Dict[str, Any], key: str) -> Set[str]:
+    values = {plan[key]} if key in plan else set()
+    for child in plan.get("Plans", []):
+        values |= plan_values(child, key)
+    return values
+
+
+@pytest.mark.asyncio
+async def test_comment_page_uses_live_created_at_index(connection):
+    indexes = await explain(connection, lambda session: SQLCommentRepository(session).get_page(51))
+
+    assert "ix_comments_live_created_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comment_page_after_cursor_uses_live_created_at_index(connection):
+    indexes = await explain(
+        connection, lambda session: SQLCommentRepository(session).get_page(51, (datetime(2025, 1, 1), 1))
+    )
+
+    assert "ix_comments_live_created_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comment_page_after_recent_cursor_skips_legacy_partition(connection):
+    after = (datetime.now() + timedelta(days=62), 1)
+    plan = await explain_plan(connection, lambda session: SQLCommentRepository(session).get_page(51, after))
+
+    assert "comments_legacy" not in plan_values(plan, "Relation Name")
+
+
+@pytest.mark.asyncio
+async def test_comment_page_by_user_id_uses_live_user_index(connection):
+    indexes = await explain(connection, lambda session: SQLCommentRepository(session).get_page_by_user_id(1, 51))
+
+    assert "ix_comments_live_user_id_created_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comments_by_user_id_use_live_user_index(connection):
+    indexes = await explain(connection, lambda session: SQLCommentRepository(session).get_by_user_id(1))
+
+    assert "ix_comments_live_user_id_created_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comments_by_ids_use_primary_key(connection):
+    indexes = await explain(connection, lambda session: SQLCommentRepository(session).get_many([1, 2, 3]))
+
+    assert "comments_pkey" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comment_changes_use_updated_at_index(connection):
+    indexes = await explain(
+        connection, lambda session: SQLCommentRepository(session).get_changes(201, (datetime(2025, 1, 1), 1))
+    )
+
+    assert "ix_comments_updated_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_comment_search_uses_search_vector_index(connection):
+    indexes = await explain(connection, lambda session: SQLCommentRepository(session).search("needle", 51))
+
+    assert "ix_comments_live_search_vector" in indexes
+
+
+@pytest.mark.asyncio
+async def test_role_listing_uses_live_index(connection):
+    indexes = await explain(connection, lambda session: SQLRoleRepository(session).get_all(0, 100))
+
+    assert "ix_roles_live_created_at_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_role_by_id_uses_index(connection):
+    indexes = await explain(connection, lambda session: SQLRoleRepository(session).get_by_id(uuid.uuid4()))
+
+    assert "roles_pkey" in indexes
+
+
+@pytest.mark.asyncio
+async def test_roles_by_permission_use_permissions_index(connection):
+    indexes = await explain(connection, lambda session: SQLRoleRepository(session).get_by_permission(uuid.uuid4()))
+
+    assert "ix_roles_live_permissions" in indexes
+
+
+@pytest.mark.asyncio
+async def test_roles_by_any_permission_use_permissions_index(connection):
+    indexes = await explain(
+        connection,
+        lambda session: SQLRoleRepository(session).get_by_any_permission([uuid.uuid4(), uuid.uuid4()])
+    )
+
+    assert "ix_roles_live_permissions" in indexes
+
+
+@pytest.mark.asyncio
+async def test_roles_by_ids_use_primary_key(connection):
+    indexes = await explain(connection, lambda session: SQLRoleRepository(session).get_many([uuid.uuid4(), uuid.uuid4()]))
+
+    assert "roles_pkey" in indexes
+
+
+@pytest.mark.asyncio
+async def test_users_by_ids_use_primary_key(connection):
+    indexes = await explain(connection, lambda session: SQLUserRepository(session).get_many([1, 2, 3]))
+
+    assert indexes & {"users_pkey", "ix_users_id"}
+
+
+@pytest.mark.asyncio
+async def test_user_page_after_cursor_uses_primary_key(connection):
+    indexes = await explain(connection, lambda session: SQLUserRepository(session).get_page(51, 100))
+
+    # users also has a plain index on id next to its primary key
+    assert indexes & {"users_pkey", "ix_users_id"}
@@ -0,0 +1,98 @@
+"""
+Runs the purge job against a migrated PostgreSQL database. Rows are seeded
+with a deleted_at far in the past, so only they fall before the cutoff, and
+are removed again afterwards.
+
+Opt in with RUN_DB_TESTS=1.
+"""
+import uuid
+from datetime import datetime
+from typing import List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, insert, select
+
+from infrastructure.maintenance.soft_delete_purger import SoftDeletePurger
+from infrastructure.orm.archive_orm_model import CommentArchiveOrmModel, RoleArchiveORM
+from infrastructure.orm.comment_orm_model import CommentOrmModel
+from infrastructure.orm.role_orm_model import RoleORM
+from infrastructure.orm.user_orm_model import UserOrmModel
+
+DELETED_AT = datetime(2000, 1, 1)
+CUTOFF = datetime(2000, 1, 2)
+
+
+@pytest_asyncio.fixture
+async def marker(engine):
+    marker = f"purge test {uuid.uuid4()}"
+    yield marker
+    async with engine.begin() as connection:
+        await connection.execute(delete(CommentOrmModel).where(CommentOrmModel.description == marker))
+        await connection.execute(delete(CommentArchiveOrmModel).where(CommentArchiveOrmModel.description == marker))
+        await connection.execute(delete(RoleORM).where(RoleORM.name == marker))
+        await connection.execute(delete(RoleArchiveORM).where(RoleArchiveORM.name == marker))
+
+
+class RecordingSleep:
+    def __init__(self):
+        self.delays: List[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+@pytest.mark.asyncio
+async def test_purge_archives_expired_comments_in_batches(engine, marker):
+    # Arrange
+    async with engine.begin() as connection:
+        user_id = (await connection.execute(select(func.min(UserOrmModel.id)))).scalar()
+        if user_id is None:
+            pytest.skip("needs at least one user")
+        await connection.execute(insert(CommentOrmModel), [
+            {
+                "name": f"comment {i}", "description": marker, "user_id": user_id,
+                "is_deleted": i < 25, "deleted_at": DELETED_AT if i < 25 else None,
+            }
+            for i in range(30)
+        ])
+    sleep = RecordingSleep()
+    purger = SoftDeletePurger(engine, batch_size=10, rows_per_second=1_000_000, sleep=sleep, clock=lambda: 0.0)
+
+    # Act
+    result = await purger.purge("comments", CUTOFF)
+
+    # Assert
+    async with engine.connect() as connection:
+        remaining = (await connection.execute(
+            select(func.count()).where(CommentOrmModel.description == marker)
+        )).scalar()
+        archived = (await connection.execute(
+            select(func.count()).where(CommentArchiveOrmModel.description == marker)
+        )).scalar()
+    assert (result.purged, result.batches) == (25, 3)
+    assert (remaining, archived) == (5, 25)
+    assert sleep.delays == [0.00001, 0.00001]
+
+
+@pytest.mark.asyncio
+async def test_purge_hard_deletes_expired_roles(engine, marker):
+    # Arrange
+    async with engine.begin() as connection:
+        await connection.execute(insert(RoleORM), [
+            {"id": uuid.uuid4(), "name": marker, "permissions": [], "is_deleted": True, "deleted_at": DELETED_AT}
+            for _ in range(3)
+        ])
+    purger = SoftDeletePurger(engine, batch_size=10, rows_per_second=None, archive=False)
+
+    # Act
+    expected = await purger.count("roles", CUTOFF)
+    result = await purger.purge("roles", CUTOFF)
+
+    # Assert
+    async with engine.connect() as connection:
+        remaining = (await connection.execute(select(func.count()).where(RoleORM.name == marker))).scalar()
+        archived = (await connection.execute(select(func.count()).where(RoleArchiveORM.name == marker))).scalar()
+    assert expected >= 3
+    assert result.purged == expected
+    assert (remaining, archived) == (0, 0)
@@ -0,0 +1,157 @@
+import pytest
+from datetime import datetime, timedelta
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import HTTPException
+from jose import jwt
+
+from config import settings
+from domain.models.user import User
+from infrastructure.repositories.sql_auth_repository import SQLAuthRepository
+from utils.security import (
+    ACCESS_TOKEN_TYPE,
+    ALGORITHM,
+    REFRESH_TOKEN_TYPE,
+    SECRET_KEY,
+    create_access_token,
+    create_refresh_token,
+)
+
+
+def make_orm_user(is_deleted: bool = False) -> MagicMock:
+    orm_user = MagicMock(is_deleted=is_deleted)
+    orm_user.to_domain.return_value = User(
+        id=7, username="alice", email="alice@example.com", hashed_password="hashed"
+    )
+    return orm_user
+
+
+def make_session(orm_user: Optional[MagicMock]) -> MagicMock:
+    """A session whose every SELECT finds ``orm_user``."""
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = orm_user
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def refresh_token_for(user_id: int = 7, expires_delta: timedelta = timedelta(minutes=5)) -> str:
+    return create_refresh_token(user_id, 1, 1, expires_delta=expires_delta)
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_success():
+    # Arrange
+    session = make_session(make_orm_user())
+    repository = SQLAuthRepository(session)
+    refresh_token = refresh_token_for()
+
+    # Act
+    token = await repository.refresh_access_token(refresh_token)
+
+    # Assert
+    payload = jwt.decode(token.access_token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert payload["sub"] == "7"
+    assert payload["type"] == ACCESS_TOKEN_TYPE
+    assert "trusted" not in payload
+    assert token.refresh_token == refresh_token
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_rejects_access_token():
+    # Arrange
+    session = make_session(make_orm_user())
+    repository = SQLAuthRepository(session)
+    access_token = create_access_token(7, 1, 1, expires_delta=timedelta(minutes=5))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await repository.refresh_access_token(access_token)
+
+    # Assert
+    assert error.value.status_code == 403
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_rejects_untyped_token():
+    # Arrange
+    session = make_session(make_orm_user())
+    repository = SQLAuthRepository(session)
+    legacy_token = jwt.encode(
+        {"sub": "7", "exp": datetime.utcnow() + timedelta(minutes=5)}, SECRET_KEY, algorithm=ALGORITHM
+    )
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await repository.refresh_access_token(legacy_token)
+
+    # Assert
+    assert error.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_expired():
+    # Arrange
+    session = make_session(make_orm_user())
+    repository = SQLAuthRepository(session)
+    refresh_token = refresh_token_for(expires_delta=timedelta(minutes=-1))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await repository.refresh_access_token(refresh_token)
+
+    # Assert
+    assert error.value.status_code == 401
+    assert error.value.detail == "Token has expired"
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_missing_user():
+    # Arrange
+    repository = SQLAuthRepository(make_session(None))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await repository.refresh_access_token(refresh_token_for())
+
+    # Assert
+    assert error.value.status_code == 401
+    assert error.value.detail == "User not found"
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_deleted_user():
+    # Arrange
+    repository = SQLAuthRepository(make_session(make_orm_user(is_deleted=True)))
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        await repository.refresh_access_token(refresh_token_for())
+
+    # Assert
+    assert error.value.status_code == 401
+    assert error.value.detail == "User not found"
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_trusted_claims(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "TRUSTED_CLAIMS_TOKENS", True)
+    repository = SQLAuthRepository(make_session(make_orm_user()))
+
+    # Act
+    token = await repository.refresh_access_token(refresh_token_for())
+
+    # Assert
+    access = jwt.decode(token.access_token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert access["type"] == ACCESS_TOKEN_TYPE
+    assert access["trusted"] is True
+    assert access["username"] == "alice"
+    assert access["email"] == "alice@example.com"
+    assert access["permissions"] == []
+    refresh = jwt.decode(token.refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert refresh["sub"] == "7"
+    assert refresh["type"] == REFRESH_TOKEN_TYPE
@@ -0,0 +1,65 @@
+"""
+Runs the role repository against a migrated PostgreSQL database inside a
+transaction that is rolled back afterwards.
+
+Opt in with RUN_DB_TESTS=1.
+"""
+import uuid
+
+import pytest
+
+from application.dto.role_dto import RoleCreateDTO, RoleUpdateDTO
+from application.services.role_permission_resolver import RolePermissionResolver
+from application.use_cases.role_use_cases import RoleUseCases
+from domain.models.role import Role
+# Registers every mapped class, so mappers configure when this file runs alone
+import infrastructure.orm.comment_orm_model  # noqa: F401
+from infrastructure.repositories.sql_role_repository import SQLRoleRepository
+
+
+@pytest.mark.asyncio
+async def test_add_and_update_store_uuid_permissions(session):
+    # Arrange
+    repository = SQLRoleRepository(session)
+    read, write = uuid.uuid4(), uuid.uuid4()
+    role = await repository.add(Role(name=f"role {uuid.uuid4()}", permissions=[read]))
+
+    # Act
+    role.permissions = [read, write]
+    await repository.update(role)
+    stored = await repository.get_by_id(role.id)
+
+    # Assert
+    assert stored.permissions == [read, write]
+    assert [role.id for role in await repository.get_by_permission(write)] == [role.id]
+
+
+@pytest.mark.asyncio
+async def test_updating_permissions_reloads_the_resolver(session):
+    # Arrange
+    resolver = RolePermissionResolver()
+    role_use_cases = RoleUseCases(SQLRoleRepository(session), resolver)
+    read, write = uuid.uuid4(), uuid.uuid4()
+    role = await role_use_cases.create_role(RoleCreateDTO(name=f"role {uuid.uuid4()}", permissions=[read]))
+
+    # Act
+    updated = await role_use_cases.update_role(role.id, RoleUpdateDTO(permissions=[write]))
+
+    # Assert
+    assert updated.permissions == [write]
+    assert resolver.has_permission(role.id, write)
+    assert not resolver.has_permission(role.id, read)
+
+
+@pytest.mark.asyncio
+async def test_update_of_deleted_role_returns_none(session):
+    # Arrange
+    repository = SQLRoleRepository(session)
+    role = await repository.add(Role(name=f"role {uuid.uuid4()}", permissions=[]))
+    await repository.delete(role.id)
+
+    # Act
+    result = await repository.update(role)
+
+    # Assert
+    assert result is None
@@ -0,0 +1,73 @@
+from utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    # Arrange
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set(1, "user 1")
+
+    # Act
+    hit = cache.get(1)
+    miss = cache.get(2)
+
+    # Assert
+    assert hit == "user 1"
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_entries_expire_after_ttl():
+    # Arrange
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+    cache.set(1, "user 1")
+
+    # Act
+    clock.now = 59
+    before_expiry = cache.get(1)
+    clock.now = 60
+    after_expiry = cache.get(1)
+
+    # Assert
+    assert before_expiry == "user 1"
+    assert after_expiry is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "user 1")
+    cache.set(2, "user 2")
+    cache.get(1)
+
+    # Act
+    cache.set(3, "user 3")
+
+    # Assert
+    assert cache.get(1) == "user 1"
+    assert cache.get(2) is None
+    assert cache.get(3) == "user 3"
+
+
+def test_invalidate_removes_entry():
+    # Arrange
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set(1, "user 1")
+
+    # Act
+    cache.invalidate(1)
+    cache.invalidate(2)
+
+    # Assert
+    assert cache.get(1) is None
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from utils.data_loader import DataLoader
+
+
+class Source:
+    """Batch function that records the keys of every call."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: List[List[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: List[int]) -> Dict[int, str]:
+        self.calls.append(keys)
+        if self.fail:
+            raise RuntimeError("database is down")
+        await asyncio.sleep(0)
+        return {key: f"value {key}" for key in keys if key > 0}
+
+
+@pytest.mark.asyncio
+async def test_loads_in_the_same_turn_share_one_batch():
+    # Arrange
+    source = Source()
+    loader = DataLoader(source)
+
+    async def nested(key: int) -> str:
+        return await loader.load(key)
+
+    # Act
+    values = await asyncio.gather(loader.load(1), nested(2), loader.load(1), loader.load(-1))
+
+    # Assert
+    assert values == ["value 1", "value 2", "value 1", None]
+    assert source.calls == [[1, 2, -1]]
+
+
+@pytest.mark.asyncio
+async def test_results_and_misses_are_memoized():
+    # Arrange
+    source = Source()
+    loader = DataLoader(source)
+    await loader.load_many([1, -1])
+
+    # Act
+    values = await loader.load_many([-1, 1, 3])
+
+    # Assert
+    assert values == [None, "value 1", "value 3"]
+    assert source.calls == [[1, -1], [3]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_the_queue():
+    # Arrange
+    source = Source()
+    loader = DataLoader(source, max_batch_size=2)
+
+    # Act
+    await loader.load_many([1, 2, 3])
+
+    # Assert
+    assert source.calls == [[1, 2], [3]]
+    assert loader.batches == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_not_memoized():
+    # Arrange
+    source = Source(fail=True)
+    loader = DataLoader(source)
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+    source.fail = False
+
+    # Act
+    value = await loader.load(1)
+
+    # Assert
+    assert value == "value 1"
+    assert source.calls == [[1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_loaders_sharing_a_lock_never_overlap():
+    # Arrange
+    running = 0
+    overlapped = False
+
+    async def batch_load(keys: List[int]) -> Dict[int, int]:
+        nonlocal running, overlapped
+        running += 1
+        overlapped = overlapped or running > 1
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {key: key for key in keys}
+
+    lock = asyncio.Lock()
+    users, roles = DataLoader(batch_load, lock=lock), DataLoader(batch_load, lock=lock)
+
+    # Act
+    await asyncio.gather(users.load(1), roles.load(2))
+
+    # Assert
+    assert not overlapped
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from utils.etag import etag_matches, make_etag
+
+
+def test_etag_changes_with_version_and_parameters():
+    # Arrange
+    version = (datetime(2026, 1, 1), 10)
+
+    # Act
+    etag = make_etag(*version, 50, None)
+
+    # Assert
+    assert etag == make_etag(*version, 50, None)
+    assert etag != make_etag(datetime(2026, 1, 2), 10, 50, None)
+    assert etag != make_etag(datetime(2026, 1, 1), 9, 50, None)
+    assert etag != make_etag(*version, 50, "cursor")
+
+
+def test_etag_matches_if_none_match_header():
+    # Arrange
+    etag = make_etag(datetime(2026, 1, 1), 10)
+
+    # Act / Assert
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,45 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip():
+    # Arrange
+    password_hasher = PasswordHasher(ThreadPoolExecutor(max_workers=1), max_concurrency=1)
+
+    # Act
+    hashed_password = await password_hasher.hash("password123")
+
+    # Assert
+    assert hashed_password != "password123"
+    assert await password_hasher.verify("password123", hashed_password) is True
+    assert await password_hasher.verify("wrong", hashed_password) is False
+    assert password_hasher.stats()["completed"] == 3
+    password_hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_queues_extra_calls():
+    # Arrange
+    password_hasher = PasswordHasher(ThreadPoolExecutor(max_workers=4), max_concurrency=1)
+
+    # Act
+    tasks = [asyncio.create_task(password_hasher.hash(f"password{i}")) for i in range(3)]
+    await asyncio.sleep(0.05)
+    stats = password_hasher.stats()
+    await asyncio.gather(*tasks)
+
+    # Assert
+    assert stats["in_flight"] == 1
+    assert stats["queue_depth"] == 2
+    assert password_hasher.stats() == {
+        "max_concurrency": 1,
+        "queue_depth": 0,
+        "in_flight": 0,
+        "completed": 3,
+    }
+    password_hasher.shutdown()
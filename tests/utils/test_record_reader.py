@@ -0,0 +1,59 @@
+from typing import AsyncIterator, List
+
+import pytest
+
+from utils.record_reader import iter_lines, read_records
+
+
+async def chunks(data: bytes, size: int = 5) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def collect(data: bytes, format: str) -> List:
+    return [record async for record in read_records(iter_lines(chunks(data)), format)]
+
+
+@pytest.mark.asyncio
+async def test_read_csv_records_across_chunks_and_quoted_newlines():
+    # Arrange
+    data = '﻿username,email,password\r\nann,ann@example.com,"a,b"\r\nbob,bob@example.com,"two\nlines ""quoted"""\n'
+
+    # Act
+    records = await collect(data.encode(), "csv")
+
+    # Assert
+    assert records == [
+        (2, {"username": "ann", "email": "ann@example.com", "password": "a,b"}),
+        (3, {"username": "bob", "email": "bob@example.com", "password": 'two\nlines "quoted"'}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_csv_reports_rows_with_wrong_field_count():
+    # Arrange
+    data = b"username,email,password\nann\n\nbob,bob@example.com,secret"
+
+    # Act
+    records = await collect(data, "csv")
+
+    # Assert
+    assert records == [
+        (2, "expected 3 fields, got 1"),
+        (4, {"username": "bob", "email": "bob@example.com", "password": "secret"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_ndjson_reports_malformed_lines_and_continues():
+    # Arrange
+    data = b'{"username": "ann"}\nnot json\n[1]\n\n{"username": "bob"}'
+
+    # Act
+    records = await collect(data, "ndjson")
+
+    # Assert
+    assert records[0] == (1, {"username": "ann"})
+    assert records[1][0] == 2 and records[1][1].startswith("invalid JSON")
+    assert records[2] == (3, "expected a JSON object")
+    assert records[3] == (5, {"username": "bob"})
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+class Query:
+    """Slow call that counts how often it runs."""
+
+    def __init__(self, result="row", error=None):
+        self.runs = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.runs += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_for_one_key_share_a_single_run():
+    # Arrange
+    flights = SingleFlight()
+    query, other = Query("row"), Query("other row")
+    tasks = [asyncio.create_task(flights.do(1, query)) for _ in range(5)]
+    tasks.append(asyncio.create_task(flights.do(2, other)))
+    await asyncio.sleep(0)
+
+    # Act
+    query.release.set()
+    other.release.set()
+    results = await asyncio.gather(*tasks)
+
+    # Assert
+    assert results == ["row"] * 5 + ["other row"]
+    assert (query.runs, other.runs) == (1, 1)
+    assert (flights.calls, flights.shared) == (2, 4)
+
+
+@pytest.mark.asyncio
+async def test_results_are_not_kept_after_the_flight():
+    # Arrange
+    flights = SingleFlight()
+    query = Query()
+    query.release.set()
+    await flights.do(1, query)
+
+    # Act
+    await flights.do(1, query)
+
+    # Assert
+    assert query.runs == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_of_the_flight():
+    # Arrange
+    flights = SingleFlight()
+    query = Query(error=RuntimeError("connection lost"))
+    tasks = [asyncio.create_task(flights.do(1, query)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    # Act
+    query.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert query.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_waiting_callers_take_over_when_the_runner_is_cancelled():
+    # Arrange
+    flights = SingleFlight()
+    query = Query()
+    runner = asyncio.create_task(flights.do(1, query))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.do(1, query))
+    await asyncio.sleep(0)
+
+    # Act
+    runner.cancel()
+    await asyncio.sleep(0)
+    query.release.set()
+    result = await waiter
+
+    # Assert
+    assert runner.cancelled()
+    assert result == "row"
+    assert query.runs == 2